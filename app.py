@@ -17,16 +17,25 @@ Open config.py and change the DATA_SOURCE variable to either:
 - "snowflake"
 """
 
+import importlib
+
 import streamlit as st
-from config import APP_CONFIG, DATA_SOURCE
-from styles import load_custom_fonts, apply_light_theme, apply_custom_styles
-from data_connection import get_data_source_name
+from config import APP_CONFIG
+from styles import apply_theme, mark_page
 from sidebar import render_sidebar
-from dashboard import render_dashboard
-from performance_data import render_performance_data
-from upload_keyword import render_upload_keyword
-from model_run_results import render_model_run_results
-from help import render_help
+
+# Page name -> (module, render function)
+# Page modules (and the plotting, data and component packages they use) are
+# only imported when the page is first opened, which keeps cold start fast.
+PAGE_RENDERERS = {
+    "Dashboard": ("dashboard", "render_dashboard"),
+    "Performance Data": ("performance_data", "render_performance_data"),
+    "Upload Keyword": ("upload_keyword", "render_upload_keyword"),
+    "Model Run Results": ("model_run_results", "render_model_run_results"),
+    "Help": ("help", "render_help")
+}
+
+DEFAULT_PAGE = "Dashboard"
 
 
 def configure_page():
@@ -48,11 +57,9 @@ def initialize_app_styles():
     """
     Initialize all visual styling for the app.
     
-    This loads custom fonts and applies the light theme.
+    This applies the app's stylesheet (fonts, light theme and page styles).
     """
-    load_custom_fonts()
-    apply_light_theme()
-    apply_custom_styles()
+    apply_theme(APP_CONFIG.get("theme", "light"))
 
 
 def render_sidebar_content():
@@ -64,28 +71,33 @@ def render_sidebar_content():
         render_sidebar()
 
 
+def get_page_renderer(page):
+    """
+    Get the render function of a page, importing its module on first use.
+    
+    Args:
+        page (str): Page name (unknown pages fall back to the Dashboard)
+    
+    Returns:
+        callable: The page's render function
+    """
+    module_name, function_name = PAGE_RENDERERS.get(page, PAGE_RENDERERS[DEFAULT_PAGE])
+    return getattr(importlib.import_module(module_name), function_name)
+
+
 def render_main_content():
     """
     Render the main content area of the dashboard.
     Displays the content for the currently selected page.
     """
     # Get the selected page from session state
-    selected_page = st.session_state.get('selected_page', 'Dashboard')
+    selected_page = st.session_state.get('selected_page', DEFAULT_PAGE)
+    if selected_page not in PAGE_RENDERERS:
+        selected_page = DEFAULT_PAGE
     
-    # Render the appropriate page content
-    if selected_page == 'Dashboard':
-        render_dashboard()
-    elif selected_page == 'Performance Data':
-        render_performance_data()
-    elif selected_page == 'Upload Keyword':
-        render_upload_keyword()
-    elif selected_page == 'Model Run Results':
-        render_model_run_results()
-    elif selected_page == 'Help':
-        render_help()
-    else:
-        # Default to Dashboard if unknown page
-        render_dashboard()
+    # Activate the page's styles and render its content
+    mark_page(selected_page)
+    get_page_renderer(selected_page)()
 
 
 def main():
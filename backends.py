@@ -0,0 +1,562 @@
+"""
+Backends Module
+---------------
+This module implements the data sources behind data_connection.py:
+Databricks, Snowflake and an embedded DuckDB engine for offline runs.
+
+Every backend provides the same functions (see BACKENDS):
+
+- connect(profile): open a connection for a warehouse profile (None if not configured)
+- execute(connection, query): run a query and return its cursor
+- fetch_arrow(cursor): all results as a pyarrow Table
+- fetch_batches(cursor, batch_size): results as pyarrow Tables, batch by batch
+- list_tables_query(): SQL listing the available tables
+- qualify_table(table=None): fully qualified table name (default: the performance table)
+- quote_ident(name): quote a column or table identifier
+- quote_literal(value): quote a string literal
+- table_version_query(): SQL returning the latest version of the performance
+  table as "version" (None if the backend has no table versions)
+- table_changes_query(start, end): SQL returning the rows changed in
+  versions start..end, in change data feed format (_change_type,
+  _commit_version); None if the backend has no change feed
+
+The DuckDB backend runs in-process. On first use it loads the Parquet files
+of DUCKDB_CONFIG["data_path"], or generates a synthetic dataset (see
+synthetic_data.py), so the app and its benchmarks work without a network.
+Its performance table has a simulated change feed: commit_duckdb_changes
+applies changes as a new table version and records them like Delta's change
+data feed, so incremental syncs (see table_sync.py) can be tested offline.
+"""
+
+import os
+import threading
+
+import streamlit as st
+from config import DATA_SOURCE, DATABRICKS_CONFIG, SNOWFLAKE_CONFIG, DUCKDB_CONFIG
+
+# Snowflake connector module (None = snowflake.connector, see set_snowflake_connector)
+_snowflake_connector = None
+
+# Shared in-process DuckDB database (pooled connections are cursors on it)
+_duckdb_database = None
+_duckdb_lock = threading.Lock()
+
+
+def get_backend(name=None):
+    """
+    Get the functions of a backend.
+
+    Args:
+        name (str): "databricks", "snowflake" or "duckdb" (default: DATA_SOURCE)
+
+    Returns:
+        dict: Backend functions, "name" (display name) and "config"
+
+    Raises:
+        ValueError: If the backend does not exist
+    """
+    name = (name or DATA_SOURCE).lower()
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Invalid DATA_SOURCE: {name}. "
+            "Must be 'databricks', 'snowflake' or 'duckdb'"
+        )
+    return BACKENDS[name]
+
+
+def get_secret(section, key):
+    """
+    Get a value from .streamlit/secrets.toml.
+
+    Args:
+        section (str): Secrets section, e.g. "databricks"
+        key (str): Key within the section
+
+    Returns:
+        str: The value (None if missing or there is no secrets file)
+    """
+    try:
+        return st.secrets.get(section, {}).get(key)
+    except Exception:
+        return None
+
+
+def quote_backtick_ident(name):
+    """Quote an identifier with backticks (Databricks)."""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def quote_double_ident(name):
+    """Quote an identifier with double quotes (Snowflake, DuckDB)."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def quote_escaped_literal(value):
+    """Quote a string literal, escaping backslashes and quotes (Databricks, Snowflake)."""
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def quote_standard_literal(value):
+    """Quote a string literal, doubling quotes only (DuckDB)."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def execute_cursor(connection, query):
+    """Run a query on a new cursor of a DB-API connection and return the cursor."""
+    cursor = connection.cursor()
+    cursor.execute(query)
+    return cursor
+
+
+# =============================================================================
+# DATABRICKS
+# =============================================================================
+
+def connect_databricks(profile):
+    """
+    Initialize connection to Databricks.
+
+    Args:
+        profile (dict): Warehouse profile (see data_connection.get_warehouse_profile)
+
+    Returns:
+        connection: Databricks connection object (or None if not configured)
+    """
+    try:
+        from databricks import sql
+
+        # Check if required config is available
+        # Priority: environment variables > secrets.toml > config.py
+        host = os.getenv("DATABRICKS_HOST") or get_secret("databricks", "host") or DATABRICKS_CONFIG.get("host")
+        http_path = (
+            profile.get("http_path")
+            or os.getenv("DATABRICKS_HTTP_PATH") or get_secret("databricks", "http_path") or DATABRICKS_CONFIG.get("http_path")
+        )
+        token = os.getenv("DATABRICKS_TOKEN") or get_secret("databricks", "token") or DATABRICKS_CONFIG.get("token")
+
+        if not all([host, http_path, token]):
+            st.warning("Databricks configuration incomplete. Please set host, http_path, and token in config.py or environment variables.")
+            return None
+
+        # Create connection
+        connection = sql.connect(
+            server_hostname=host,
+            http_path=http_path,
+            access_token=token
+        )
+
+        return connection
+
+    except ImportError:
+        st.error("databricks-sql-connector not installed. Please run: pip install databricks-sql-connector")
+        return None
+    except Exception as e:
+        st.error(f"Failed to connect to Databricks: {str(e)}")
+        return None
+
+
+def fetch_databricks_batches(cursor, batch_size):
+    """Yield Databricks results as Arrow batches."""
+    while True:
+        batch = cursor.fetchmany_arrow(batch_size)
+        if batch.num_rows == 0:
+            break
+        yield batch
+
+
+def list_databricks_tables_query():
+    """SQL listing the tables of the configured catalog and schema."""
+    catalog = DATABRICKS_CONFIG.get("catalog", "")
+    schema = DATABRICKS_CONFIG.get("schema", "")
+
+    if catalog and schema:
+        return f"SHOW TABLES IN {catalog}.{schema}"
+    return "SHOW TABLES"
+
+
+def qualify_databricks_table(table=None):
+    """Fully qualified Databricks table name ("catalog.schema.table")."""
+    if table is None:
+        table = DATABRICKS_CONFIG.get("table_name") or "your_table_name"
+        catalog = DATABRICKS_CONFIG.get("catalog", "default")
+        schema = DATABRICKS_CONFIG.get("schema", "bid_sample")
+    else:
+        catalog = DATABRICKS_CONFIG.get("catalog", "")
+        schema = DATABRICKS_CONFIG.get("schema", "")
+
+    if catalog and schema:
+        return f"{catalog}.{schema}.{table}"
+    return table
+
+
+def databricks_table_version_query():
+    """SQL returning the latest Delta version of the performance table."""
+    return f"DESCRIBE HISTORY {qualify_databricks_table()} LIMIT 1"
+
+
+def databricks_table_changes_query(start_version, end_version):
+    """SQL reading the Delta change data feed of the performance table."""
+    table = quote_escaped_literal(qualify_databricks_table())
+    return f"SELECT * FROM table_changes({table}, {int(start_version)}, {int(end_version)})"
+
+
+# =============================================================================
+# SNOWFLAKE
+# =============================================================================
+
+def get_snowflake_setting(key):
+    """Snowflake setting from environment variables > secrets.toml > config.py."""
+    return os.getenv(f"SNOWFLAKE_{key.upper()}") or get_secret("snowflake", key) or SNOWFLAKE_CONFIG.get(key)
+
+
+def connect_snowflake(profile):
+    """
+    Initialize connection to Snowflake.
+
+    The session is kept alive (client_session_keep_alive), so pooled
+    connections stay usable between queries.
+
+    Args:
+        profile (dict): Warehouse profile (see data_connection.get_warehouse_profile)
+
+    Returns:
+        connection: Snowflake connection object (or None if not configured)
+    """
+    try:
+        connector = get_snowflake_connector()
+
+        # Priority: environment variables > secrets.toml > config.py
+        settings = {
+            key: get_snowflake_setting(key)
+            for key in ("account", "user", "password", "warehouse", "database", "schema", "role")
+        }
+        settings["warehouse"] = profile.get("snowflake_warehouse") or settings["warehouse"]
+
+        if not all([settings["account"], settings["user"], settings["password"]]):
+            st.warning("Snowflake configuration incomplete. Please set account, user, and password in config.py or environment variables.")
+            return None
+
+        # Create connection (empty optional settings are left to the user's defaults)
+        connection = connector.connect(
+            **{key: value for key, value in settings.items() if value},
+            client_session_keep_alive=True,
+            application="retail_media_dashboard"
+        )
+
+        return connection
+
+    except ImportError:
+        st.error("snowflake-connector-python not installed. Please run: pip install \"snowflake-connector-python[pandas]\"")
+        return None
+    except Exception as e:
+        st.error(f"Failed to connect to Snowflake: {str(e)}")
+        return None
+
+
+def get_snowflake_connector():
+    """
+    Returns the Snowflake connector module.
+
+    Returns:
+        module: snowflake.connector, or the module set with set_snowflake_connector
+
+    Raises:
+        ImportError: If snowflake-connector-python is not installed
+    """
+    if _snowflake_connector is not None:
+        return _snowflake_connector
+
+    import snowflake.connector
+    return snowflake.connector
+
+
+def set_snowflake_connector(connector):
+    """
+    Replace the Snowflake connector module, e.g. with a local mock to run offline.
+
+    Args:
+        connector (module): Object providing connect(**kwargs) (None restores the real one)
+    """
+    global _snowflake_connector
+    _snowflake_connector = connector
+
+
+def fetch_snowflake_arrow(cursor):
+    """Fetch all Snowflake results as one Arrow table."""
+    import pyarrow as pa
+
+    table = cursor.fetch_arrow_all()
+    if table is None:
+        # No batches - keep the column names
+        return pa.table({desc[0]: pa.array([], pa.null()) for desc in cursor.description or []})
+    return table
+
+
+def fetch_snowflake_batches(cursor, batch_size):
+    """Yield Snowflake results as Arrow batches (batch sizes are chosen by Snowflake)."""
+    yield from cursor.fetch_arrow_batches()
+
+
+def qualify_snowflake_table(table=None):
+    """Fully qualified Snowflake table name ("database.schema.table")."""
+    table = table or get_snowflake_setting("table_name") or DATABRICKS_CONFIG.get("table_name") or "your_table_name"
+    parts = [get_snowflake_setting("database"), get_snowflake_setting("schema"), table]
+    return ".".join(part for part in parts if part)
+
+
+# =============================================================================
+# DUCKDB
+# =============================================================================
+
+def connect_duckdb(profile):
+    """
+    Open a connection to the embedded DuckDB database.
+
+    All connections share one in-process database, loaded on first use.
+
+    Args:
+        profile (dict): Warehouse profile (unused - there is one local engine)
+
+    Returns:
+        connection: DuckDB cursor on the shared database (or None if duckdb is missing)
+    """
+    try:
+        return get_duckdb_database().cursor()
+    except ImportError:
+        st.error("duckdb not installed. Please run: pip install duckdb")
+        return None
+
+
+def get_duckdb_database():
+    """
+    Get the shared DuckDB database, creating and loading it on first use.
+
+    Returns:
+        duckdb.DuckDBPyConnection: Database connection
+
+    Raises:
+        ImportError: If duckdb is not installed
+    """
+    global _duckdb_database
+
+    with _duckdb_lock:
+        if _duckdb_database is None:
+            import duckdb
+
+            database = duckdb.connect(os.getenv("DUCKDB_DATABASE") or DUCKDB_CONFIG.get("database", ":memory:"))
+            load_duckdb_dataset(database)
+            create_duckdb_change_feed(database)
+            _duckdb_database = database
+        return _duckdb_database
+
+
+def load_duckdb_dataset(database):
+    """
+    Create the performance table in DuckDB if it does not exist yet.
+
+    Reads DUCKDB_CONFIG["data_path"] (Parquet) when set, otherwise generates
+    a synthetic dataset of DUCKDB_CONFIG["synthetic_rows"] rows.
+
+    Args:
+        database (duckdb.DuckDBPyConnection): Database to load
+    """
+    schema = DUCKDB_CONFIG.get("schema", "bid_sample")
+    table = qualify_duckdb_table()
+    database.execute(f"CREATE SCHEMA IF NOT EXISTS {quote_double_ident(schema)}")
+
+    exists = database.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = ? AND table_name = ?",
+        [schema, DUCKDB_CONFIG.get("table_name", "performance")]
+    ).fetchone()[0]
+    if exists:
+        return
+
+    data_path = os.getenv("DUCKDB_DATA_PATH") or DUCKDB_CONFIG.get("data_path")
+    if data_path:
+        database.execute(f"CREATE VIEW {table} AS SELECT * FROM read_parquet({quote_standard_literal(data_path)})")
+    else:
+        from synthetic_data import generate_performance_data
+
+        synthetic = generate_performance_data(rows=int(DUCKDB_CONFIG.get("synthetic_rows", 100_000)))
+        database.register("synthetic_performance", synthetic)
+        database.execute(f"CREATE TABLE {table} AS SELECT * FROM synthetic_performance")
+        database.unregister("synthetic_performance")
+
+
+def get_duckdb_change_feed_table():
+    """Fully qualified name of the simulated change feed of the performance table."""
+    return qualify_duckdb_table(DUCKDB_CONFIG.get("table_name", "performance") + "_changes")
+
+
+def create_duckdb_change_feed(database):
+    """
+    Create the (empty) change feed of the performance table if it does not exist yet.
+
+    Args:
+        database (duckdb.DuckDBPyConnection): Database to create it in
+    """
+    database.execute(
+        f"CREATE TABLE IF NOT EXISTS {get_duckdb_change_feed_table()} AS "
+        "SELECT *, NULL::VARCHAR AS _change_type, NULL::BIGINT AS _commit_version, "
+        f"NULL::TIMESTAMP AS _commit_timestamp FROM {qualify_duckdb_table()} LIMIT 0"
+    )
+
+
+def commit_duckdb_changes(keys, upserts=None, deletes=None):
+    """
+    Apply changes to the DuckDB performance table as one new table version.
+
+    Simulates a Delta table with change data feed enabled: rows of upserts
+    replace the rows with the same keys (recorded as update_preimage and
+    update_postimage) or are added (insert); rows matching the keys of
+    deletes are removed (delete). Requires the generated (in-memory) table,
+    not a view over DUCKDB_CONFIG["data_path"].
+
+    Args:
+        keys (list): Columns identifying a row
+        upserts (DataFrame): Rows to insert or update (all table columns)
+        deletes (DataFrame): Keys of the rows to delete
+
+    Returns:
+        int: The new table version
+    """
+    table = qualify_duckdb_table()
+    feed = get_duckdb_change_feed_table()
+    connection = get_duckdb_database().cursor()
+
+    def matches(alias):
+        return " AND ".join(f"t.{quote_double_ident(k)} = {alias}.{quote_double_ident(k)}" for k in keys)
+
+    try:
+        connection.execute("BEGIN TRANSACTION")
+        version = connection.execute(
+            f"SELECT COALESCE(MAX(_commit_version), 0) + 1 FROM {feed}"
+        ).fetchone()[0]
+        change = f"{int(version)} AS _commit_version, now()::TIMESTAMP AS _commit_timestamp"
+
+        if deletes is not None and len(deletes):
+            connection.register("commit_deletes", deletes[keys])
+            connection.execute(
+                f"INSERT INTO {feed} BY NAME SELECT t.*, 'delete' AS _change_type, {change} "
+                f"FROM {table} t WHERE EXISTS (SELECT 1 FROM commit_deletes d WHERE {matches('d')})"
+            )
+            connection.execute(f"DELETE FROM {table} t USING commit_deletes d WHERE {matches('d')}")
+
+        if upserts is not None and len(upserts):
+            connection.register("commit_upserts", upserts)
+            updated = f"EXISTS (SELECT 1 FROM {table} t WHERE {matches('u')})"
+            connection.execute(
+                f"INSERT INTO {feed} BY NAME SELECT t.*, 'update_preimage' AS _change_type, {change} "
+                f"FROM {table} t WHERE EXISTS (SELECT 1 FROM commit_upserts u WHERE {matches('u')})"
+            )
+            connection.execute(
+                f"INSERT INTO {feed} BY NAME SELECT u.*, "
+                f"CASE WHEN {updated} THEN 'update_postimage' ELSE 'insert' END AS _change_type, {change} "
+                "FROM commit_upserts u"
+            )
+            connection.execute(f"DELETE FROM {table} t USING commit_upserts u WHERE {matches('u')}")
+            connection.execute(f"INSERT INTO {table} BY NAME SELECT * FROM commit_upserts")
+
+        connection.execute("COMMIT")
+        return int(version)
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    finally:
+        connection.close()
+
+
+def duckdb_table_version_query():
+    """SQL returning the latest simulated version of the performance table."""
+    return f"SELECT COALESCE(MAX(_commit_version), 0) AS version FROM {get_duckdb_change_feed_table()}"
+
+
+def duckdb_table_changes_query(start_version, end_version):
+    """SQL reading the simulated change feed of the performance table."""
+    return (
+        f"SELECT * FROM {get_duckdb_change_feed_table()} "
+        f"WHERE _commit_version BETWEEN {int(start_version)} AND {int(end_version)}"
+    )
+
+
+def fetch_duckdb_arrow(cursor):
+    """Fetch all DuckDB results as one Arrow table."""
+    if hasattr(cursor, "to_arrow_table"):
+        return cursor.to_arrow_table()
+    return cursor.fetch_arrow_table()
+
+
+def fetch_duckdb_batches(cursor, batch_size):
+    """Yield DuckDB results as Arrow batches."""
+    import pyarrow as pa
+
+    if hasattr(cursor, "to_arrow_reader"):
+        reader = cursor.to_arrow_reader(batch_size)
+    else:
+        reader = cursor.fetch_record_batch(batch_size)
+
+    for batch in reader:
+        yield pa.Table.from_batches([batch])
+
+
+def list_duckdb_tables_query():
+    """SQL listing the tables of the DuckDB schema."""
+    schema = DUCKDB_CONFIG.get("schema", "bid_sample")
+    return (
+        "SELECT table_name AS tableName FROM information_schema.tables "
+        f"WHERE table_schema = {quote_standard_literal(schema)} ORDER BY table_name"
+    )
+
+
+def qualify_duckdb_table(table=None):
+    """Fully qualified DuckDB table name ("schema"."table")."""
+    schema = DUCKDB_CONFIG.get("schema", "bid_sample")
+    table = table or DUCKDB_CONFIG.get("table_name", "performance")
+    return f"{quote_double_ident(schema)}.{quote_double_ident(table)}"
+
+
+# Backend name -> functions (see the module docstring)
+BACKENDS = {
+    "databricks": {
+        "name": "Databricks",
+        "config": DATABRICKS_CONFIG,
+        "connect": connect_databricks,
+        "execute": execute_cursor,
+        "fetch_arrow": lambda cursor: cursor.fetchall_arrow(),
+        "fetch_batches": fetch_databricks_batches,
+        "list_tables_query": list_databricks_tables_query,
+        "qualify_table": qualify_databricks_table,
+        "quote_ident": quote_backtick_ident,
+        "quote_literal": quote_escaped_literal,
+        "table_version_query": databricks_table_version_query,
+        "table_changes_query": databricks_table_changes_query
+    },
+    "snowflake": {
+        "name": "Snowflake",
+        "config": SNOWFLAKE_CONFIG,
+        "connect": connect_snowflake,
+        "execute": execute_cursor,
+        "fetch_arrow": fetch_snowflake_arrow,
+        "fetch_batches": fetch_snowflake_batches,
+        "list_tables_query": lambda: "SHOW TABLES",
+        "qualify_table": qualify_snowflake_table,
+        "quote_ident": quote_double_ident,
+        "quote_literal": quote_escaped_literal,
+        "table_version_query": None,
+        "table_changes_query": None
+    },
+    "duckdb": {
+        "name": "DuckDB",
+        "config": DUCKDB_CONFIG,
+        "connect": connect_duckdb,
+        "execute": execute_cursor,
+        "fetch_arrow": fetch_duckdb_arrow,
+        "fetch_batches": fetch_duckdb_batches,
+        "list_tables_query": list_duckdb_tables_query,
+        "qualify_table": qualify_duckdb_table,
+        "quote_ident": quote_double_ident,
+        "quote_literal": quote_standard_literal,
+        "table_version_query": duckdb_table_version_query,
+        "table_changes_query": duckdb_table_changes_query
+    }
+}
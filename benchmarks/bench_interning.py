@@ -0,0 +1,154 @@
+"""
+Interning Memory Benchmark
+--------------------------
+Compares the memory of name columns stored as Python strings, as
+categoricals and as interned int32 IDs (see interning.py) in two shapes:
+
+- a realistic million-row week set with keyword, campaign and retailer
+  names (the row-level query results of the Performance Data page);
+- the per-keyword week totals the top movers panels keep in the dataset
+  registry (one row per keyword, one frame per retailer and week).
+
+Interned sizes include the dictionaries, counted once. Both shapes use the
+same name columns and the same dictionaries, so their figures are comparable.
+
+Usage:
+    python benchmarks/bench_interning.py [--rows 1000000] [--keywords 50000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interning import decode_frame, decode_ids, encode_frame, intern_values
+
+# Column name -> interning dimension
+NAME_COLUMNS = {"keyword": "keyword", "campaign_name": "campaign", "retailer": "retailer"}
+
+# Retailers and weeks of week totals held at once
+RETAILERS = 4
+WEEKS = 8
+
+
+def build_week_set(rows, keywords, campaigns, seed=0):
+    """
+    Build a synthetic week of keyword performance rows.
+
+    Args:
+        rows (int): Number of rows
+        keywords (int): Number of distinct keywords
+        campaigns (int): Number of distinct campaigns
+        seed (int): Random seed
+
+    Returns:
+        DataFrame: Rows with object string name columns and numeric metrics
+    """
+    rng = np.random.default_rng(seed)
+    keyword_names = np.array([f"keyword {i} crisps snacks" for i in range(keywords)], dtype=object)
+    campaign_names = np.array([f"Campaign {i} - Always On" for i in range(campaigns)], dtype=object)
+    retailer_names = np.array(["Tesco", "Sainsbury's", "Asda", "Morrisons"], dtype=object)
+
+    return pd.DataFrame({
+        "keyword": keyword_names[rng.integers(0, keywords, rows)],
+        "campaign_name": campaign_names[rng.integers(0, campaigns, rows)],
+        "retailer": retailer_names[rng.integers(0, len(retailer_names), rows)],
+        "impressions": rng.integers(0, 50_000, rows),
+        "clicks": rng.integers(0, 500, rows),
+        "spend": rng.random(rows) * 100,
+        "sales_value": rng.random(rows) * 300
+    })
+
+
+def build_week_totals(keywords, seed=0):
+    """
+    Build per-keyword week totals as the top movers panels cache them.
+
+    Args:
+        keywords (int): Number of distinct keywords
+        seed (int): Random seed
+
+    Returns:
+        list: One frame per retailer and week, each with one row per active keyword
+    """
+    rng = np.random.default_rng(seed)
+    keyword_names = np.array([f"keyword {i} crisps snacks" for i in range(keywords)], dtype=object)
+
+    frames = []
+    for _ in range(RETAILERS * WEEKS):
+        active = keyword_names[rng.random(keywords) < 0.8]
+        frames.append(pd.DataFrame({
+            "keyword": active,
+            "spend": rng.random(len(active)) * 100,
+            "prev_spend": rng.random(len(active)) * 100
+        }))
+    return frames
+
+
+def memory_mb(df):
+    """Deep memory usage of a frame in MB."""
+    return df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def dictionary_mb(values):
+    """Memory of the distinct strings of an interning dictionary in MB (counted once)."""
+    return pd.Series(pd.unique(values), dtype=object).memory_usage(deep=True) / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory of string, categorical and interned name columns.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--keywords", type=int, default=50_000)
+    parser.add_argument("--campaigns", type=int, default=500)
+    args = parser.parse_args()
+
+    # Row-level week set
+    strings = build_week_set(args.rows, args.keywords, args.campaigns)
+    categorical = strings.astype({column: "category" for column in NAME_COLUMNS})
+
+    start = time.perf_counter()
+    interned = encode_frame(strings, NAME_COLUMNS)
+    row_encode_seconds = time.perf_counter() - start
+    dictionaries = sum(dictionary_mb(strings[column]) for column in NAME_COLUMNS)
+
+    start = time.perf_counter()
+    decode_frame(interned.head(1_000), NAME_COLUMNS)
+    row_decode_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Week set - rows: {args.rows:,}, keywords: {args.keywords:,}, campaigns: {args.campaigns:,}")
+    print(f"{'Name columns':<20}{'Memory (MB)':>14}")
+    print(f"{'object strings':<20}{memory_mb(strings):>14.1f}")
+    print(f"{'categorical':<20}{memory_mb(categorical):>14.1f}")
+    print(f"{'interned int32':<20}{memory_mb(interned) + dictionaries:>14.1f}  "
+          f"(incl. {dictionaries:.1f} MB of dictionaries)")
+    print(f"Encode: {row_encode_seconds:.2f} s, decode of 1,000 rows for rendering: {row_decode_ms:.1f} ms")
+
+    # Week totals of every retailer and week
+    frames = build_week_totals(args.keywords)
+    all_keywords = pd.concat([frame["keyword"] for frame in frames])
+
+    start = time.perf_counter()
+    interned_frames = [frame.assign(keyword=intern_values("keyword", frame["keyword"])) for frame in frames]
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decode_ids("keyword", interned_frames[0]["keyword"].to_numpy()[:20])
+    decode_ms = (time.perf_counter() - start) * 1000
+
+    print()
+    print(f"Week totals - {len(frames)} frames ({RETAILERS} retailers x {WEEKS} weeks), "
+          f"{len(all_keywords):,} rows")
+    print(f"{'Keyword column':<20}{'Memory (MB)':>14}")
+    print(f"{'object strings':<20}{sum(memory_mb(frame) for frame in frames):>14.1f}")
+    print(f"{'categorical':<20}{sum(memory_mb(frame.assign(keyword=frame['keyword'].astype('category'))) for frame in frames):>14.1f}")
+    print(f"{'interned int32':<20}{sum(memory_mb(frame) for frame in interned_frames) + dictionary_mb(all_keywords):>14.1f}  (incl. dictionary)")
+    print(f"Encode: {encode_seconds:.2f} s, decode of one panel's 20 keywords: {decode_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
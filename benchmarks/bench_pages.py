@@ -0,0 +1,359 @@
+"""
+Page Latency Benchmark
+----------------------
+Drives app.py headlessly with Streamlit's testing API (AppTest) against the
+embedded DuckDB backend at several data scales, and measures for each page
+of app.render_main_content:
+
+- cold start: first run of the app in a fresh process (imports, dataset
+  load and the Dashboard), median over --cold-starts processes
+- first render: first run of the page in a new session with empty data and
+  resource caches and an empty dataset registry, median over --first-renders
+  sessions
+- reruns: a rerun without changes and a rerun after each of the page's
+  widget interactions (median and max over --repeats)
+
+Each scale runs in its own processes on a generated Parquet dataset (see
+synthetic_data.py, cached under data/benchmarks). Results are written as JSON.
+If a baseline file exists (benchmarks/pages-baseline.json by default) and was
+recorded on the same machine, the run fails (exit code 1) when any latency is
+more than --threshold slower than the baseline (and at least --min-delta-ms).
+Absolute latencies of other machines are not comparable, so a baseline of
+another machine is only reported; record one per machine with --save-baseline.
+
+Usage:
+    python benchmarks/bench_pages.py [--scales 100000 1000000] [--repeats 5]
+    python benchmarks/bench_pages.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP_PATH = os.path.join(ROOT, "app.py")
+DATA_DIR = os.path.join(ROOT, "data", "benchmarks")
+
+PAGES = ["Dashboard", "Performance Data", "Upload Keyword", "Model Run Results", "Help"]
+
+# Page -> widget interactions: (name, widget type, key)
+INTERACTIONS = {
+    "Dashboard": [
+        ("retailer_filter", "selectbox", "retailer_filter"),
+        ("primary_kpi", "selectbox", "primary_kpi"),
+        ("compare_campaigns", "selectbox", "chart_compare_by")
+    ],
+    "Performance Data": [
+        ("retailer_filter", "selectbox", "retailer_filter_perf"),
+        ("keyword_search", "text_input", "keyword_search_perf"),
+        ("anomalous_filter", "checkbox", "anomalous_filter_perf"),
+        ("next_page", "button", "perf_page_next")
+    ],
+    "Upload Keyword": [
+        ("retailer_select", "selectbox", "retailer_select")
+    ],
+    "Model Run Results": [
+        ("retailer_filter", "selectbox", "retailer_filter_model")
+    ],
+    "Help": []
+}
+
+# Text typed by text_input interactions (alternating with an empty box)
+SEARCH_TEXT = "crisps"
+
+
+def get_dataset_path(rows, seed=0):
+    """
+    Generate (once) the Parquet dataset of a scale.
+
+    Args:
+        rows (int): Approximate number of rows
+        seed (int): Random seed
+
+    Returns:
+        str: Glob of the dataset's Parquet files
+    """
+    from synthetic_data import write_parquet_dataset
+
+    folder = os.path.join(DATA_DIR, f"rows-{rows}-seed-{seed}")
+    if not os.path.exists(os.path.join(folder, "_SUCCESS")):
+        result = write_parquet_dataset(folder, rows=rows, seed=seed)
+        open(os.path.join(folder, "_SUCCESS"), "w").close()
+        print(f"Generated {result['scale']['rows']:,} rows in {result['seconds']:.1f}s")
+    return os.path.join(folder, "*.parquet")
+
+
+def timed_run(at, timeout):
+    """Run the app script and return the elapsed milliseconds."""
+    started = time.perf_counter()
+    at.run(timeout=timeout)
+    return (time.perf_counter() - started) * 1000
+
+
+def interact(at, widget, key, step):
+    """
+    Change a widget for the next rerun, alternating between two values.
+
+    Args:
+        at (AppTest): App under test
+        widget (str): "selectbox", "text_input", "checkbox" or "button"
+        key (str): Widget key
+        step (int): Repeat number (even: change, odd: change back)
+
+    Returns:
+        bool: False if the widget isn't on the page (or can't change)
+    """
+    try:
+        if widget == "selectbox":
+            element = at.selectbox(key=key)
+            if len(element.options) < 2:
+                return False
+            element.select(element.options[1 - step % 2])
+        elif widget == "text_input":
+            at.text_input(key=key).input(SEARCH_TEXT if step % 2 == 0 else "")
+        elif widget == "checkbox":
+            at.checkbox(key=key).set_value(step % 2 == 0)
+        elif widget == "button":
+            at.button(key=key).click()
+        return True
+    except KeyError:
+        return False
+
+
+def summarize(samples):
+    """Median and max of latency samples (ms)."""
+    return {"median_ms": round(statistics.median(samples), 1), "max_ms": round(max(samples), 1)}
+
+
+def get_errors(at):
+    """Exceptions raised by the app script in the last run."""
+    return [str(exception.message) for exception in at.exception]
+
+
+def benchmark_scale(repeats, timeout, first_renders=3, cold_start_only=False):
+    """
+    Benchmark every page in this process (DuckDB data path set by the caller).
+
+    Args:
+        repeats (int): Reruns per interaction
+        timeout (float): Seconds a single run may take
+        first_renders (int): Fresh sessions per page for the first render
+        cold_start_only (bool): Only measure the cold start
+
+    Returns:
+        dict: cold_start_ms and per-page first_render_ms, interactions, errors
+    """
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+    from dataset_registry import clear_registry
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    result = {"cold_start_ms": round(timed_run(at, timeout), 1), "pages": {}}
+    if cold_start_only:
+        return result
+
+    for page in PAGES:
+        samples = []
+        for _ in range(max(first_renders, 1)):
+            # Nothing loaded by earlier pages or sessions may be reused
+            st.cache_data.clear()
+            st.cache_resource.clear()
+            clear_registry()
+            at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+            at.session_state["selected_page"] = page
+            samples.append(timed_run(at, timeout))
+        first_render = summarize(samples)
+
+        # Interactions run in the last session
+        errors = get_errors(at)
+        interactions = {"rerun": summarize([timed_run(at, timeout) for _ in range(repeats)])}
+
+        for name, widget, key in INTERACTIONS[page]:
+            samples = []
+            for step in range(repeats):
+                if not interact(at, widget, key, step):
+                    break
+                samples.append(timed_run(at, timeout))
+                errors.extend(get_errors(at))
+            if samples:
+                interactions[name] = summarize(samples)
+
+        result["pages"][page] = {
+            "first_render_ms": first_render["median_ms"],
+            "first_render": first_render,
+            "interactions": interactions,
+            "errors": sorted(set(errors))
+        }
+
+    return result
+
+
+def run_scale(rows, repeats, timeout, seed, first_renders=3, cold_starts=3):
+    """
+    Benchmark one scale in fresh processes, so cold starts are really cold.
+
+    The first process benchmarks every page; the others only start the app.
+
+    Returns:
+        dict: Output of benchmark_scale (cold_start_ms as the median over
+            cold_starts processes) plus the scale's row count
+    """
+    data_path = get_dataset_path(rows, seed)
+    env = dict(os.environ, DATA_SOURCE="duckdb", DUCKDB_DATA_PATH=data_path)
+
+    result = None
+    cold_start_samples = []
+    with tempfile.TemporaryDirectory() as folder:
+        output = os.path.join(folder, "result.json")
+        for run in range(max(cold_starts, 1)):
+            command = [sys.executable, os.path.abspath(__file__), "--worker", output,
+                       "--repeats", str(repeats), "--timeout", str(timeout),
+                       "--first-renders", str(first_renders)]
+            if run > 0:
+                command.append("--cold-start-only")
+            # Streamlit logs of the worker are only shown if it fails
+            worker = subprocess.run(
+                command, env=env, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+            )
+            if worker.returncode != 0:
+                print(worker.stderr[-5000:], file=sys.stderr)
+                raise RuntimeError(f"Benchmark of {rows:,} rows failed (exit code {worker.returncode})")
+            with open(output) as f:
+                worker_result = json.load(f)
+            result = result or worker_result
+            cold_start_samples.append(worker_result["cold_start_ms"])
+
+    cold_start = summarize(cold_start_samples)
+    result["cold_start_ms"] = cold_start["median_ms"]
+    result["cold_start"] = cold_start
+    result["rows"] = rows
+    return result
+
+
+def flatten(results):
+    """
+    Flatten results to "rows/page/metric" -> milliseconds, for comparisons.
+    """
+    metrics = {}
+    for scale in results["scales"]:
+        prefix = str(scale["rows"])
+        metrics[f"{prefix}/cold_start"] = scale["cold_start_ms"]
+        for page, page_result in scale["pages"].items():
+            metrics[f"{prefix}/{page}/first_render"] = page_result["first_render_ms"]
+            for name, timing in page_result["interactions"].items():
+                metrics[f"{prefix}/{page}/{name}"] = timing["median_ms"]
+    return metrics
+
+
+def find_regressions(results, baseline, threshold, min_delta_ms):
+    """
+    Compare results with a baseline.
+
+    Args:
+        results (dict): Results of this run
+        baseline (dict): Results of the baseline run
+        threshold (float): Allowed slowdown (0.25 = 25%)
+        min_delta_ms (float): Slowdowns smaller than this are ignored (noise)
+
+    Returns:
+        list: (metric, baseline ms, current ms) of each regression
+    """
+    current = flatten(results)
+    regressions = []
+    for metric, before in flatten(baseline).items():
+        after = current.get(metric)
+        if after is not None and after > before * (1 + threshold) and after - before >= min_delta_ms:
+            regressions.append((metric, before, after))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark page latency of the app on the embedded DuckDB backend.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[100_000, 1_000_000], help="Dataset sizes (rows)")
+    parser.add_argument("--repeats", type=int, default=5, help="Reruns per interaction")
+    parser.add_argument("--first-renders", type=int, default=3, help="Fresh sessions per page for the first render")
+    parser.add_argument("--cold-starts", type=int, default=3, help="Fresh processes per scale for the cold start")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds a single run may take")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=os.path.join(DATA_DIR, "pages.json"))
+    parser.add_argument("--baseline", default=os.path.join(ROOT, "benchmarks", "pages-baseline.json"))
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=50, help="Ignore slowdowns smaller than this")
+    parser.add_argument("--save-baseline", action="store_true", help="Save this run as the baseline")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--cold-start-only", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        with open(args.worker, "w") as f:
+            json.dump(benchmark_scale(args.repeats, args.timeout, args.first_renders, args.cold_start_only), f)
+        return 0
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "repeats": args.repeats,
+        "first_renders": args.first_renders,
+        "cold_starts": args.cold_starts,
+        "scales": []
+    }
+    for rows in args.scales:
+        print(f"Scale: {rows:,} rows")
+        results["scales"].append(
+            run_scale(rows, args.repeats, args.timeout, args.seed, args.first_renders, args.cold_starts)
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n{'Metric':<50}{'ms':>10}")
+    for metric, ms in flatten(results).items():
+        print(f"{metric:<50}{ms:>10.1f}")
+
+    failed = False
+    errors = [
+        (scale["rows"], page, error)
+        for scale in results["scales"]
+        for page, page_result in scale["pages"].items()
+        for error in page_result["errors"]
+    ]
+    for rows, page, error in errors:
+        print(f"ERROR {rows}/{page}: {error}")
+        failed = True
+
+    baseline = None
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if baseline is not None and baseline.get("machine") != results["machine"]:
+        print(f"Baseline {args.baseline} was recorded on {baseline.get('machine')}, not compared; "
+              f"record one on this machine with --save-baseline")
+    elif baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold, args.min_delta_ms)
+        for metric, before, after in regressions:
+            print(f"REGRESSION {metric}: {before:.1f} ms -> {after:.1f} ms")
+        failed = failed or bool(regressions)
+        if not regressions:
+            print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}")
+
+    print(f"Results written to {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Startup Benchmark
+-----------------
+Measures the cold start cost of the app, each time in a fresh interpreter:
+
+- import time of app.py (python -X importtime), with the packages that
+  contribute most to it
+- cold start of each page: the first AppTest run of the app with that page
+  selected (imports, component declarations, queries and rendering)
+
+Runs on the embedded DuckDB backend, so results don't depend on a warehouse.
+Medians over --repeats runs are printed and written as JSON.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeats 5] [--output data/benchmarks/startup.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = ["Dashboard", "Performance Data", "Upload Keyword", "Model Run Results", "Help"]
+
+# Run in a fresh interpreter: cold start of the app with one page selected
+FIRST_RENDER_SCRIPT = """
+import sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=300)
+at.session_state["selected_page"] = sys.argv[1]
+at.run()
+print(round((time.perf_counter() - started) * 1000, 1))
+"""
+
+
+def get_env():
+    """Environment of the measured interpreters (offline DuckDB backend)."""
+    return dict(os.environ, DATA_SOURCE="duckdb", PYTHONDONTWRITEBYTECODE="1")
+
+
+def measure_import(module="app"):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module (str): Module to import
+
+    Returns:
+        tuple: (total ms, dict of top-level package -> self ms)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=get_env(), capture_output=True, text=True, check=True
+    )
+
+    total_ms = None
+    packages = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        packages[name.split(".")[0]] += int(self_us) / 1000
+        if name == module:
+            total_ms = int(cumulative_us) / 1000
+    return total_ms, dict(packages)
+
+
+def measure_first_render(page):
+    """
+    Cold start of the app with a page selected, in a fresh interpreter.
+
+    Returns:
+        float: Milliseconds from starting the import of Streamlit's test
+            harness until the first run has finished
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_RENDER_SCRIPT, page],
+        cwd=ROOT, env=get_env(), capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import time and cold start of the app.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=12, help="Packages listed by import cost")
+    parser.add_argument("--output", default=os.path.join(ROOT, "data", "benchmarks", "startup.json"))
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.repeats)]
+    import_ms = statistics.median(total for total, _ in imports)
+    packages = {
+        name: round(statistics.median(run[1].get(name, 0.0) for run in imports), 1)
+        for name in imports[0][1]
+    }
+    top_packages = dict(sorted(packages.items(), key=lambda item: -item[1])[:args.top])
+
+    first_render = {
+        page: round(statistics.median(measure_first_render(page) for _ in range(args.repeats)), 1)
+        for page in PAGES
+    }
+
+    print(f"Import of app.py: {import_ms:.0f} ms (median of {args.repeats})")
+    print(f"\n{'Package':<30}{'Self ms':>10}")
+    for name, ms in top_packages.items():
+        print(f"{name:<30}{ms:>10.1f}")
+    print(f"\n{'Cold start of page':<30}{'ms':>10}")
+    for page, ms in first_render.items():
+        print(f"{page:<30}{ms:>10.1f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "repeats": args.repeats,
+            "import_ms": round(import_ms, 1),
+            "top_packages_ms": top_packages,
+            "cold_start_ms": first_render
+        }, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,476 @@
+"""
+Concurrent-User Load Test
+-------------------------
+Simulates analysts using a running app: each virtual user opens its own
+Streamlit websocket session (like a browser tab) and runs click scripts
+(page changes, filter changes, stepping through weeks, keyword search and
+CSV uploads), with think time between clicks.
+
+Users are added in stages (e.g. 1, 5, 10, 20, 40). For each stage it reports:
+
+- throughput (completed interactions per second)
+- latency percentiles (p50, p90, p99) of an interaction: from the click
+  until the script run it triggers has finished
+- payload (KB received per interaction; like the browser, sessions cache
+  large messages and receive references to them afterwards)
+- errors (exceptions shown by the app, timeouts, dropped connections)
+- CPU and RSS of the server process (needs psutil)
+
+The saturation point is the first stage where adding users no longer
+increases throughput by more than 10%, or p90 latency doubles.
+
+Usage:
+    streamlit run app.py --server.headless true   # in another terminal
+    python benchmarks/load_test.py --url http://localhost:8501 --users 1 5 10 20 --duration 60
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from http.cookiejar import CookieJar
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.Common_pb2 import FileURLsRequest, UploadedFileInfo
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+# Element types of the widgets driven by the click scripts
+WIDGET_TYPES = {"selectbox", "text_input", "checkbox", "file_uploader", "component_instance"}
+
+# Key of the custom sidebar component (page navigation)
+SIDEBAR_KEY = "sidebar_navigation"
+
+# Uploaded by the "upload" step (see the Sample CSV Format in README.md)
+SAMPLE_CSV = (
+    "Search Term,Cost,Conversions,Current Bid\n"
+    + "".join(
+        f"{word} {i},{100 + i * 1.5:.2f},{10 + i % 30},{0.25 + (i % 20) / 100:.2f}\n"
+        for i, word in enumerate(["crisps", "snacks", "cereal", "pringles", "party"] * 40)
+    )
+).encode()
+
+# Click scripts: lists of (action, widget key, value)
+#   page: click a sidebar item; select: pick an option ("next" = the one after
+#   the current); type: enter text; check: set a checkbox; upload: upload SAMPLE_CSV
+CLICK_SCRIPTS = {
+    "dashboard_filters": [
+        ("page", SIDEBAR_KEY, "Dashboard"),
+        ("select", "retailer_filter", "next"),
+        ("select", "campaign_filter", "next"),
+        ("select", "primary_kpi", "next"),
+        ("select", "chart_compare_by", "Campaigns"),
+        ("select", "chart_compare_by", "Off")
+    ],
+    "performance_paging": [
+        ("page", SIDEBAR_KEY, "Performance Data"),
+        ("select", "week_filter_perf", "next"),
+        ("select", "week_filter_perf", "next"),
+        ("select", "week_filter_perf", "next"),
+        ("type", "keyword_search_perf", "crisps"),
+        ("check", "anomalous_filter_perf", True),
+        ("check", "anomalous_filter_perf", False),
+        ("type", "keyword_search_perf", "")
+    ],
+    "upload_keywords": [
+        ("page", SIDEBAR_KEY, "Upload Keyword"),
+        ("select", "retailer_select", "next"),
+        ("upload", "csv_upload", "keywords.csv")
+    ],
+    "model_results": [
+        ("page", SIDEBAR_KEY, "Model Run Results"),
+        ("select", "retailer_filter_model", "next")
+    ]
+}
+
+# How often each script is picked
+SCRIPT_WEIGHTS = {"dashboard_filters": 4, "performance_paging": 4, "upload_keywords": 1, "model_results": 1}
+
+
+def get_widget_key(widget_id):
+    """User key of a widget ID ("$$ID-<hash>-<key>"), or None if it has none."""
+    parts = widget_id.split("-", 2)
+    if widget_id.startswith("$$ID-") and len(parts) == 3 and parts[2] != "None":
+        return parts[2]
+    return None
+
+
+async def open_session(url, timeout):
+    """
+    Open a websocket session and run the app once (like loading the page).
+
+    Args:
+        url (str): Base URL of the app (e.g. http://localhost:8501)
+        timeout (float): Seconds a script run may take
+
+    Returns:
+        dict: Session state used by the other functions
+    """
+    import websockets
+
+    # The XSRF cookie set by the health check (as in the browser) authorizes uploads
+    cookies = CookieJar()
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cookies))
+    health_url = url.rstrip("/") + "/_stcore/health"
+    await asyncio.to_thread(lambda: opener.open(health_url, timeout=timeout).read())
+    xsrf = next((cookie.value for cookie in cookies if cookie.name == "_streamlit_xsrf"), None)
+
+    stream_url = url.replace("http", "ws", 1).rstrip("/") + "/_stcore/stream"
+    session = {
+        "url": url.rstrip("/"),
+        "opener": opener,
+        "xsrf": xsrf,
+        "websocket": await websockets.connect(stream_url, subprotocols=["streamlit"], max_size=None),
+        "session_id": None,
+        "widgets": {},
+        "states": {},
+        "message_cache": {},
+        "bytes_received": 0,
+        "timeout": timeout
+    }
+    await run_script(session)
+    return session
+
+
+async def read_until_finished(session):
+    """
+    Read server messages until the current script run has finished.
+
+    Widgets on the page are collected by key, so the next click can address
+    them (widget IDs can change between runs).
+
+    Returns:
+        list: Exception messages the app displayed during the run
+    """
+    errors = []
+    widgets = {}
+
+    while True:
+        data = await asyncio.wait_for(session["websocket"].recv(), session["timeout"])
+        session["bytes_received"] += len(data)
+        message = ForwardMsg()
+        message.ParseFromString(data)
+        kind = message.WhichOneof("type")
+
+        # Large messages are cached (by content hash) and later only referenced
+        if kind == "ref_hash":
+            message = session["message_cache"][message.ref_hash]
+            kind = message.WhichOneof("type")
+        elif message.metadata.cacheable and message.hash:
+            session["message_cache"][message.hash] = message
+
+        if kind == "new_session":
+            session["session_id"] = message.new_session.initialize.session_id
+        elif kind == "delta" and message.delta.WhichOneof("type") == "new_element":
+            element = message.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "exception":
+                errors.append(element.exception.message)
+            elif element_type in WIDGET_TYPES:
+                widget = getattr(element, element_type)
+                key = get_widget_key(widget.id)
+                if key:
+                    widgets[key] = {"id": widget.id, "type": element_type, "widget": widget}
+        elif kind == "file_urls_response":
+            session["file_urls"] = message.file_urls_response
+        elif kind == "script_finished":
+            # Runs cut short by st.rerun() are followed by the real run
+            if message.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                session["widgets"] = widgets
+                return errors
+
+
+async def run_script(session):
+    """Ask the server to rerun the app with the session's widget states."""
+    message = BackMsg()
+    message.rerun_script.widget_states.widgets.extend(session["states"].values())
+    message.rerun_script.cached_message_hashes.extend(session["message_cache"])
+    await session["websocket"].send(message.SerializeToString())
+    return await read_until_finished(session)
+
+
+async def upload_file(session, widget, name):
+    """
+    Upload SAMPLE_CSV the way the browser does and return its widget state.
+
+    Args:
+        session (dict): Session from open_session
+        widget (dict): File uploader widget
+        name (str): File name
+
+    Returns:
+        WidgetState: file_uploader_state_value of the uploaded file
+    """
+    message = BackMsg()
+    message.file_urls_request.CopyFrom(
+        FileURLsRequest(request_id=uuid.uuid4().hex, file_names=[name], session_id=session["session_id"])
+    )
+    await session["websocket"].send(message.SerializeToString())
+    while "file_urls" not in session:
+        data = await asyncio.wait_for(session["websocket"].recv(), session["timeout"])
+        session["bytes_received"] += len(data)
+        response = ForwardMsg()
+        response.ParseFromString(data)
+        if response.WhichOneof("type") == "file_urls_response":
+            session["file_urls"] = response.file_urls_response
+    file_urls = session.pop("file_urls").file_urls[0]
+
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"{name}\"\r\n"
+        f"Content-Type: text/csv\r\n\r\n"
+    ).encode() + SAMPLE_CSV + f"\r\n--{boundary}--\r\n".encode()
+    upload_url = file_urls.upload_url
+    if upload_url.startswith("/"):
+        upload_url = session["url"] + upload_url
+
+    request = urllib.request.Request(upload_url, data=body, method="PUT")
+    request.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
+    if session["xsrf"]:
+        request.add_header("X-Xsrftoken", session["xsrf"])
+    await asyncio.to_thread(lambda: session["opener"].open(request, timeout=session["timeout"]).read())
+
+    state = WidgetState(id=widget["id"])
+    state.file_uploader_state_value.uploaded_file_info.append(
+        UploadedFileInfo(file_id=file_urls.file_id, file_urls=file_urls, name=name, size=len(SAMPLE_CSV))
+    )
+    return state
+
+
+async def click(session, action, key, value):
+    """
+    Perform one click script step and wait for the app to finish rerunning.
+
+    Returns:
+        list: Exception messages the app displayed (None if the widget
+            isn't on the page, e.g. no model runs for the Model Run Results filter)
+    """
+    widget = session["widgets"].get(key)
+    if widget is None:
+        return None
+
+    state = WidgetState(id=widget["id"])
+    if action == "page":
+        state.json_value = json.dumps(value)
+    elif action == "select":
+        options = list(widget["widget"].options)
+        if not options:
+            return None
+        if value == "next":
+            current = session["states"].get(key)
+            index = options.index(current.string_value) if current is not None and current.string_value in options else 0
+            value = options[(index + 1) % len(options)]
+        state.string_value = value
+    elif action == "type":
+        state.string_value = value
+    elif action == "check":
+        state.bool_value = value
+    elif action == "upload":
+        state = await upload_file(session, widget, value)
+
+    # States are kept by key, so renamed widget IDs don't pile up
+    session["states"][key] = state
+    return await run_script(session)
+
+
+async def virtual_user(url, start_delay, deadline, think_time, timeout, samples, seed):
+    """
+    One analyst: opens a session and runs random click scripts until the deadline.
+
+    Args:
+        start_delay (float): Seconds to wait before opening the session
+        samples (dict): Collects latencies (ms), errors and bytes received
+    """
+    await asyncio.sleep(start_delay)
+    rng = random.Random(seed)
+    names = list(SCRIPT_WEIGHTS)
+    weights = [SCRIPT_WEIGHTS[name] for name in names]
+
+    try:
+        session = await open_session(url, timeout)
+    except Exception as e:
+        samples["errors"].append(f"connect: {e}")
+        return
+
+    try:
+        while time.monotonic() < deadline:
+            for action, key, value in CLICK_SCRIPTS[rng.choices(names, weights)[0]]:
+                if time.monotonic() >= deadline:
+                    break
+                started = time.perf_counter()
+                received = session["bytes_received"]
+                try:
+                    errors = await click(session, action, key, value)
+                except Exception as e:
+                    samples["errors"].append(f"{action} {key}: {type(e).__name__} {e}")
+                    return
+                if errors is None:
+                    continue
+                samples["latencies"].append((time.perf_counter() - started) * 1000)
+                samples["bytes"] += session["bytes_received"] - received
+                samples["errors"].extend(errors)
+                await asyncio.sleep(rng.expovariate(1 / think_time) if think_time > 0 else 0)
+    finally:
+        await session["websocket"].close()
+
+
+async def sample_resources(pid, stop, resources, interval=1.0):
+    """Sample CPU% and RSS of the server process until stop is set."""
+    import psutil
+
+    process = psutil.Process(pid)
+    processes = [process] + process.children(recursive=True)
+    for proc in processes:
+        proc.cpu_percent()
+    while not stop.is_set():
+        await asyncio.sleep(interval)
+        try:
+            resources["cpu"].append(sum(proc.cpu_percent() for proc in processes))
+            resources["rss_mb"].append(sum(proc.memory_info().rss for proc in processes) / 1024 ** 2)
+        except psutil.NoSuchProcess:
+            return
+
+
+def find_server_pid(url):
+    """PID of the process listening on the app's port (None if not found or no psutil)."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+
+    port = urllib.parse.urlparse(url).port or 80
+    try:
+        for connection in psutil.net_connections(kind="tcp"):
+            if connection.laddr and connection.laddr.port == port and connection.status == psutil.CONN_LISTEN:
+                return connection.pid
+    except psutil.AccessDenied:
+        pass
+    return None
+
+
+def percentile(values, q):
+    """q-th percentile (0-100) of a list of values (nearest rank)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))], 1)
+
+
+async def run_stage(url, users, duration, think_time, timeout, pid, seed):
+    """
+    Run one load stage with a fixed number of users.
+
+    Returns:
+        dict: users, interactions, throughput, p50/p90/p99 latency, errors,
+            and CPU/RSS of the server (if available)
+    """
+    samples = {"latencies": [], "errors": [], "bytes": 0}
+    resources = {"cpu": [], "rss_mb": []}
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_resources(pid, stop, resources)) if pid else None
+
+    started = time.monotonic()
+    deadline = started + duration
+    # Users arrive over the first tenth of the stage, not all at once
+    await asyncio.gather(*[
+        virtual_user(url, i * duration / 10 / users, deadline, think_time, timeout, samples, seed * 1000 + i)
+        for i in range(users)
+    ])
+    elapsed = time.monotonic() - started
+
+    stop.set()
+    if sampler:
+        await sampler
+
+    latencies = samples["latencies"]
+    return {
+        "users": users,
+        "interactions": len(latencies),
+        "throughput": round(len(latencies) / elapsed, 2),
+        "p50_ms": percentile(latencies, 50),
+        "p90_ms": percentile(latencies, 90),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": round(statistics.mean(latencies), 1) if latencies else None,
+        "kb_per_interaction": round(samples["bytes"] / 1024 / len(latencies), 1) if latencies else None,
+        "errors": len(samples["errors"]),
+        "error_samples": sorted(set(samples["errors"]))[:10],
+        "cpu_percent": round(statistics.mean(resources["cpu"]), 1) if resources["cpu"] else None,
+        "max_rss_mb": round(max(resources["rss_mb"]), 1) if resources["rss_mb"] else None
+    }
+
+
+def find_saturation(stages):
+    """
+    First stage where more users don't add throughput (< 10% more) or p90 latency doubles.
+
+    Returns:
+        int: Users of the saturating stage (None if not reached)
+    """
+    for previous, stage in zip(stages, stages[1:]):
+        if previous["throughput"] and stage["throughput"] < previous["throughput"] * 1.1:
+            return stage["users"]
+        if previous["p90_ms"] and stage["p90_ms"] and stage["p90_ms"] > previous["p90_ms"] * 2:
+            return stage["users"]
+    return None
+
+
+async def run_load_test(args):
+    pid = args.pid or find_server_pid(args.url)
+    if pid is None:
+        print("Server process not found (pass --pid, needs psutil): CPU and RSS are not reported")
+
+    stages = []
+    print(f"{'Users':>6}{'Inter.':>8}{'Thru/s':>8}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'KB/int.':>9}{'Errors':>8}{'CPU %':>8}{'RSS MB':>9}")
+    for users in args.users:
+        stage = await run_stage(args.url, users, args.duration, args.think_time, args.timeout, pid, args.seed)
+        stages.append(stage)
+        print(
+            f"{users:>6}{stage['interactions']:>8}{stage['throughput']:>8.2f}"
+            f"{stage['p50_ms'] or 0:>9.0f}{stage['p90_ms'] or 0:>9.0f}{stage['p99_ms'] or 0:>9.0f}"
+            f"{stage['kb_per_interaction'] or 0:>9.1f}"
+            f"{stage['errors']:>8}{stage['cpu_percent'] or 0:>8.0f}{stage['max_rss_mb'] or 0:>9.0f}"
+        )
+        for error in stage["error_samples"]:
+            print(f"    error: {error}")
+    return stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent analysts against a running app.")
+    parser.add_argument("--url", default="http://localhost:8501", help="Base URL of the running app")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 5, 10, 20], help="Concurrent users per stage")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds per stage")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean seconds between clicks")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds a single interaction may take")
+    parser.add_argument("--pid", type=int, help="Server PID for CPU/RSS (default: process listening on the port)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    stages = asyncio.run(run_load_test(args))
+    saturation = find_saturation(stages)
+    print(f"Saturation point: {saturation} users" if saturation else "Saturation point not reached")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump({
+                "url": args.url,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "duration": args.duration,
+                "think_time": args.think_time,
+                "stages": stages,
+                "saturation_users": saturation
+            }, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
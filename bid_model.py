@@ -0,0 +1,316 @@
+"""
+Bid Model Module
+----------------
+This module contains the bid optimization model that runs behind the
+"Save Data & Run Model" button on the Upload Keyword page.
+
+Every keyword's inputs (its weekly stats plus its Min Bid, Max Bid,
+Volatility and ROAS Target constraints) are fingerprinted. A run only
+re-optimizes keywords whose fingerprint changed since the previous run;
+bids for all other keywords are carried forward from that run.
+"""
+
+import hashlib
+import pandas as pd
+
+
+# Uploaded CSV / warehouse columns mapped to the model's column names.
+# When several source columns map to the same name, the first one found wins.
+STAT_COLUMN_MAP = {
+    "Search Term": "key",
+    "Key": "key",
+    "Name": "campaign_name",
+    "Campaign Name": "campaign_name",
+    "Week Commencing": "week_commencing",
+    "Cost": "spend",
+    "Conversions": "conversions",
+    "Sales": "conversions",
+    "Sales Val": "sales_value",
+    "ROAS": "roas",
+    "Current Bid": "current_bid",
+}
+
+# Stat columns that feed the fingerprint (only those present are used)
+FINGERPRINT_STAT_COLUMNS = [
+    "week_commencing", "spend", "conversions", "sales_value", "roas", "current_bid"
+]
+
+# Default constraints for keys the user has not configured.
+# Volatility is the maximum bid change per run, in percent.
+DEFAULT_CONSTRAINTS = {
+    "min_bid": 0.30,
+    "max_bid": 0.50,
+    "volatility": 5,
+    "roas_target": 2.50,
+}
+
+CONSTRAINT_COLUMNS = list(DEFAULT_CONSTRAINTS)
+
+# Display names for the constraint columns
+CONSTRAINT_LABELS = {
+    "min_bid": "*Min Bid",
+    "max_bid": "*Max Bid",
+    "volatility": "Bid Adjustment Volatility",
+    "roas_target": "ROAS Target",
+}
+
+
+def prepare_keyword_stats(df):
+    """
+    Normalize uploaded keyword data to the model's column names.
+
+    Args:
+        df (DataFrame): Uploaded CSV or warehouse rows
+
+    Returns:
+        DataFrame: Stats with a "key" column plus any known stat columns
+    """
+    renames = {}
+    for source, target in STAT_COLUMN_MAP.items():
+        if source in df.columns and target not in renames.values():
+            renames[source] = target
+
+    stats = df[list(renames)].rename(columns=renames)
+
+    # Use first column as key if no known key column was uploaded
+    if "key" not in stats.columns:
+        stats.insert(0, "key", df.iloc[:, 0])
+
+    stats = stats.dropna(subset=["key"])
+    stats["key"] = stats["key"].astype(str)
+
+    for col in ["spend", "conversions", "sales_value", "roas", "current_bid"]:
+        if col in stats.columns:
+            stats[col] = pd.to_numeric(stats[col], errors="coerce").astype("float64")
+
+    if "week_commencing" in stats.columns:
+        stats["week_commencing"] = stats["week_commencing"].astype(str)
+
+    return stats.reset_index(drop=True)
+
+
+def build_constraint_frame(keys, overrides=None):
+    """
+    Build a constraint table with one row per key, filled with defaults.
+
+    Args:
+        keys (list): Keys to include
+        overrides (DataFrame): Optional constraints that replace the defaults
+            for the keys they contain
+
+    Returns:
+        DataFrame: Columns "key" plus CONSTRAINT_COLUMNS
+    """
+    constraints = pd.DataFrame({"key": pd.Series(keys, dtype=str).drop_duplicates()})
+    for col, default in DEFAULT_CONSTRAINTS.items():
+        constraints[col] = float(default)
+
+    if overrides is not None and not overrides.empty:
+        overrides = overrides.drop_duplicates("key", keep="last").set_index("key")
+        constraints = constraints.set_index("key")
+        constraints.update(overrides[[c for c in CONSTRAINT_COLUMNS if c in overrides.columns]])
+        constraints = constraints.reset_index()
+
+    return constraints.reset_index(drop=True)
+
+
+def constraint_frame_for_stats(stats, overrides=None):
+    """
+    Build the constraint table for an upload, one row per key.
+
+    Args:
+        stats (DataFrame): Output of prepare_keyword_stats
+        overrides (DataFrame): Optional saved constraints to start from
+
+    Returns:
+        DataFrame: Columns "key", "campaign_name" (when uploaded) and
+            CONSTRAINT_COLUMNS
+    """
+    constraints = build_constraint_frame(stats["key"].unique(), overrides)
+
+    if "campaign_name" in stats.columns:
+        campaigns = stats.drop_duplicates("key").set_index("key")["campaign_name"]
+        constraints.insert(1, "campaign_name", constraints["key"].map(campaigns))
+
+    return constraints
+
+
+def apply_constraint_rule(constraints, field, value, campaign=None, key_contains=None):
+    """
+    Set one constraint for every key matching a rule.
+
+    For example, "all keys in campaign X: max bid 0.80" is
+    apply_constraint_rule(constraints, "max_bid", 0.80, campaign="X").
+
+    Args:
+        constraints (DataFrame): Constraint table
+        field (str): One of CONSTRAINT_COLUMNS
+        value (float): New value for the field
+        campaign (str): Only keys in this campaign (None for all)
+        key_contains (str): Only keys containing this text, case-insensitive
+
+    Returns:
+        tuple: (updated constraint table, number of keys updated)
+    """
+    if field not in CONSTRAINT_COLUMNS:
+        raise ValueError(f"Invalid constraint field: {field}. Must be one of {CONSTRAINT_COLUMNS}")
+
+    mask = pd.Series(True, index=constraints.index)
+    if campaign is not None and "campaign_name" in constraints.columns:
+        mask &= constraints["campaign_name"].astype(str) == str(campaign)
+    if key_contains:
+        mask &= constraints["key"].str.contains(key_contains, case=False, regex=False)
+
+    updated = constraints.copy()
+    updated.loc[mask, field] = float(value)
+    return updated, int(mask.sum())
+
+
+def compute_fingerprints(stats, constraints):
+    """
+    Fingerprint each keyword's inputs.
+
+    The fingerprint covers every weekly stats row of the keyword and its
+    constraint values, so any change to either produces a new fingerprint.
+
+    Args:
+        stats (DataFrame): Output of prepare_keyword_stats
+        constraints (DataFrame): Output of build_constraint_frame
+
+    Returns:
+        Series: Hex fingerprint per key (indexed by key)
+    """
+    if stats.empty:
+        return pd.Series(dtype=str)
+
+    stat_cols = [c for c in FINGERPRINT_STAT_COLUMNS if c in stats.columns]
+    sort_cols = ["key"] + (["week_commencing"] if "week_commencing" in stats.columns else [])
+    stats = stats.sort_values(sort_cols, kind="mergesort")
+
+    # One hash per stats row, then one digest per key over its rows
+    row_hashes = pd.util.hash_pandas_object(stats[stat_cols], index=False)
+    stat_digests = row_hashes.groupby(stats["key"].to_numpy(), sort=False).agg(_digest)
+
+    constraints = build_constraint_frame(stat_digests.index, constraints)
+    constraint_hashes = pd.util.hash_pandas_object(
+        constraints[CONSTRAINT_COLUMNS].astype("float64"), index=False
+    )
+    constraint_hashes.index = constraints["key"]
+
+    combined = stat_digests + ":" + constraint_hashes.reindex(stat_digests.index).map("{:016x}".format)
+    return combined.map(lambda value: hashlib.blake2b(value.encode(), digest_size=16).hexdigest())
+
+
+def optimize_bids(stats, constraints):
+    """
+    Compute new bids for every key in the stats.
+
+    The bid is scaled by observed ROAS over the ROAS target, the change is
+    capped at the key's volatility, and the result is clipped to its Min and
+    Max Bid. Observed ROAS is Sales Val / Cost when revenue is uploaded, the
+    reported ROAS column otherwise, and Conversions / Cost as a last resort.
+    Keys without spend keep their current bid (clipped to their range).
+
+    Args:
+        stats (DataFrame): Output of prepare_keyword_stats
+        constraints (DataFrame): Output of build_constraint_frame
+
+    Returns:
+        DataFrame: One row per key with its inputs and new bid
+    """
+    sort_cols = ["key"] + (["week_commencing"] if "week_commencing" in stats.columns else [])
+    grouped = stats.sort_values(sort_cols, kind="mergesort").groupby("key", sort=False)
+
+    aggregations = {"current_bid": ("current_bid", "last")}
+    for col in ["spend", "conversions", "sales_value"]:
+        if col in stats.columns:
+            aggregations[col] = (col, "sum")
+    if "roas" in stats.columns:
+        aggregations["reported_roas"] = ("roas", "mean")
+    if "campaign_name" in stats.columns:
+        aggregations["campaign_name"] = ("campaign_name", "first")
+    if "current_bid" not in stats.columns:
+        aggregations.pop("current_bid")
+
+    results = grouped.agg(**aggregations).reset_index()
+    if "current_bid" not in results.columns:
+        results["current_bid"] = float("nan")
+
+    results = results.merge(build_constraint_frame(results["key"], constraints), on="key", how="left")
+
+    spend = results["spend"] if "spend" in results.columns else pd.Series(float("nan"), index=results.index)
+    spend = spend.where(spend > 0)
+    if "sales_value" in results.columns:
+        roas = results["sales_value"] / spend
+    elif "reported_roas" in results.columns:
+        roas = results["reported_roas"].where(spend.notna())
+    elif "conversions" in results.columns:
+        roas = results["conversions"] / spend
+    else:
+        roas = pd.Series(float("nan"), index=results.index)
+    results["roas"] = roas
+
+    current = results["current_bid"].fillna(results["min_bid"])
+    step = results["volatility"] / 100
+    ratio = (roas / results["roas_target"]).clip(lower=1 - step, upper=1 + step)
+    new_bid = (current * ratio).fillna(current)
+    results["new_bid"] = new_bid.clip(lower=results["min_bid"], upper=results["max_bid"]).round(2)
+
+    return results.drop(columns=["reported_roas"], errors="ignore")
+
+
+def run_model(stats, constraints, previous_results=None):
+    """
+    Run the bid model, re-optimizing only keywords whose inputs changed.
+
+    Args:
+        stats (DataFrame): Output of prepare_keyword_stats
+        constraints (DataFrame): Constraints for some or all keys
+        previous_results (DataFrame): Results of the previous run for the
+            same retailer, or None to optimize every keyword
+
+    Returns:
+        tuple: (results DataFrame, summary dict with "keywords",
+            "reoptimized" and "carried_forward" counts)
+    """
+    fingerprints = compute_fingerprints(stats, constraints)
+
+    if previous_results is not None and "fingerprint" in previous_results.columns:
+        previous = previous_results.drop_duplicates("key", keep="last").set_index("key")
+        previous_fingerprints = previous["fingerprint"].reindex(fingerprints.index)
+        unchanged = fingerprints.index[fingerprints == previous_fingerprints]
+    else:
+        previous = None
+        unchanged = pd.Index([])
+
+    changed = fingerprints.index.difference(unchanged, sort=False)
+
+    frames = []
+    if len(changed):
+        optimized = optimize_bids(stats[stats["key"].isin(changed)], constraints)
+        optimized["run_source"] = "optimized"
+        frames.append(optimized)
+    if len(unchanged):
+        carried = previous.loc[unchanged].rename_axis("key").reset_index()
+        carried["run_source"] = "carried_forward"
+        frames.append(carried)
+
+    if not frames:
+        return pd.DataFrame(columns=["key", "new_bid", "run_source", "fingerprint"]), {
+            "keywords": 0, "reoptimized": 0, "carried_forward": 0
+        }
+
+    results = pd.concat(frames, ignore_index=True)
+    results["fingerprint"] = results["key"].map(fingerprints)
+
+    summary = {
+        "keywords": len(fingerprints),
+        "reoptimized": len(changed),
+        "carried_forward": len(unchanged),
+    }
+    return results, summary
+
+
+def _digest(hashes):
+    """Return a short hex digest of a group's row hashes."""
+    return hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16).hexdigest()
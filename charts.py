@@ -0,0 +1,376 @@
+"""
+Charts Module
+-------------
+This module builds the Performance Dashboard chart from real data.
+
+The pipeline has two cached stages:
+
+1. load_chart_series - fetches the weekly series via get_chart_data, cached
+   per (retailer, campaign, keyword, primary KPI, secondary KPI, date range).
+2. get_chart_figure - downsamples long series to the chart's pixel width
+   (see downsampling.py) and builds the Plotly figure spec, memoized on the
+   same key, so switching back to a previous KPI pair or filter selection
+   re-uses the spec instead of rebuilding it.
+
+Comparison mode (load_comparison_series / get_comparison_figure) draws one
+line per campaign or retailer for a single KPI. All series are fetched by one
+grouped query and pivoted to wide format in one step, then reduced together.
+
+The figure spec's layout.meta records how many points were fetched and
+shown ("points", "points_shown", "reduction_ratio") for debugging.
+"""
+
+from datetime import date, timedelta
+
+import streamlit as st
+from data_queries import get_available_weeks, get_chart_data, get_comparison_chart_data
+from downsampling import downsample_frame
+
+
+# Date range options of the chart -> number of weeks shown (None = all time)
+DATE_RANGES = {
+    "Last 8 Weeks": 8,
+    "Last 26 Weeks": 26,
+    "Last 52 Weeks": 52,
+    "All Time": None
+}
+
+# How long fetched series stay cached (seconds)
+SERIES_CACHE_TTL = 600
+
+# Maximum points per chart - roughly the chart's width in pixels
+MAX_CHART_POINTS = 800
+
+# Downsampling method for long series: "lttb" or "minmax"
+DOWNSAMPLE_METHOD = "lttb"
+
+# Above this many points markers and spline smoothing are turned off
+# to keep browser rendering fast
+MARKER_POINT_LIMIT = 100
+
+# Most series drawn in comparison mode (largest totals first)
+MAX_COMPARISON_SERIES = 12
+
+PRIMARY_COLOR = "#9333EA"
+SECONDARY_COLOR = "#7C3AED"
+
+# Trace colors of comparison mode
+COMPARISON_COLORS = [
+    "#9333EA", "#3B82F6", "#10B981", "#F59E0B", "#EF4444", "#6366F1",
+    "#14B8A6", "#EC4899", "#84CC16", "#F97316", "#0EA5E9", "#A855F7"
+]
+
+
+def get_date_range(range_label, end_week=None):
+    """
+    Convert a date range option to (start date, end date).
+
+    Ranges end at a week of the data rather than today, so they show data
+    however old the dataset is: "Last 8 Weeks" is end_week and the 7 weeks
+    before it.
+
+    Args:
+        range_label (str): One of DATE_RANGES
+        end_week (str or date): Last week commencing to include, as
+            "YYYY-MM-DD" (default: the latest week in the data)
+
+    Returns:
+        tuple: ("YYYY-MM-DD" or None, "YYYY-MM-DD" or None)
+    """
+    weeks = DATE_RANGES.get(range_label)
+    if weeks is None:
+        return (None, None)
+
+    end_week = end_week or get_latest_week()
+    if end_week is None:
+        return (None, None)
+
+    end = date.fromisoformat(str(end_week)[:10])
+    return ((end - timedelta(weeks=weeks - 1)).isoformat(), end.isoformat())
+
+
+@st.cache_data(ttl=SERIES_CACHE_TTL, show_spinner=False)
+def get_latest_week():
+    """
+    Get the latest week commencing in the data (cached).
+
+    Returns:
+        str: "YYYY-MM-DD", or None if the table has no weeks
+    """
+    weeks = get_available_weeks()
+    return str(max(weeks))[:10] if weeks else None
+
+
+@st.cache_data(ttl=SERIES_CACHE_TTL, show_spinner=False)
+def load_chart_series(retailer, campaign, keyword, primary_kpi, secondary_kpi, date_range):
+    """
+    Fetch the weekly chart series (cached).
+
+    Args:
+        retailer (str): Retailer filter
+        campaign (str): Campaign filter
+        keyword (str): Keyword filter
+        primary_kpi (str): Primary KPI name
+        secondary_kpi (str): Secondary KPI name
+        date_range (tuple): (start date, end date) from get_date_range
+
+    Returns:
+        DataFrame: Columns week, primary_value, secondary_value
+
+    Raises:
+        ValueError: If no data was returned (failures are not cached)
+    """
+    start_date, end_date = date_range
+    df = get_chart_data(
+        primary_kpi, secondary_kpi,
+        retailer=retailer, campaign=campaign, keyword=keyword,
+        start_date=start_date, end_date=end_date
+    )
+    if df.empty:
+        raise ValueError("No chart data available for the selected filters.")
+    return df
+
+
+@st.cache_data(ttl=SERIES_CACHE_TTL, max_entries=64, show_spinner=False)
+def get_chart_figure(retailer, campaign, keyword, primary_kpi, secondary_kpi, date_range):
+    """
+    Get the Plotly figure spec of the dashboard chart (memoized).
+
+    Args:
+        Same as load_chart_series
+
+    Returns:
+        dict: Plotly figure spec, ready for st.plotly_chart
+    """
+    series = load_chart_series(retailer, campaign, keyword, primary_kpi, secondary_kpi, date_range)
+    shown, ratio = downsample_frame(
+        series, ["primary_value", "secondary_value"], MAX_CHART_POINTS, DOWNSAMPLE_METHOD
+    )
+
+    fig = build_chart_figure(shown, primary_kpi, secondary_kpi)
+    fig.update_layout(meta={
+        "points": len(series),
+        "points_shown": len(shown),
+        "reduction_ratio": round(ratio, 4)
+    })
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=SERIES_CACHE_TTL, show_spinner=False)
+def load_comparison_series(group_by, retailer, campaign, keyword, kpi, date_range):
+    """
+    Fetch one KPI for every campaign or retailer and pivot it to wide format (cached).
+
+    All series come from one grouped query and are pivoted in one step, so
+    comparing every retailer costs a single round trip.
+
+    Args:
+        group_by (str): "campaign" or "retailer"
+        retailer (str): Retailer filter
+        campaign (str): Campaign filter
+        keyword (str): Keyword filter
+        kpi (str): KPI name
+        date_range (tuple): (start date, end date) from get_date_range
+
+    Returns:
+        DataFrame: Column "week" plus one column per series
+
+    Raises:
+        ValueError: If no data was returned (failures are not cached)
+    """
+    start_date, end_date = date_range
+    df = get_comparison_chart_data(
+        kpi, group_by,
+        retailer=retailer, campaign=campaign, keyword=keyword,
+        start_date=start_date, end_date=end_date
+    )
+    if df.empty:
+        raise ValueError("No chart data available for the selected filters.")
+
+    wide = df.pivot_table(index="week", columns="series", values="value", aggfunc="first", sort=True)
+    wide = wide.astype(float)
+
+    # Keep the series with the largest totals
+    if wide.shape[1] > MAX_COMPARISON_SERIES:
+        top = wide.sum().nlargest(MAX_COMPARISON_SERIES).index
+        wide = wide[top]
+
+    wide.columns = [str(col) for col in wide.columns]
+    return wide.reset_index()
+
+
+@st.cache_data(ttl=SERIES_CACHE_TTL, max_entries=64, show_spinner=False)
+def get_comparison_figure(group_by, retailer, campaign, keyword, kpi, date_range):
+    """
+    Get the Plotly figure spec of the comparison chart (memoized).
+
+    Args:
+        Same as load_comparison_series
+
+    Returns:
+        dict: Plotly figure spec with one overlaid trace per series
+    """
+    import plotly.graph_objects as go
+
+    wide = load_comparison_series(group_by, retailer, campaign, keyword, kpi, date_range)
+    series_columns = [col for col in wide.columns if col != "week"]
+    shown, ratio = downsample_frame(wide, series_columns, MAX_CHART_POINTS, DOWNSAMPLE_METHOD)
+
+    weeks = format_week_labels(shown["week"])
+    mode = 'lines+markers' if len(shown) <= MARKER_POINT_LIMIT else 'lines'
+
+    fig = go.Figure()
+    for i, col in enumerate(series_columns):
+        fig.add_trace(go.Scatter(
+            x=weeks,
+            y=shown[col].tolist(),
+            mode=mode,
+            name=col,
+            line=dict(color=COMPARISON_COLORS[i % len(COMPARISON_COLORS)], width=2),
+            marker=dict(size=5)
+        ))
+
+    apply_chart_layout(fig, kpi)
+    fig.update_layout(meta={
+        "points": len(wide),
+        "points_shown": len(shown),
+        "reduction_ratio": round(ratio, 4)
+    })
+    return fig.to_dict()
+
+
+def get_reduction_info(figure_spec):
+    """
+    Read the downsampling details recorded in a figure spec.
+
+    Args:
+        figure_spec (dict): Output of get_chart_figure
+
+    Returns:
+        dict: "points", "points_shown" and "reduction_ratio" (empty if unknown)
+    """
+    return figure_spec.get("layout", {}).get("meta") or {}
+
+
+def format_week_labels(weeks):
+    """
+    Format week commencing dates as chart labels (e.g. "Wo Jan 6").
+
+    Args:
+        weeks (Series): Week commencing dates
+
+    Returns:
+        list: Labels in the same order
+    """
+    import pandas as pd
+
+    dates = pd.to_datetime(weeks, errors="coerce")
+    return [
+        f"Wo {d:%b} {d.day}" if not pd.isna(d) else str(w)
+        for d, w in zip(dates, weeks)
+    ]
+
+
+def build_chart_figure(series, primary_kpi, secondary_kpi):
+    """
+    Build the dual-axis line chart for a weekly series.
+
+    Args:
+        series (DataFrame): Columns week, primary_value, secondary_value
+        primary_kpi (str): Primary KPI name (left axis)
+        secondary_kpi (str): Secondary KPI name (right axis)
+
+    Returns:
+        go.Figure: Chart figure
+    """
+    import plotly.graph_objects as go
+
+    weeks = format_week_labels(series["week"])
+    detailed = len(series) <= MARKER_POINT_LIMIT
+    mode = 'lines+markers' if detailed else 'lines'
+    shape = 'spline' if detailed else 'linear'
+
+    fig = go.Figure()
+
+    # Primary KPI line (left axis) with smooth curves
+    fig.add_trace(go.Scatter(
+        x=weeks,
+        y=series["primary_value"].astype(float).tolist(),
+        mode=mode,
+        name=primary_kpi,
+        line=dict(color=PRIMARY_COLOR, width=3, shape=shape, smoothing=1.3),
+        marker=dict(size=6),
+        fill='tonexty',
+        fillcolor='rgba(147, 51, 234, 0.1)'
+    ))
+
+    # Secondary KPI line (right axis) with smooth curves
+    fig.add_trace(go.Scatter(
+        x=weeks,
+        y=series["secondary_value"].astype(float).tolist(),
+        mode=mode,
+        name=secondary_kpi,
+        line=dict(color=SECONDARY_COLOR, width=3, shape=shape, smoothing=1.3),
+        marker=dict(size=6),
+        fill='tonexty',
+        fillcolor='rgba(124, 58, 237, 0.1)',
+        yaxis='y2'
+    ))
+
+    apply_chart_layout(fig, primary_kpi, secondary_kpi)
+    return fig
+
+
+def apply_chart_layout(fig, primary_title, secondary_title=None):
+    """
+    Apply the dashboard chart styling to a figure.
+
+    Args:
+        fig (go.Figure): Figure to style
+        primary_title (str): Left axis title
+        secondary_title (str): Right axis title (None for a single axis)
+    """
+    axis_font = dict(family='Gilroy', size=12, color='#6B7280')
+
+    layout = dict(
+        title=None,
+        xaxis=dict(
+            title=None,
+            showgrid=True,
+            gridcolor='#F3F4F6',
+            tickfont=dict(family='Gilroy', size=11, color='#6B7280'),
+            tickangle=0,
+            automargin=True
+        ),
+        yaxis=dict(
+            title=dict(text=primary_title, font=axis_font),
+            side="left",
+            showgrid=True,
+            gridcolor='#F3F4F6',
+            tickfont=axis_font
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="center",
+            x=0.5,
+            font=dict(family='Gilroy', size=12)
+        ),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=300,
+        margin=dict(l=0, r=0, t=0, b=0),
+        autosize=True
+    )
+
+    if secondary_title is not None:
+        layout["yaxis2"] = dict(
+            title=dict(text=secondary_title, font=axis_font),
+            side="right",
+            overlaying="y",
+            showgrid=False,
+            tickfont=axis_font
+        )
+
+    fig.update_layout(**layout)
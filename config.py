@@ -5,12 +5,15 @@ This file contains all configurable settings for the application.
 Modify these values to change app behavior without touching the main code.
 """
 
+import os
+
 # =============================================================================
 # DATA SOURCE CONFIGURATION
 # =============================================================================
 # Change this value to switch between data sources
-# Options: "databricks" or "snowflake"
-DATA_SOURCE = "databricks"
+# Options: "databricks", "snowflake" or "duckdb" (embedded, offline - see DUCKDB_CONFIG)
+# Can also be set via environment variable DATA_SOURCE.
+DATA_SOURCE = os.getenv("DATA_SOURCE") or "databricks"
 
 
 # =============================================================================
@@ -36,7 +39,33 @@ DATABRICKS_CONFIG = {
     "http_path": "",  # Set via environment variable DATABRICKS_HTTP_PATH or secrets.toml
     "catalog": "default",
     "schema": "bid_sample",
-    "table_name": ""  # Add your table name here after testing in Help page
+    "table_name": "",  # Add your table name here after testing in Help page
+    "retailer_column": ""  # Column holding the retailer name (leave empty if the table has none)
+}
+
+
+# =============================================================================
+# WAREHOUSE PROFILES
+# =============================================================================
+# Queries are tagged with a workload and routed to that workload's SQL
+# warehouse, so heavy exports and Help-page queries don't queue behind
+# (or in front of) interactive dashboard queries.
+#
+#   - interactive: dashboard and page queries
+#   - batch: exports and analytics jobs
+#   - adhoc: custom queries from the Help page
+#
+# An empty http_path falls back to DATABRICKS_HTTP_PATH. Per-profile paths can
+# also be set via environment variables DATABRICKS_HTTP_PATH_<PROFILE>
+# (e.g. DATABRICKS_HTTP_PATH_BATCH) or http_path_<profile> in secrets.toml.
+# For Snowflake, snowflake_warehouse works the same way (SNOWFLAKE_WAREHOUSE_<PROFILE>,
+# warehouse_<profile> in secrets.toml; empty falls back to SNOWFLAKE_WAREHOUSE).
+# max_concurrency limits the queries this app runs at once per profile;
+# queue_timeout is how long (seconds) a query waits for a free slot.
+WAREHOUSE_PROFILES = {
+    "interactive": {"http_path": "", "snowflake_warehouse": "", "max_concurrency": 8, "queue_timeout": 30},
+    "batch": {"http_path": "", "snowflake_warehouse": "", "max_concurrency": 2, "queue_timeout": 300},
+    "adhoc": {"http_path": "", "snowflake_warehouse": "", "max_concurrency": 2, "queue_timeout": 60}
 }
 
 
@@ -50,7 +79,97 @@ SNOWFLAKE_CONFIG = {
     "warehouse": "",
     "database": "",
     "schema": "",
-    "role": ""
+    "role": "",
+    "table_name": ""  # Performance table (default: DATABRICKS_CONFIG table_name)
+}
+
+
+# =============================================================================
+# DUCKDB CONFIGURATION
+# =============================================================================
+# Embedded engine for running the app and benchmarks offline.
+# If data_path is set (Parquet file or glob, e.g. "data/synthetic/*.parquet"),
+# the performance table reads it; otherwise a synthetic dataset of
+# synthetic_rows rows is generated in memory (see synthetic_data.py).
+# Can also be set via environment variables DUCKDB_DATABASE and DUCKDB_DATA_PATH.
+DUCKDB_CONFIG = {
+    "database": ":memory:",
+    "schema": "bid_sample",
+    "table_name": "performance",
+    "retailer_column": "Retailer",
+    "data_path": "",
+    "synthetic_rows": 100_000
+}
+
+
+# =============================================================================
+# STORAGE CONFIGURATION
+# =============================================================================
+# Local folders where bid constraints and model run outputs are saved (Parquet),
+# where report exports are written and where parsed keyword uploads are
+# spilled (Parquet, so the shared dataset is reloaded from disk, not the upload).
+# Can also be set via environment variables RUN_STORE_PATH, EXPORT_PATH and UPLOAD_PATH.
+STORAGE_CONFIG = {
+    "root": "data/run_store",
+    "export_dir": "data/exports",
+    "upload_dir": "data/uploads"
+}
+
+
+# =============================================================================
+# DISK CACHE CONFIGURATION
+# =============================================================================
+# Results of dashboard and rollup queries (run_query(..., cache=True)) shared
+# by all app processes on a machine (see disk_cache.py), stored as Arrow IPC
+# files. Least recently used results are evicted once the total size exceeds
+# max_size_mb. DuckDB runs in-process, so its results are
+# not worth caching.
+# Can also be set via environment variables DISK_CACHE_PATH and DISK_CACHE_MAX_SIZE_MB.
+DISK_CACHE_CONFIG = {
+    "enabled": True,
+    "path": "data/query_cache",
+    "max_size_mb": 2048,
+    "ttl": 600,  # Seconds a cached result stays valid
+    "backends": ["databricks", "snowflake"]
+}
+
+
+# =============================================================================
+# TABLE SYNC CONFIGURATION
+# =============================================================================
+# Local snapshot and rollups of the performance table, kept up to date
+# incrementally (see table_sync.py). mode is "cdf" (table version / change
+# data feed), "watermark" (re-read the latest weeks) or "auto" (cdf where the
+# backend has a change feed). In watermark mode the last lookback_weeks
+# weeks are re-read on every sync, to pick up restated rows.
+# The folder can also be set via environment variable TABLE_SYNC_PATH.
+SYNC_CONFIG = {
+    "root": "data/sync",
+    "mode": "auto",
+    "lookback_weeks": 2
+}
+
+
+# =============================================================================
+# DATASET REGISTRY CONFIGURATION
+# =============================================================================
+# Shared in-memory datasets (see dataset_registry.py). Least recently used
+# datasets are evicted once their total size exceeds the budget.
+# The budget can also be set via environment variable DATASET_MEMORY_BUDGET_MB.
+DATASET_CONFIG = {
+    "memory_budget_mb": 1024,
+    "session_timeout": 1800  # Seconds after which an idle session's references expire
+}
+
+
+# =============================================================================
+# LIVE REFRESH CONFIGURATION
+# =============================================================================
+# Opt-in auto-refresh of the dashboard (see live_refresh.py). A cheap watermark
+# query is polled on this interval; caches are only cleared when it changes.
+# The interval can also be set via environment variable LIVE_REFRESH_INTERVAL.
+LIVE_REFRESH_CONFIG = {
+    "interval_seconds": 60
 }
 
 
@@ -61,6 +180,7 @@ APP_CONFIG = {
     "page_title": "Dashboard",
     "page_icon": "📊",
     "layout": "wide",
-    "initial_sidebar_state": "expanded"
+    "initial_sidebar_state": "expanded",
+    "theme": "light"  # Stylesheet theme (see THEMES in styles.py)
 }
 
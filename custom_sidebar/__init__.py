@@ -5,30 +5,27 @@ A React-based custom Streamlit component for the sidebar navigation.
 """
 
 import os
-import streamlit.components.v1 as components
+from functools import lru_cache
 
 # Use production build (static files)
 parent_dir = os.path.dirname(os.path.abspath(__file__))
 build_dir = os.path.join(parent_dir, "frontend", "build")
 
-# Debug: print the build path
-print(f"[Custom Sidebar] Looking for build files at: {build_dir}")
-print(f"[Custom Sidebar] Build directory exists: {os.path.exists(build_dir)}")
-if os.path.exists(build_dir):
-    print(f"[Custom Sidebar] Files in build dir: {os.listdir(build_dir)}")
-    index_html_path = os.path.join(build_dir, "index.html")
-    print(f"[Custom Sidebar] index.html exists: {os.path.exists(index_html_path)}")
 
-# Declare component using the built files
-try:
-    _component_func = components.declare_component(
-        "custom_sidebar",
-        path=build_dir
-    )
-    print("[Custom Sidebar] Component declared successfully!")
-except Exception as e:
-    print(f"[Custom Sidebar] Error declaring component: {e}")
-    _component_func = None
+@lru_cache(maxsize=None)
+def _get_component_func():
+    """Declare the component on first render (once per process)."""
+    import streamlit.components.v1 as components
+    
+    if not os.path.exists(os.path.join(build_dir, "index.html")):
+        print(f"[Custom Sidebar] Build files not found at: {build_dir}")
+        return None
+    
+    try:
+        return components.declare_component("custom_sidebar", path=build_dir)
+    except Exception as e:
+        print(f"[Custom Sidebar] Error declaring component: {e}")
+        return None
 
 
 def custom_sidebar(logo_base64, nav_items, current_page, key=None):
@@ -44,8 +41,8 @@ def custom_sidebar(logo_base64, nav_items, current_page, key=None):
     Returns:
         str: Selected page name (or None if no change)
     """
+    _component_func = _get_component_func()
     if _component_func is None:
-        print("[Custom Sidebar] Component function is None, cannot render")
         return None
     
     try:
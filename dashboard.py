@@ -5,97 +5,37 @@ This module contains the Performance Dashboard page component.
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from datetime import datetime, timedelta
-import streamlit_shadcn_ui as ui
+from charts import DATE_RANGES, get_date_range, get_chart_figure, get_comparison_figure, get_reduction_info
+
+
+# How long the KPI tile values stay cached (seconds)
+KPI_CACHE_TTL = 600
+
+# KPI tile grids (3x2 each): (label, metric of get_dashboard_metrics, primary)
+KPI_GRIDS = [
+    [
+        ("Impressions", "impressions", True),
+        ("*CPA", "cpa", False),
+        ("ROAS", "roas", False),
+        ("CTR", "ctr", False),
+        ("Conversion Rate", "conversion_rate", False),
+        ("", None, False)
+    ],
+    [
+        ("Clicks", "clicks", True),
+        ("Avg. Rank", "avg_rank", False),
+        ("*CPC", "cpc", False),
+        ("*Spend", "spend", False),
+        ("*Sales (Con)", "sales_count", False),
+        ("*Sales (Rev)", "sales_value", False)
+    ]
+]
 
 
 def render_dashboard():
     """
     Render the Performance Dashboard page content.
     """
-    # Add page background and styling
-    st.markdown("""
-        <style>
-        /* Light grey background for entire page */
-        [data-testid="stAppViewContainer"] {
-            background-color: #FCFCFC !important;
-        }
-        
-        /* White container for main content with border shadow */
-        section[data-testid="stMain"] > div:first-child {
-            background-color: white;
-            border-radius: 12px;
-            padding: 32px;
-            margin: 24px;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            border: 1px solid #E5E7EB;
-            max-width: 100%;
-            overflow-x: hidden;
-        }
-        
-        /* Prevent horizontal scroll */
-        [data-testid="stAppViewContainer"] {
-            overflow-x: hidden !important;
-        }
-        section[data-testid="stMain"] {
-            overflow-x: hidden !important;
-        }
-        
-        /* Ensure columns fit within viewport */
-        [data-testid="column"] {
-            max-width: 100% !important;
-            overflow-x: hidden !important;
-        }
-        
-        /* Ensure chart container doesn't overflow */
-        .js-plotly-plot {
-            max-width: 100% !important;
-        }
-        
-        /* Custom background color for sidebar - remove all grey backgrounds */
-        section[data-testid="stSidebar"] {
-            background-color: #FCFCFC !important;
-        }
-        section[data-testid="stSidebar"] > div {
-            background-color: #FCFCFC !important;
-        }
-        section[data-testid="stSidebar"] > div > div {
-            background-color: #FCFCFC !important;
-        }
-        section[data-testid="stSidebar"] > div > div > div {
-            background-color: #FCFCFC !important;
-        }
-        section[data-testid="stSidebar"] * {
-            background-color: transparent !important;
-        }
-        /* Remove any grey background from sidebar elements */
-        [data-testid="stSidebar"] [data-testid="stVerticalBlock"] {
-            background-color: transparent !important;
-        }
-        [data-testid="stSidebar"] .element-container {
-            background-color: transparent !important;
-        }
-        /* Ensure iframe in sidebar has custom background */
-        section[data-testid="stSidebar"] iframe {
-            background-color: #FCFCFC !important;
-        }
-        /* Remove grey box that appears below sidebar navigation */
-        [data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div {
-            background-color: transparent !important;
-        }
-        [data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div > div {
-            background-color: transparent !important;
-        }
-        /* Target the specific grey container */
-        section[data-testid="stSidebar"] [data-testid="stVerticalBlock"]:not(:first-child) {
-            display: none !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Header Section
     render_dashboard_header()
     
@@ -104,6 +44,9 @@ def render_dashboard():
     
     # Main Content Area
     render_main_content()
+    
+    # Top movers panels
+    render_top_movers()
 
 
 def render_dashboard_header():
@@ -125,32 +68,23 @@ def render_dashboard_header():
         """, unsafe_allow_html=True)
     
     with col2:
-        # Export Report Button
-        st.markdown("""
-            <div style="display: flex; justify-content: flex-end; align-items: flex-start; margin-top: 8px; padding-right: 64px;">
-                <button style="
-                    background-color: white;
-                    border: 1.5px solid #9333EA;
-                    border-radius: 8px;
-                    padding: 10px 20px;
-                    font-family: 'Gilroy', sans-serif;
-                    font-weight: 500;
-                    font-size: 14px;
-                    color: #9333EA;
-                    cursor: pointer;
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                    transition: all 0.2s ease;
-                    white-space: nowrap;
-                ">
-                    <svg width="16" height="16" viewBox="0 0 16 16" fill="none" xmlns="http://www.w3.org/2000/svg">
-                        <path d="M14 10V12.6667C14 13.0203 13.8595 13.3594 13.6095 13.6095C13.3594 13.8595 13.0203 14 12.6667 14H3.33333C2.97971 14 2.64057 13.8595 2.39052 13.6095C2.14048 13.3594 2 13.0203 2 12.6667V10M4.66667 6.66667L8 10M8 10L11.3333 6.66667M8 10V2" stroke="#9333EA" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
-                    </svg>
-                    <span>Export Report</span>
-                </button>
-            </div>
-        """, unsafe_allow_html=True)
+        # Export Report - exports the currently filtered data
+        from data_queries import build_performance_query
+        from report_export import render_export_controls
+        
+        query = build_performance_query(
+            retailer=st.session_state.get("retailer_filter"),
+            campaign=st.session_state.get("campaign_filter"),
+            keyword=st.session_state.get("keywords_filter"),
+            week=st.session_state.get("week_filter")
+        )
+        render_export_controls(
+            query,
+            key="dashboard_export",
+            label="Export Report",
+            kpi_summary=get_kpi_summary(),
+            name="dashboard_report"
+        )
 
 
 def render_filter_section():
@@ -199,6 +133,12 @@ def render_filter_section():
                 key="week_filter"
             )
     
+    with col_spacer:
+        from live_refresh import render_live_refresh
+        
+        # Opt-in: poll for new data and update the dashboard when it changes
+        render_live_refresh()
+    
     st.markdown("</div>", unsafe_allow_html=True)
 
 
@@ -217,10 +157,10 @@ def render_main_content():
 def render_performance_chart():
     """Render the performance chart with dual-axis line chart."""
     # KPI Selectors - use narrower columns to limit width
-    col1, col2, col3 = st.columns([1, 1, 2])
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
     
     with col1:
-        st.selectbox(
+        primary_kpi = st.selectbox(
             "Primary KPI",
             ["Impressions", "Clicks", "CTR", "Conversion Rate"],
             index=0,
@@ -228,138 +168,122 @@ def render_performance_chart():
         )
     
     with col2:
-        st.selectbox(
+        secondary_kpi = st.selectbox(
             "Secondary KPI",
             ["ROAS", "CPA", "CPC", "Spend"],
             index=0,
             key="secondary_kpi"
         )
     
-    # Create sample data for the chart (optimal data points for smoother curves)
-    weeks = [
-        "Wo Jan 6", "Wo Jan 20", "Wo Feb 3", "Wo Feb 17",
-        "Wo Mar 3", "Wo Mar 17", "Wo Mar 31", "Wo Apr 14"
-    ]
-    impressions = [38, 45, 48, 55, 50, 58, 60, 57]
-    roas = [2.0, 2.2, 2.3, 2.8, 2.6, 2.9, 3.0, 2.8]
-    
-    # Create dual-axis line chart
-    fig = go.Figure()
-    
-    # Add Impressions line (left axis) with smooth curves
-    fig.add_trace(go.Scatter(
-        x=weeks,
-        y=impressions,
-        mode='lines+markers',
-        name='Impressions',
-        line=dict(color='#9333EA', width=3, shape='spline', smoothing=1.3),
-        marker=dict(size=6),
-        fill='tonexty',
-        fillcolor='rgba(147, 51, 234, 0.1)'
-    ))
-    
-    # Add ROAS line (right axis) with smooth curves
-    fig.add_trace(go.Scatter(
-        x=weeks,
-        y=roas,
-        mode='lines+markers',
-        name='ROAS',
-        line=dict(color='#7C3AED', width=3, shape='spline', smoothing=1.3),
-        marker=dict(size=6),
-        fill='tonexty',
-        fillcolor='rgba(124, 58, 237, 0.1)',
-        yaxis='y2'
-    ))
-    
-    # Update layout for dual-axis
-    fig.update_layout(
-        title=None,
-        xaxis=dict(
-            title=None,
-            showgrid=True,
-            gridcolor='#F3F4F6',
-            tickfont=dict(family='Gilroy', size=11, color='#6B7280'),
-            tickangle=0,
-            automargin=True
-        ),
-        yaxis=dict(
-            title="Impressions",
-            side="left",
-            showgrid=True,
-            gridcolor='#F3F4F6',
-            tickfont=dict(family='Gilroy', size=12, color='#6B7280'),
-            titlefont=dict(family='Gilroy', size=12, color='#6B7280')
-        ),
-        yaxis2=dict(
-            title="ROAS",
-            side="right",
-            overlaying="y",
-            showgrid=False,
-            tickfont=dict(family='Gilroy', size=12, color='#6B7280'),
-            titlefont=dict(family='Gilroy', size=12, color='#6B7280')
-        ),
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="center",
-            x=0.5,
-            font=dict(family='Gilroy', size=12)
-        ),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        height=300,
-        margin=dict(l=0, r=0, t=0, b=0),
-        autosize=True
-    )
+    with col3:
+        range_label = st.selectbox(
+            "Date Range",
+            list(DATE_RANGES),
+            index=0,
+            key="chart_date_range"
+        )
+    
+    with col4:
+        from data_queries import get_retailer_column
+        
+        # Comparison mode: one line per campaign/retailer for the primary KPI
+        compare_options = ["Off", "Campaigns"]
+        if get_retailer_column():
+            compare_options.append("Retailers")
+        compare_by = st.selectbox("Compare", compare_options, index=0, key="chart_compare_by")
+    
+    # Series and figure spec are both cached per filter/KPI/date-range selection
+    try:
+        if compare_by == "Off":
+            fig = get_chart_figure(
+                st.session_state.get("retailer_filter"),
+                st.session_state.get("campaign_filter"),
+                st.session_state.get("keywords_filter"),
+                primary_kpi,
+                secondary_kpi,
+                get_date_range(range_label, get_chart_end_week())
+            )
+        else:
+            group_by = "retailer" if compare_by == "Retailers" else "campaign"
+            fig = get_comparison_figure(
+                group_by,
+                # The compared dimension is not filtered
+                None if group_by == "retailer" else st.session_state.get("retailer_filter"),
+                None if group_by == "campaign" else st.session_state.get("campaign_filter"),
+                st.session_state.get("keywords_filter"),
+                primary_kpi,
+                get_date_range(range_label, get_chart_end_week())
+            )
+    except ValueError as e:
+        st.info(str(e))
+        return
     
     st.plotly_chart(fig, use_container_width=True)
+    
+    # Note when long ranges were downsampled to fit the chart
+    reduction = get_reduction_info(fig)
+    if reduction.get("reduction_ratio", 1) < 1:
+        st.caption(
+            f"Showing {reduction['points_shown']:,} of {reduction['points']:,} points "
+            f"(reduction ratio {reduction['reduction_ratio']:.2f})"
+        )
 
 
-def render_kpi_cards():
-    """Render the KPI cards using React component."""
-    from kpi_tiles import kpi_tiles
+def get_chart_end_week():
+    """
+    Get the week the chart's date range ends at: the selected week, or the
+    latest week in the data if the selection isn't a week.
     
-    # Add CSS to remove Streamlit margins around components
-    st.markdown("""
-        <style>
-        iframe[title="kpi_tiles.kpi_tiles"] {
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        div:has(> iframe[title="kpi_tiles.kpi_tiles"]) {
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    Returns:
+        str: "YYYY-MM-DD" (or None to use the latest week)
+    """
+    from data_queries import parse_week_filter
     
-    # Grid 1 data
-    grid1_data = [
-        {"label": "Impressions", "value": "2.0M", "is_primary": True},
-        {"label": "*CPA", "value": "0.33", "is_primary": False},
-        {"label": "ROAS", "value": "2.58", "is_primary": False},
-        {"label": "CTR", "value": "1.15%", "is_primary": False},
-        {"label": "Conversion Rate", "value": "2.33%", "is_primary": False},
-        {"label": "", "value": "", "is_primary": False}
-    ]
+    week = parse_week_filter(st.session_state.get("week_filter"))
+    return week if isinstance(week, str) and len(week) == 10 and week[4] == "-" else None
+
+
+def render_top_movers():
+    """Render the top-N movers panels (spend growth, ROAS drops)."""
+    from top_movers import MOVER_PANELS, get_top_movers
     
-    kpi_tiles(grid_data=grid1_data, key="kpi_grid_1")
+    retailer = st.session_state.get("retailer_filter")
+    week = st.session_state.get("week_filter")
     
-    # Small gap
-    st.markdown('<div style="height: 8px;"></div>', unsafe_allow_html=True)
+    columns = st.columns(len(MOVER_PANELS), gap="medium")
     
-    # Grid 2 data
-    grid2_data = [
-        {"label": "Clicks", "value": "23.0K", "is_primary": True},
-        {"label": "Avg. Rank", "value": "3.25", "is_primary": False},
-        {"label": "*CPC", "value": "0.15", "is_primary": False},
-        {"label": "*Spend", "value": "10.0K", "is_primary": False},
-        {"label": "*Sales (Con)", "value": "24.0K", "is_primary": False},
-        {"label": "*Sales (Rev)", "value": "25.8K", "is_primary": False}
-    ]
+    for column, (panel, settings) in zip(columns, MOVER_PANELS.items()):
+        with column:
+            st.markdown(f"""
+                <h3 style="font-family: 'Gilroy', sans-serif; font-weight: 600; font-size: 18px; color: #1F2937; margin: 24px 0 8px 0;">
+                    {settings['title']}
+                </h3>
+            """, unsafe_allow_html=True)
+            
+            movers = get_top_movers(retailer, week, panel, n=20)
+            if movers.empty:
+                st.caption("No data for the selected week.")
+                continue
+            
+            number_format = "%.2f" if settings["metric"] == "roas" else "%,.0f"
+            st.dataframe(
+                movers,
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "keyword": "Keyword",
+                    "current": st.column_config.NumberColumn("This Week", format=number_format),
+                    "previous": st.column_config.NumberColumn("Last Week", format=number_format),
+                    "change": st.column_config.NumberColumn("Change", format=number_format)
+                }
+            )
+
+
+def render_kpi_cards():
+    """Render the KPI cards using React component (all grids in one frame)."""
+    from kpi_tiles import kpi_tiles
     
-    kpi_tiles(grid_data=grid2_data, key="kpi_grid_2")
+    kpi_tiles(grids=get_kpi_grid_data(), key="kpi_grids")
     
     # Footer note
     st.markdown("""
@@ -371,175 +295,74 @@ def render_kpi_cards():
     """, unsafe_allow_html=True)
 
 
-def render_kpi_grid_html(data, grid_id):
-    """Render a 3x2 KPI grid using pure HTML table."""
-    st.markdown(f"""
-        <style>
-        .kpi-grid-{grid_id} {{
-            width: 100%;
-            max-width: 350px;
-            margin: 0 auto;
-            border-collapse: separate;
-            border-spacing: 0;
-            border: 5px solid #E5E7EB;
-            border-radius: 8px;
-            overflow: hidden;
-            background-color: white;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .kpi-grid-{grid_id} td {{
-            padding: 14px 10px;
-            min-height: 70px;
-            border-right: 2px solid #E5E7EB;
-            border-bottom: 2px solid #E5E7EB;
-            vertical-align: top;
-        }}
-        
-        .kpi-grid-{grid_id} td:last-child {{
-            border-right: none;
-        }}
-        
-        .kpi-grid-{grid_id} tr:last-child td {{
-            border-bottom: none;
-        }}
-        
-        .kpi-grid-{grid_id} .kpi-label {{
-            font-family: 'Gilroy', 'Poppins', sans-serif;
-            font-size: 12px;
-            color: #3B82F6;
-            margin-bottom: 6px;
-        }}
-        
-        .kpi-grid-{grid_id} .kpi-value {{
-            font-family: 'Gilroy', 'Poppins', sans-serif;
-            font-weight: 700;
-            font-size: 18px;
-            color: #1F2937;
-        }}
-        </style>
-        
-        <table class="kpi-grid-{grid_id}">
-            <tr>
-                <td>
-                    {f'<div class="kpi-label">{data[0][0]}</div><div class="kpi-value">{data[0][1]}</div>' if data[0][0] else ''}
-                </td>
-                <td>
-                    {f'<div class="kpi-label">{data[1][0]}</div><div class="kpi-value">{data[1][1]}</div>' if data[1][0] else ''}
-                </td>
-                <td>
-                    {f'<div class="kpi-label">{data[2][0]}</div><div class="kpi-value">{data[2][1]}</div>' if data[2][0] else ''}
-                </td>
-            </tr>
-            <tr>
-                <td>
-                    {f'<div class="kpi-label">{data[3][0]}</div><div class="kpi-value">{data[3][1]}</div>' if data[3][0] else '&nbsp;'}
-                </td>
-                <td>
-                    {f'<div class="kpi-label">{data[4][0]}</div><div class="kpi-value">{data[4][1]}</div>' if data[4][0] else '&nbsp;'}
-                </td>
-                <td>
-                    {f'<div class="kpi-label">{data[5][0]}</div><div class="kpi-value">{data[5][1]}</div>' if data[5][0] else '&nbsp;'}
-                </td>
-            </tr>
-        </table>
-    """, unsafe_allow_html=True)
-
-
-def render_kpi_grid_3x2(kpi_data, grid_id):
-    """Render a 3x2 grid (3 columns, 2 rows) using Streamlit columns."""
-    # Outer container with visible borders
-    st.markdown(f"""
-        <div style="
-            background-color: white;
-            border-radius: 8px;
-            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            margin-bottom: 16px;
-            max-width: 300px;
-            margin-left: auto;
-            margin-right: auto;
-            border: 2px solid #E5E7EB;
-            padding: 2px;
-        ">
-            <div style="
-                background-color: white;
-                border-radius: 6px;
-                overflow: hidden;
-            ">
-    """, unsafe_allow_html=True)
+@st.cache_data(ttl=KPI_CACHE_TTL, show_spinner=False)
+def load_kpi_metrics(retailer, campaign, keyword, week):
+    """
+    Fetch the values of all KPI tiles with one aggregate query (cached).
     
-    # Row 1
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        render_kpi_cell(kpi_data[0][0], kpi_data[0][1], kpi_data[0][2], True, True)
-    with col2:
-        render_kpi_cell(kpi_data[1][0], kpi_data[1][1], kpi_data[1][2], True, True)
-    with col3:
-        render_kpi_cell(kpi_data[2][0], kpi_data[2][1], kpi_data[2][2], False, True)
+    Args:
+        retailer (str): Retailer filter
+        campaign (str): Campaign filter
+        keyword (str): Keyword filter
+        week (str): Week filter
     
-    # Row 2 (last row - no bottom borders)
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        render_kpi_cell(kpi_data[3][0], kpi_data[3][1], kpi_data[3][2], True, False)
-    with col2:
-        render_kpi_cell(kpi_data[4][0], kpi_data[4][1], kpi_data[4][2], True, False)
-    with col3:
-        render_kpi_cell(kpi_data[5][0], kpi_data[5][1], kpi_data[5][2], False, False)
+    Returns:
+        dict: Metric name -> formatted value (see get_dashboard_metrics)
+    
+    Raises:
+        ValueError: If no rows match the filters (failures are not cached)
+    """
+    from data_queries import get_dashboard_metrics
     
-    st.markdown("</div></div>", unsafe_allow_html=True)
+    metrics = get_dashboard_metrics(week=week, retailer=retailer, campaign=campaign, keyword=keyword)
+    if metrics is None:
+        raise ValueError("No KPI data available for the selected filters.")
+    return metrics
 
 
+def get_kpi_grid_data():
+    """
+    Get the data of the KPI grids for the current filters.
+    
+    Values missing from the data are shown as "-".
+    
+    Returns:
+        list: One list of {"label": str, "value": str, "is_primary": bool}
+            per grid (see KPI_GRIDS)
+    """
+    try:
+        metrics = load_kpi_metrics(
+            st.session_state.get("retailer_filter"),
+            st.session_state.get("campaign_filter"),
+            st.session_state.get("keywords_filter"),
+            st.session_state.get("week_filter")
+        )
+    except ValueError:
+        metrics = {}
+    
+    return [
+        [
+            {
+                "label": label,
+                "value": metrics.get(metric, "-") if metric else "",
+                "is_primary": is_primary
+            }
+            for label, metric, is_primary in grid
+        ]
+        for grid in KPI_GRIDS
+    ]
 
 
-def render_kpi_cell(label, value, is_primary, has_right_border, has_bottom_border):
-    """Render a single KPI cell with proper borders."""
-    label_color = "#3B82F6" if is_primary else "#6B7280"
-    
-    border_right = "1px solid #E5E7EB" if has_right_border else ""
-    border_bottom = "1px solid #E5E7EB" if has_bottom_border else ""
-    
-    # Render empty cell with borders
-    if not label and not value:
-        st.markdown(f"""
-            <div style="
-                display: flex;
-                flex-direction: column;
-                align-items: flex-start;
-                padding: 14px 10px;
-                border-right: {border_right};
-                border-bottom: {border_bottom};
-                min-height: 70px;
-                box-sizing: border-box;
-                background-color: white;
-            ">
-            </div>
-        """, unsafe_allow_html=True)
-        return
+def get_kpi_summary():
+    """
+    Get the KPI tile values as label -> value (for report exports).
     
-    st.markdown(f"""
-        <div style="
-            display: flex;
-            flex-direction: column;
-            align-items: flex-start;
-            padding: 14px 10px;
-            border-right: {border_right};
-            border-bottom: {border_bottom};
-            min-height: 70px;
-            box-sizing: border-box;
-        ">
-            <div style="
-                font-family: 'Gilroy', sans-serif;
-                font-size: 12px;
-                color: {label_color} !important;
-                margin-bottom: 6px;
-                line-height: 1.2;
-            ">{label}</div>
-            <div style="
-                font-family: 'Gilroy', sans-serif;
-                font-weight: 700;
-                font-size: 18px;
-                color: #1F2937 !important;
-                line-height: 1.2;
-            ">{value}</div>
-        </div>
-    """, unsafe_allow_html=True)
+    Returns:
+        dict: KPI label -> displayed value
+    """
+    return {
+        item["label"]: item["value"]
+        for grid in get_kpi_grid_data()
+        for item in grid
+        if item["label"]
+    }
@@ -1,12 +1,33 @@
 """
 Data Connection Module
 ----------------------
-This module handles connections to different data sources (Databricks or Snowflake).
-It provides a unified interface regardless of which source is being used.
+This module handles connections to different data sources (Databricks,
+Snowflake or the embedded DuckDB engine). It provides a unified interface
+regardless of which source is being used; the source-specific parts live
+in backends.py.
+
+Queries are tagged with a workload ("interactive", "batch" or "adhoc") and
+routed to that workload's warehouse profile (see WAREHOUSE_PROFILES in
+config.py). Each profile keeps a small pool of open connections and limits
+how many of the app's queries run on it at once.
 """
 
+import threading
+import time
+from contextlib import contextmanager
+
 import streamlit as st
-from config import DATA_SOURCE, DATABRICKS_CONFIG, SNOWFLAKE_CONFIG
+from config import WAREHOUSE_PROFILES
+from backends import get_backend, get_secret
+
+# Workload of queries that don't specify one
+DEFAULT_WORKLOAD = "interactive"
+
+# Per-workload idle connections, concurrency slots and timings
+_idle_connections = {}
+_slots = {}
+_workload_stats = {}
+_pool_lock = threading.Lock()
 
 
 def get_data_source_name():
@@ -14,139 +35,251 @@ def get_data_source_name():
     Returns the name of the currently configured data source.
     
     Returns:
-        str: Name of the data source ("Databricks" or "Snowflake")
+        str: Name of the data source ("Databricks", "Snowflake" or "DuckDB")
     """
-    return DATA_SOURCE.title()
+    return get_backend()["name"]
 
 
-def initialize_databricks_connection():
+def get_warehouse_profile(workload=DEFAULT_WORKLOAD):
     """
-    Initialize connection to Databricks.
+    Get the settings of a workload's warehouse profile.
+    
+    Args:
+        workload (str): "interactive", "batch" or "adhoc"
     
     Returns:
-        connection: Databricks connection object (or None if not configured)
+        dict: Profile with "http_path" and "snowflake_warehouse" resolved
+            (environment variable > secrets.toml > config.py; empty if the
+            default warehouse is used)
+    
+    Raises:
+        ValueError: If the workload has no profile
     """
-    try:
-        from databricks import sql
-        import os
-        
-
-        # Check if required config is available
-        # Priority: environment variables > secrets.toml > config.py
-        host = os.getenv("DATABRICKS_HOST") or st.secrets.get("databricks", {}).get("host") or DATABRICKS_CONFIG.get("host")
-        http_path = os.getenv("DATABRICKS_HTTP_PATH") or st.secrets.get("databricks", {}).get("http_path") or DATABRICKS_CONFIG.get("http_path")
-        token = os.getenv("DATABRICKS_TOKEN") or st.secrets.get("databricks", {}).get("token") or DATABRICKS_CONFIG.get("token")
-        
-        if not all([host, http_path, token]):
-            st.warning("Databricks configuration incomplete. Please set host, http_path, and token in config.py or environment variables.")
-            return None
-        
-        # Create connection
-        connection = sql.connect(
-            server_hostname=host,
-            http_path=http_path,
-            access_token=token
+    import os
+    
+    if workload not in WAREHOUSE_PROFILES:
+        raise ValueError(
+            f"Invalid workload: {workload}. "
+            f"Must be one of {list(WAREHOUSE_PROFILES)}"
         )
-        
-        return connection
-        
-    except ImportError:
-        st.error("databricks-sql-connector not installed. Please run: pip install databricks-sql-connector")
-        return None
-    except Exception as e:
-        st.error(f"Failed to connect to Databricks: {str(e)}")
-        return None
+    
+    profile = dict(WAREHOUSE_PROFILES[workload])
+    profile["http_path"] = (
+        os.getenv(f"DATABRICKS_HTTP_PATH_{workload.upper()}")
+        or get_secret("databricks", f"http_path_{workload}")
+        or profile.get("http_path")
+    )
+    profile["snowflake_warehouse"] = (
+        os.getenv(f"SNOWFLAKE_WAREHOUSE_{workload.upper()}")
+        or get_secret("snowflake", f"warehouse_{workload}")
+        or profile.get("snowflake_warehouse")
+    )
+    return profile
 
 
-def initialize_snowflake_connection():
+def get_connection(workload=DEFAULT_WORKLOAD):
     """
-    Initialize connection to Snowflake.
+    Get the appropriate database connection based on the configured data source.
+    This is the main function you'll call to get a connection.
+    
+    Args:
+        workload (str): Workload whose warehouse profile is used
     
     Returns:
-        connection: Snowflake connection object (or None if not configured)
+        connection: Database connection object
+    
+    Raises:
+        ValueError: If DATA_SOURCE is not "databricks", "snowflake" or "duckdb"
     """
-    # TODO: Implement Snowflake connection logic
-    # Example:
-    # import snowflake.connector
-    # connection = snowflake.connector.connect(
-    #     account=SNOWFLAKE_CONFIG["account"],
-    #     user=SNOWFLAKE_CONFIG["user"],
-    #     password=SNOWFLAKE_CONFIG["password"],
-    #     warehouse=SNOWFLAKE_CONFIG["warehouse"],
-    #     database=SNOWFLAKE_CONFIG["database"],
-    #     schema=SNOWFLAKE_CONFIG["schema"]
-    # )
-    # return connection
+    return get_backend()["connect"](get_warehouse_profile(workload))
+
+
+def set_snowflake_connector(connector):
+    """
+    Replace the Snowflake connector module, e.g. with a local mock to run offline.
     
-    return None
+    Args:
+        connector (module): Object providing connect(**kwargs) (None restores the real one)
+    """
+    from backends import set_snowflake_connector as set_connector
+    
+    set_connector(connector)
+    
+    # Pooled connections belong to the previous connector
+    with _pool_lock:
+        for connections in _idle_connections.values():
+            connections.clear()
 
 
-def get_connection():
+@contextmanager
+def workload_connection(workload=DEFAULT_WORKLOAD):
     """
-    Get the appropriate database connection based on the configured data source.
-    This is the main function you'll call to get a connection.
+    Borrow a pooled connection of a workload, waiting for a free slot.
     
-    Returns:
-        connection: Database connection object
+    At most max_concurrency connections of a profile are in use at once.
+    The connection goes back to the pool afterwards, or is closed if the
+    query failed.
+    
+    Args:
+        workload (str): "interactive", "batch" or "adhoc"
+    
+    Yields:
+        connection: Database connection object (None if not configured)
     
     Raises:
-        ValueError: If DATA_SOURCE is not "databricks" or "snowflake"
+        TimeoutError: If no slot frees up within the profile's queue_timeout
     """
-    if DATA_SOURCE.lower() == "databricks":
-        return initialize_databricks_connection()
-    elif DATA_SOURCE.lower() == "snowflake":
-        return initialize_snowflake_connection()
-    else:
-        raise ValueError(
-            f"Invalid DATA_SOURCE: {DATA_SOURCE}. "
-            "Must be 'databricks' or 'snowflake'"
+    profile = get_warehouse_profile(workload)
+    
+    with _pool_lock:
+        if workload not in _slots:
+            _slots[workload] = threading.BoundedSemaphore(profile["max_concurrency"])
+            _idle_connections[workload] = []
+            _workload_stats[workload] = {"queries": 0, "failures": 0, "query_seconds": 0.0, "wait_seconds": 0.0}
+        slots = _slots[workload]
+    
+    started = time.perf_counter()
+    if not slots.acquire(timeout=profile["queue_timeout"]):
+        raise TimeoutError(
+            f"The {workload} warehouse is busy ({profile['max_concurrency']} queries running). "
+            "Please try again shortly."
         )
+    waited = time.perf_counter() - started
+    
+    connection = None
+    failed = False
+    try:
+        with _pool_lock:
+            if _idle_connections[workload]:
+                connection = _idle_connections[workload].pop()
+        if connection is None:
+            connection = get_connection(workload)
+        
+        started = time.perf_counter()
+        yield connection
+    except Exception:
+        failed = True
+        raise
+    finally:
+        with _pool_lock:
+            stats = _workload_stats[workload]
+            stats["queries"] += 1
+            stats["failures"] += int(failed)
+            stats["wait_seconds"] += waited
+            stats["query_seconds"] += time.perf_counter() - started
+            if connection is not None and not failed:
+                _idle_connections[workload].append(connection)
+        if connection is not None and failed:
+            close_connection(connection)
+        slots.release()
 
 
-def run_query(query):
+def get_workload_stats():
+    """
+    Get query counts and timings per workload since the app started.
+    
+    Returns:
+        dict: workload -> queries, failures, query_seconds, wait_seconds
+    """
+    with _pool_lock:
+        return {workload: dict(stats) for workload, stats in _workload_stats.items()}
+
+
+def run_query(query, workload=DEFAULT_WORKLOAD, cache=False):
     """
     Execute a SQL query against the configured data source.
     
     Args:
         query (str): SQL query to execute
+        workload (str): "interactive" (default), "batch" or "adhoc"
+        cache (bool): Share the result with the app's other processes through
+            the disk cache (see disk_cache.py), where enabled. Meant for
+            dashboard and rollup queries that many sessions repeat.
     
     Returns:
         DataFrame: Query results as a pandas DataFrame
     """
     import pandas as pd
     
+    table = run_query_arrow(query, workload, cache)
+    if table is None:
+        return pd.DataFrame()
+    return table.to_pandas()
+
+
+def run_query_arrow(query, workload=DEFAULT_WORKLOAD, cache=False):
+    """
+    Execute a SQL query and return the results as Arrow, without converting them.
+    
+    Disk cache hits are memory-mapped, so callers reading columns directly
+    (e.g. with to_numpy()) don't copy the cached result.
+    
+    Args:
+        query (str): SQL query to execute
+        workload (str): "interactive" (default), "batch" or "adhoc"
+        cache (bool): Use the disk cache (see run_query)
+    
+    Returns:
+        pyarrow.Table: Query results (None if the query failed; the error is shown)
+    """
     try:
-        connection = get_connection()
+        backend = get_backend()
         
-        if connection is None:
-            st.error("No database connection available")
-            return pd.DataFrame()
-        
-        if DATA_SOURCE.lower() == "databricks":
-            # Execute query using Databricks
-            cursor = connection.cursor()
-            cursor.execute(query)
-            
-            # Fetch results and convert to DataFrame
-            columns = [desc[0] for desc in cursor.description]
-            results = cursor.fetchall()
-            df = pd.DataFrame(results, columns=columns)
-            
-            cursor.close()
-            return df
-            
-        elif DATA_SOURCE.lower() == "snowflake":
-            # Execute query using Snowflake
-            df = pd.read_sql(query, connection)
-            return df
+        def fetch():
+            with workload_connection(workload) as connection:
+                if connection is None:
+                    return None
+                
+                cursor = backend["execute"](connection, query)
+                try:
+                    return backend["fetch_arrow"](cursor)
+                finally:
+                    cursor.close()
         
+        if cache:
+            from disk_cache import cached_query
+            table = cached_query(query, fetch)
         else:
-            st.error(f"Unsupported data source: {DATA_SOURCE}")
-            return pd.DataFrame()
+            table = fetch()
+        
+        if table is None:
+            st.error("No database connection available")
+        return table
             
     except Exception as e:
         st.error(f"Query execution failed: {str(e)}")
-        return pd.DataFrame()
+        return None
+
+
+def iter_query_batches(query, batch_size=50_000, workload="batch"):
+    """
+    Execute a SQL query and yield the results in batches.
+    
+    Unlike run_query, the full result set is never held in memory at once,
+    which makes this suitable for exports of large filtered queries.
+    
+    Args:
+        query (str): SQL query to execute
+        batch_size (int): Maximum rows per batch (default: 50,000)
+        workload (str): Workload the query is routed to (default: "batch")
+    
+    Yields:
+        pyarrow.Table: Next batch of results
+    
+    Raises:
+        ValueError: If no database connection is available
+    """
+    backend = get_backend()
+    
+    with workload_connection(workload) as connection:
+        if connection is None:
+            raise ValueError("No database connection available")
+        
+        cursor = backend["execute"](connection, query)
+        try:
+            yield from backend["fetch_batches"](cursor, batch_size)
+        finally:
+            cursor.close()
 
 
 def test_connection():
@@ -157,20 +290,15 @@ def test_connection():
         bool: True if connection successful, False otherwise
     """
     try:
-        connection = get_connection()
-        if connection is None:
-            return False
+        backend = get_backend()
         
-        # Test the connection with a simple query
-        if DATA_SOURCE.lower() == "databricks":
-            cursor = connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchall()
-            cursor.close()
-        elif DATA_SOURCE.lower() == "snowflake":
-            cursor = connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchall()
+        with workload_connection() as connection:
+            if connection is None:
+                return False
+            
+            # Test the connection with a simple query
+            cursor = backend["execute"](connection, "SELECT 1")
+            backend["fetch_arrow"](cursor)
             cursor.close()
         
         return True
@@ -205,22 +333,11 @@ def get_sample_data(table_name, limit=10):
     Returns:
         DataFrame: Sample data from the table
     """
-    import pandas as pd
-    
-    # Add catalog and schema if configured for Databricks
-    if DATA_SOURCE.lower() == "databricks":
-        catalog = DATABRICKS_CONFIG.get("catalog", "")
-        schema = DATABRICKS_CONFIG.get("schema", "")
-        
-        if catalog and schema:
-            full_table_name = f"{catalog}.{schema}.{table_name}"
-        else:
-            full_table_name = table_name
-    else:
-        full_table_name = table_name
+    # Add catalog and schema if configured
+    full_table_name = get_backend()["qualify_table"](table_name)
     
-    query = f"SELECT * FROM {full_table_name} LIMIT {limit}"
-    return run_query(query)
+    query = f"SELECT * FROM {full_table_name} LIMIT {int(limit)}"
+    return run_query(query, workload="adhoc")
 
 
 def list_tables():
@@ -233,22 +350,8 @@ def list_tables():
     import pandas as pd
     
     try:
-        if DATA_SOURCE.lower() == "databricks":
-            catalog = DATABRICKS_CONFIG.get("catalog", "")
-            schema = DATABRICKS_CONFIG.get("schema", "")
-            
-            if catalog and schema:
-                query = f"SHOW TABLES IN {catalog}.{schema}"
-            else:
-                query = "SHOW TABLES"
-        elif DATA_SOURCE.lower() == "snowflake":
-            query = "SHOW TABLES"
-        else:
-            return pd.DataFrame()
-        
-        return run_query(query)
+        return run_query(get_backend()["list_tables_query"](), workload="adhoc")
         
     except Exception as e:
         st.error(f"Failed to list tables: {str(e)}")
         return pd.DataFrame()
-
@@ -2,106 +2,150 @@
 Data Queries Module
 -------------------
 This module contains SQL queries and data transformation functions
-for fetching and processing data from Databricks.
+for fetching and processing data from the configured data source.
+
+Column names are quoted with ident() and values with quote_literal(), so
+the same queries run on Databricks, Snowflake and DuckDB (see backends.py).
 """
 
 import pandas as pd
-from data_connection import run_query
+from data_connection import run_query, run_query_arrow
+from backends import get_backend
 from config import DATABRICKS_CONFIG
 
 
+# Map KPI display names to database columns
+KPI_COLUMNS = {
+    "Impressions": "Imp",
+    "Clicks": "Clicks",
+    "CTR": "CTR",
+    "Conversion Rate": "Conv. rate",
+    "ROAS": "ROAS",
+    "CPA": "CPA",
+    "CPC": "CPC",
+    "Spend": "Cost"
+}
+
+# KPIs that are summed when aggregated (all others are averaged)
+ADDITIVE_KPIS = {"Impressions", "Clicks", "Spend"}
+
+# Name columns of performance rows -> interning dimension (see interning.py)
+NAME_COLUMNS = {"keyword": "keyword", "campaign_name": "campaign", "retailer": "retailer"}
+
+
 def get_performance_data(retailer=None, campaign=None, keyword=None, week=None):
     """
     Fetch performance data with optional filters.
     
     Args:
-        retailer (str): Filter by retailer (not in current schema, placeholder for future)
+        retailer (str): Filter by retailer (needs retailer_column in config.py)
         campaign (str): Filter by campaign name
-        keyword (str): Filter by keyword
+        keyword (str or list): Filter by keyword or list of keywords
         week (str): Filter by week commencing date
     
     Returns:
-        DataFrame: Performance data with all metrics
+        DataFrame: Performance data with all metrics; the NAME_COLUMNS hold
+            int32 IDs (decode with interning.decode_ids at the render boundary)
+    """
+    from interning import encode_table
+    
+    table = run_query_arrow(build_performance_query(retailer, campaign, keyword, week))
+    if table is None:
+        return pd.DataFrame()
+    return encode_table(table, NAME_COLUMNS)
+
+
+def build_performance_query(retailer=None, campaign=None, keyword=None, week=None):
+    """
+    Build the SQL query behind get_performance_data.
+    
+    Args:
+        retailer (str): Filter by retailer (needs retailer_column in config.py)
+        campaign (str): Filter by campaign name
+        keyword (str or list): Filter by keyword or list of keywords
+        week (str): Filter by week commencing date (or "Week of ..." label)
+    
+    Returns:
+        str: SQL query
     """
-    catalog = DATABRICKS_CONFIG.get("catalog", "default")
-    schema = DATABRICKS_CONFIG.get("schema", "bid_sample")
+    retailer_column = get_retailer_column()
+    retailer_select = f"\n        {ident(retailer_column)} as retailer," if retailer_column else ""
     
     # Base query - map columns to display names
     query = f"""
     SELECT 
-        `Key` as keyword,
-        `Name` as campaign_name,
-        `Imp` as impressions,
-        `Clicks` as clicks,
-        `Sales` as sales_count,
-        `Average auction ad rank` as avg_rank,
-        `CTR` as ctr,
-        `Conv. rate` as conversion_rate,
-        `CPC` as cpc,
-        `CPA` as cpa,
-        `Cost` as spend,
-        `Sales Val` as sales_value,
-        `ROAS` as roas,
-        `Week Commencing` as week_commencing,
-        `Current Bid` as current_bid,
-        `NewBids` as new_bids,
-        `comments`,
-        `Category` as category
-    FROM {catalog}.{schema}.your_table_name
+        {ident('Key')} as keyword,
+        {ident('Name')} as campaign_name,{retailer_select}
+        {ident('Imp')} as impressions,
+        {ident('Clicks')} as clicks,
+        {ident('Sales')} as sales_count,
+        {ident('Average auction ad rank')} as avg_rank,
+        {ident('CTR')} as ctr,
+        {ident('Conv. rate')} as conversion_rate,
+        {ident('CPC')} as cpc,
+        {ident('CPA')} as cpa,
+        {ident('Cost')} as spend,
+        {ident('Sales Val')} as sales_value,
+        {ident('ROAS')} as roas,
+        {ident('Week Commencing')} as week_commencing,
+        {ident('Current Bid')} as current_bid,
+        {ident('NewBids')} as new_bids,
+        {ident('comments')},
+        {ident('Category')} as category
+    FROM {get_table_name()}
     WHERE 1=1
     """
     
     # Add filters
-    if campaign and campaign != "All Campaign":
-        query += f"\n    AND `Name` = '{campaign}'"
-    
-    if keyword and keyword != "All Keywords":
-        query += f"\n    AND `Key` = '{keyword}'"
+    query += build_filter_clause(retailer, campaign, keyword)
     
     if week:
-        query += f"\n    AND `Week Commencing` = '{week}'"
+        query += f"\n    AND {ident('Week Commencing')} = {quote_literal(parse_week_filter(week))}"
     
-    query += "\n    ORDER BY `Week Commencing` DESC, `Key`"
+    query += f"\n    ORDER BY {ident('Week Commencing')} DESC, {ident('Key')}"
     
-    return run_query(query)
+    return query
 
 
-def get_dashboard_metrics(week=None):
+def get_dashboard_metrics(week=None, retailer=None, campaign=None, keyword=None):
     """
     Fetch aggregated metrics for the dashboard KPI cards.
     
+    All KPI tiles are fed from this one aggregate query.
+    
     Args:
         week (str): Filter by week commencing date
+        retailer (str): Filter by retailer
+        campaign (str): Filter by campaign name
+        keyword (str): Filter by keyword
     
     Returns:
-        dict: Dictionary of aggregated metrics
+        dict: Dictionary of aggregated metrics (None if no rows match)
     """
-    catalog = DATABRICKS_CONFIG.get("catalog", "default")
-    schema = DATABRICKS_CONFIG.get("schema", "bid_sample")
-    
     query = f"""
     SELECT 
-        SUM(`Imp`) as total_impressions,
-        AVG(`CPA`) as avg_cpa,
-        AVG(`ROAS`) as avg_roas,
-        AVG(`CTR`) as avg_ctr,
-        AVG(`Conv. rate`) as avg_conversion_rate,
-        AVG(`CPC`) as avg_cpc,
-        SUM(`Clicks`) as total_clicks,
-        AVG(`Average auction ad rank`) as avg_rank,
-        SUM(`Cost`) as total_spend,
-        SUM(`Sales`) as total_sales_count,
-        SUM(`Sales Val`) as total_sales_value
-    FROM {catalog}.{schema}.your_table_name
-    WHERE 1=1
+        SUM({ident('Imp')}) as total_impressions,
+        AVG({ident('CPA')}) as avg_cpa,
+        AVG({ident('ROAS')}) as avg_roas,
+        AVG({ident('CTR')}) as avg_ctr,
+        AVG({ident('Conv. rate')}) as avg_conversion_rate,
+        AVG({ident('CPC')}) as avg_cpc,
+        SUM({ident('Clicks')}) as total_clicks,
+        AVG({ident('Average auction ad rank')}) as avg_rank,
+        SUM({ident('Cost')}) as total_spend,
+        SUM({ident('Sales')}) as total_sales_count,
+        SUM({ident('Sales Val')}) as total_sales_value
+    FROM {get_table_name()}
+    WHERE 1=1{build_filter_clause(retailer, campaign, keyword)}
     """
     
     if week:
-        query += f"\n    AND `Week Commencing` = '{week}'"
+        query += f"\n    AND {ident('Week Commencing')} = {quote_literal(parse_week_filter(week))}"
     
-    df = run_query(query)
+    df = run_query(query, cache=True)
     
-    if df.empty:
+    # Aggregates over no rows come back as a single row of NULLs
+    if df.empty or pd.isna(df.iloc[0]['total_impressions']):
         return None
     
     # Convert to dictionary and format values
@@ -122,46 +166,272 @@ def get_dashboard_metrics(week=None):
     }
 
 
-def get_chart_data(primary_kpi="Impressions", secondary_kpi="ROAS"):
+def get_data_watermark():
+    """
+    Fetch a cheap watermark of the performance table, to detect new data.
+    
+    The latest week and the row count change whenever weeks are added or
+    rows are loaded or restated; on Delta tables both are answered from
+    table metadata.
+    
+    Returns:
+        tuple: (latest week commencing as "YYYY-MM-DD", row count),
+            or None if the query failed
+    """
+    query = f"""
+    SELECT 
+        MAX({ident('Week Commencing')}) as max_week,
+        COUNT(*) as row_count
+    FROM {get_table_name()}
+    """
+    
+    # Not disk cached, or changes would go unnoticed until the entry expires
+    df = run_query(query)
+    
+    if df.empty:
+        return None
+    
+    row = df.iloc[0]
+    max_week = None if pd.isna(row['max_week']) else str(row['max_week'])[:10]
+    return (max_week, int(row['row_count']))
+
+
+def get_chart_data(primary_kpi="Impressions", secondary_kpi="ROAS", retailer=None,
+                   campaign=None, keyword=None, start_date=None, end_date=None):
     """
     Fetch time series data for the performance chart.
     
     Args:
         primary_kpi (str): Primary KPI metric name
         secondary_kpi (str): Secondary KPI metric name
+        retailer (str): Filter by retailer
+        campaign (str): Filter by campaign name
+        keyword (str): Filter by keyword
+        start_date (str): First week commencing date to include ("YYYY-MM-DD")
+        end_date (str): Last week commencing date to include ("YYYY-MM-DD")
     
     Returns:
         DataFrame: Time series data with weeks and selected KPIs
     """
-    catalog = DATABRICKS_CONFIG.get("catalog", "default")
-    schema = DATABRICKS_CONFIG.get("schema", "bid_sample")
-    
-    # Map display names to database columns
-    kpi_mapping = {
-        "Impressions": "Imp",
-        "Clicks": "Clicks",
-        "CTR": "CTR",
-        "Conversion Rate": "Conv. rate",
-        "ROAS": "ROAS",
-        "CPA": "CPA",
-        "CPC": "CPC",
-        "Spend": "Cost"
-    }
+    primary_col = KPI_COLUMNS.get(primary_kpi, "Imp")
+    secondary_col = KPI_COLUMNS.get(secondary_kpi, "ROAS")
+    
+    query = f"""
+    SELECT 
+        {ident('Week Commencing')} as week,
+        SUM({ident(primary_col)}) as primary_value,
+        AVG({ident(secondary_col)}) as secondary_value
+    FROM {get_table_name()}
+    WHERE 1=1
+    """
+    
+    query += build_filter_clause(retailer, campaign, keyword)
+    
+    if start_date:
+        query += f"\n    AND {ident('Week Commencing')} >= {quote_literal(start_date)}"
+    
+    if end_date:
+        query += f"\n    AND {ident('Week Commencing')} <= {quote_literal(end_date)}"
+    
+    query += f"""
+    GROUP BY {ident('Week Commencing')}
+    ORDER BY {ident('Week Commencing')} ASC
+    """
+    
+    return run_query(query, cache=True)
+
+
+def get_comparison_chart_data(kpi="Impressions", group_by="campaign", retailer=None,
+                              campaign=None, keyword=None, start_date=None, end_date=None):
+    """
+    Fetch one KPI per week for every campaign or retailer in a single query.
+    
+    Args:
+        kpi (str): KPI metric name
+        group_by (str): "campaign" or "retailer" (needs retailer_column in config.py)
+        retailer (str): Filter by retailer
+        campaign (str): Filter by campaign name
+        keyword (str): Filter by keyword
+        start_date (str): First week commencing date to include ("YYYY-MM-DD")
+        end_date (str): Last week commencing date to include ("YYYY-MM-DD")
+    
+    Returns:
+        DataFrame: Long format with columns week, series, value
+    
+    Raises:
+        ValueError: If group_by is invalid or the table has no retailer column
+    """
+    if group_by == "campaign":
+        group_col = "Name"
+    elif group_by == "retailer":
+        group_col = get_retailer_column()
+        if not group_col:
+            raise ValueError("Retailer comparison needs retailer_column in config.py")
+    else:
+        raise ValueError(f"Invalid group_by: {group_by}. Must be 'campaign' or 'retailer'")
     
-    primary_col = kpi_mapping.get(primary_kpi, "Imp")
-    secondary_col = kpi_mapping.get(secondary_kpi, "ROAS")
+    kpi_col = KPI_COLUMNS.get(kpi, "Imp")
+    aggregate = "SUM" if kpi in ADDITIVE_KPIS else "AVG"
     
     query = f"""
     SELECT 
-        `Week Commencing` as week,
-        SUM(`{primary_col}`) as primary_value,
-        AVG(`{secondary_col}`) as secondary_value
-    FROM {catalog}.{schema}.your_table_name
-    GROUP BY `Week Commencing`
-    ORDER BY `Week Commencing` ASC
+        {ident('Week Commencing')} as week,
+        {ident(group_col)} as series,
+        {aggregate}({ident(kpi_col)}) as value
+    FROM {get_table_name()}
+    WHERE {ident(group_col)} IS NOT NULL
+    """
+    
+    query += build_filter_clause(retailer, campaign, keyword)
+    
+    if start_date:
+        query += f"\n    AND {ident('Week Commencing')} >= {quote_literal(start_date)}"
+    
+    if end_date:
+        query += f"\n    AND {ident('Week Commencing')} <= {quote_literal(end_date)}"
+    
+    query += f"""
+    GROUP BY {ident('Week Commencing')}, {ident(group_col)}
+    ORDER BY {ident('Week Commencing')} ASC
+    """
+    
+    return run_query(query, cache=True)
+
+
+def get_keyword_history(retailer=None):
     """
+    Fetch weekly totals per keyword (input of keyword_analytics).
     
-    return run_query(query)
+    Args:
+        retailer (str): Filter by retailer (needs retailer_column in config.py)
+    
+    Returns:
+        DataFrame: Columns keyword, week, impressions, clicks, spend,
+            sales_count, sales_value
+    """
+    query = f"""
+    SELECT
+        {ident('Key')} as keyword,
+        {ident('Week Commencing')} as week,
+        SUM({ident('Imp')}) as impressions,
+        SUM({ident('Clicks')}) as clicks,
+        SUM({ident('Cost')}) as spend,
+        SUM({ident('Sales')}) as sales_count,
+        SUM({ident('Sales Val')}) as sales_value
+    FROM {get_table_name()}
+    WHERE {ident('Key')} IS NOT NULL
+    """
+    
+    query += build_filter_clause(retailer)
+    
+    query += f"""
+    GROUP BY {ident('Key')}, {ident('Week Commencing')}
+    ORDER BY {ident('Key')}, {ident('Week Commencing')}
+    """
+    
+    # Full keyword history - routed to the batch warehouse
+    return run_query(query, workload="batch", cache=True)
+
+
+def get_keyword_week_totals(retailer=None, week=None):
+    """
+    Fetch per-keyword totals of a week and the week before it.
+    
+    Args:
+        retailer (str): Filter by retailer (needs retailer_column in config.py)
+        week (str): Week commencing date (or "Week of ..." label)
+    
+    Returns:
+        pyarrow.Table: Columns keyword, spend, prev_spend, sales_value,
+            prev_sales_value (None if the query failed)
+    """
+    query = build_keyword_week_totals_query(retailer, week)
+    
+    # Shared through the disk cache and read as Arrow, so a hit isn't copied
+    return run_query_arrow(query, cache=True)
+
+
+def build_keyword_week_totals_query(retailer=None, week=None):
+    """
+    Build the SQL query behind get_keyword_week_totals.
+    
+    Args:
+        retailer (str): Filter by retailer
+        week (str): Week commencing date (or "Week of ..." label)
+    
+    Returns:
+        str: SQL query
+    """
+    from datetime import datetime, timedelta
+    
+    current = parse_week_filter(week)
+    previous = (datetime.strptime(current, "%Y-%m-%d") - timedelta(weeks=1)).strftime("%Y-%m-%d")
+    this_week, last_week = quote_literal(current), quote_literal(previous)
+    
+    query = f"""
+    SELECT 
+        {ident('Key')} as keyword,
+        SUM(CASE WHEN {ident('Week Commencing')} = {this_week} THEN {ident('Cost')} ELSE 0 END) as spend,
+        SUM(CASE WHEN {ident('Week Commencing')} = {last_week} THEN {ident('Cost')} ELSE 0 END) as prev_spend,
+        SUM(CASE WHEN {ident('Week Commencing')} = {this_week} THEN {ident('Sales Val')} ELSE 0 END) as sales_value,
+        SUM(CASE WHEN {ident('Week Commencing')} = {last_week} THEN {ident('Sales Val')} ELSE 0 END) as prev_sales_value
+    FROM {get_table_name()}
+    WHERE {ident('Week Commencing')} IN ({this_week}, {last_week})
+    """
+    
+    query += build_filter_clause(retailer)
+    query += f"\n    GROUP BY {ident('Key')}"
+    
+    return query
+
+
+def build_top_movers_query(metric, n=20, largest=True, retailer=None, week=None):
+    """
+    Build a query returning only the top N keywords by week-on-week change.
+    
+    The warehouse keeps the N best rows with QUALIFY ROW_NUMBER() instead of
+    returning and sorting the full keyword set.
+    
+    Args:
+        metric (str): "spend" or "roas"
+        n (int): Number of keywords to return
+        largest (bool): True for the largest increases, False for the largest drops
+        retailer (str): Filter by retailer
+        week (str): Week commencing date (or "Week of ..." label)
+    
+    Returns:
+        str: SQL query with columns keyword, current, previous, change
+    """
+    expressions = {
+        "spend": ("spend", "prev_spend"),
+        "roas": (
+            "sales_value / NULLIF(spend, 0)",
+            "prev_sales_value / NULLIF(prev_spend, 0)"
+        )
+    }
+    if metric not in expressions:
+        raise ValueError(f"Invalid metric: {metric}. Must be one of {list(expressions)}")
+    
+    current, previous = expressions[metric]
+    order = "DESC" if largest else "ASC"
+    
+    return f"""
+    WITH totals AS ({build_keyword_week_totals_query(retailer, week)}
+    ),
+    changes AS (
+        SELECT 
+            keyword,
+            {current} as current,
+            {previous} as previous,
+            ({current}) - ({previous}) as change
+        FROM totals
+    )
+    SELECT keyword, current, previous, change
+    FROM changes
+    WHERE change IS NOT NULL
+    QUALIFY ROW_NUMBER() OVER (ORDER BY change {order}) <= {int(n)}
+    ORDER BY change {order}
+    """
 
 
 def get_available_campaigns():
@@ -171,14 +441,11 @@ def get_available_campaigns():
     Returns:
         list: List of campaign names
     """
-    catalog = DATABRICKS_CONFIG.get("catalog", "default")
-    schema = DATABRICKS_CONFIG.get("schema", "bid_sample")
-    
     query = f"""
-    SELECT DISTINCT `Name` as campaign_name
-    FROM {catalog}.{schema}.your_table_name
-    WHERE `Name` IS NOT NULL
-    ORDER BY `Name`
+    SELECT DISTINCT {ident('Name')} as campaign_name
+    FROM {get_table_name()}
+    WHERE {ident('Name')} IS NOT NULL
+    ORDER BY {ident('Name')}
     """
     
     df = run_query(query)
@@ -194,14 +461,11 @@ def get_available_keywords():
     Returns:
         list: List of keywords
     """
-    catalog = DATABRICKS_CONFIG.get("catalog", "default")
-    schema = DATABRICKS_CONFIG.get("schema", "bid_sample")
-    
     query = f"""
-    SELECT DISTINCT `Key` as keyword
-    FROM {catalog}.{schema}.your_table_name
-    WHERE `Key` IS NOT NULL
-    ORDER BY `Key`
+    SELECT DISTINCT {ident('Key')} as keyword
+    FROM {get_table_name()}
+    WHERE {ident('Key')} IS NOT NULL
+    ORDER BY {ident('Key')}
     """
     
     df = run_query(query)
@@ -217,14 +481,11 @@ def get_available_weeks():
     Returns:
         list: List of week commencing dates
     """
-    catalog = DATABRICKS_CONFIG.get("catalog", "default")
-    schema = DATABRICKS_CONFIG.get("schema", "bid_sample")
-    
     query = f"""
-    SELECT DISTINCT `Week Commencing` as week
-    FROM {catalog}.{schema}.your_table_name
-    WHERE `Week Commencing` IS NOT NULL
-    ORDER BY `Week Commencing` DESC
+    SELECT DISTINCT {ident('Week Commencing')} as week
+    FROM {get_table_name()}
+    WHERE {ident('Week Commencing')} IS NOT NULL
+    ORDER BY {ident('Week Commencing')} DESC
     """
     
     df = run_query(query)
@@ -233,6 +494,109 @@ def get_available_weeks():
     return df['week'].tolist()
 
 
+def build_filter_clause(retailer=None, campaign=None, keyword=None):
+    """
+    Build the SQL conditions for the retailer, campaign and keyword filters.
+    
+    "All ..." selections add no condition. The retailer filter is only
+    applied when the table has a retailer column (retailer_column in config.py).
+    
+    Args:
+        retailer (str): Filter by retailer
+        campaign (str): Filter by campaign name
+        keyword (str or list): Filter by keyword, or by any of a list of
+            keywords (e.g. the matches of a keyword search)
+    
+    Returns:
+        str: Conditions to append after "WHERE 1=1"
+    """
+    clause = ""
+    retailer_column = get_retailer_column()
+    
+    if retailer and retailer_column and not str(retailer).startswith("All "):
+        clause += f"\n    AND {ident(retailer_column)} = {quote_literal(retailer)}"
+    
+    if campaign and campaign != "All Campaign":
+        clause += f"\n    AND {ident('Name')} = {quote_literal(campaign)}"
+    
+    if isinstance(keyword, (list, tuple, set)):
+        if keyword:
+            values = ", ".join(quote_literal(k) for k in keyword)
+            clause += f"\n    AND {ident('Key')} IN ({values})"
+        else:
+            clause += "\n    AND 1=0"
+    elif keyword and keyword != "All Keywords":
+        clause += f"\n    AND {ident('Key')} = {quote_literal(keyword)}"
+    
+    return clause
+
+
+def get_table_name():
+    """
+    Returns the fully qualified name of the performance table.
+    
+    Returns:
+        str: Table name for the configured backend (e.g. "catalog.schema.table"
+            on Databricks, or the placeholder if no table is configured)
+    """
+    return get_backend()["qualify_table"]()
+
+
+def get_retailer_column():
+    """
+    Returns the column holding the retailer name.
+    
+    Returns:
+        str: Column name (empty if the table has none)
+    """
+    return get_backend()["config"].get("retailer_column") or DATABRICKS_CONFIG.get("retailer_column", "")
+
+
+def ident(name):
+    """
+    Quote a column name for the configured backend.
+    
+    Args:
+        name (str): Column name, e.g. "Week Commencing"
+    
+    Returns:
+        str: Quoted identifier (`Week Commencing` on Databricks,
+            "Week Commencing" on Snowflake and DuckDB)
+    """
+    return get_backend()["quote_ident"](name)
+
+
+def quote_literal(value):
+    """
+    Quote a value as a SQL string literal.
+    
+    Args:
+        value: Value to quote
+    
+    Returns:
+        str: Quoted literal with embedded quotes escaped for the configured backend
+    """
+    return get_backend()["quote_literal"](value)
+
+
+def parse_week_filter(week):
+    """
+    Convert a "Week of Feb 24 2025" filter label to a week commencing date.
+    
+    Args:
+        week (str): Filter label or date
+    
+    Returns:
+        str: Date as "YYYY-MM-DD" (or the input unchanged if not a label)
+    """
+    from datetime import datetime
+    
+    try:
+        return datetime.strptime(str(week), "Week of %b %d %Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return week
+
+
 def format_number(num):
     """
     Format large numbers with K, M suffixes.
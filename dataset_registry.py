@@ -0,0 +1,280 @@
+"""
+Dataset Registry Module
+-----------------------
+This module keeps one shared, read-only copy of each dataset per process.
+
+st.session_state and st.cache_data both hand every session its own copy of
+a DataFrame, so with many analysts open the same weekly data is held many
+times over. Instead, sessions acquire a dataset by key and keep only the
+returned handle (and their filter state); the frame itself lives here once.
+
+- Reference counting: each session acquiring a dataset holds a reference.
+  References of sessions that have not touched a dataset for
+  DATASET_CONFIG["session_timeout"] seconds expire.
+- LRU eviction: when the total size exceeds the memory budget, the least
+  recently used unreferenced datasets are evicted first, then referenced
+  ones.
+- Loaders are only kept while a dataset is loaded or referenced: eviction,
+  or the release or expiry of its last reference, drops the loader and its
+  load lock, so nothing captured by a loader outlives the dataset. Callers acquire a
+  dataset each time they use it, which registers the loader again and
+  reloads the dataset if it was evicted.
+
+get_dataset returns a shallow copy: columns are shared with the registry
+and, with pandas copy-on-write, a session changing its copy never changes
+the shared data. Copy-on-write is the default from pandas 3 and is switched
+on at import on pandas 2.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from config import DATASET_CONFIG
+
+# Shallow copies must never write into the shared frames
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+# key -> {"frame", "bytes", "loaded_at", "ttl"}
+_entries = OrderedDict()
+
+# key -> {session_id: last_seen}; kept across invalidation, so the reloaded dataset stays referenced
+_references = {}
+
+# key -> (loader, ttl) of datasets that are loaded or referenced
+_loaders = {}
+
+# key -> lock held while the dataset loads, so it is only loaded once
+_load_locks = {}
+
+_lock = threading.Lock()
+
+
+def get_memory_budget():
+    """
+    Returns the memory budget of the registry.
+
+    Returns:
+        int: Budget in bytes (DATASET_MEMORY_BUDGET_MB environment variable or config.py)
+    """
+    budget_mb = os.getenv("DATASET_MEMORY_BUDGET_MB") or DATASET_CONFIG.get("memory_budget_mb", 1024)
+    return int(float(budget_mb) * 1024 * 1024)
+
+
+def acquire_dataset(key, loader, ttl=None):
+    """
+    Load a dataset into the registry (once) and reference it from the current session.
+
+    Args:
+        key (str): Unique dataset key, e.g. "week_totals:Tesco:2025-02-24"
+        loader (callable): Returns the DataFrame; called on first use and
+            after eviction or expiry
+        ttl (float): Seconds after which the dataset is reloaded (None = never)
+
+    Returns:
+        str: Handle to keep in session state and pass to get_dataset
+    """
+    with _lock:
+        _loaders[key] = (loader, ttl)
+    _load(key)
+    return key
+
+
+def get_dataset(handle):
+    """
+    Get a dataset by handle.
+
+    Args:
+        handle (str): Handle from acquire_dataset
+
+    Returns:
+        DataFrame: Shallow copy of the shared frame
+
+    Raises:
+        KeyError: If the handle was never acquired in this process, or the
+            dataset was evicted after its loader was dropped
+    """
+    return _load(handle).copy(deep=False)
+
+
+def release_dataset(handle, session_id=None):
+    """
+    Drop a session's reference to a dataset.
+
+    Releasing the last reference drops the loader; the loaded frame stays
+    until it is evicted, and is reused if the dataset is acquired again.
+
+    Args:
+        handle (str): Handle from acquire_dataset
+        session_id (str): Session to release (default: current session)
+    """
+    session_id = session_id or _get_session_id()
+    with _lock:
+        sessions = _references.get(handle, {})
+        sessions.pop(session_id, None)
+        if not sessions:
+            _forget(handle)
+
+
+def invalidate_datasets(prefix=""):
+    """
+    Drop the loaded copies of datasets, so they are reloaded on next access.
+
+    Handles of referenced datasets stay valid: the next get_dataset call
+    loads fresh data. Unreferenced datasets are forgotten, referenced ones
+    once their last reference is released or expires.
+
+    Args:
+        prefix (str): Only datasets whose key starts with this (default: all)
+
+    Returns:
+        int: Number of datasets dropped
+    """
+    with _lock:
+        keys = [key for key in _entries if key.startswith(prefix)]
+        for key in keys:
+            del _entries[key]
+            if not _references.get(key):
+                _forget(key)
+        return len(keys)
+
+
+def clear_registry():
+    """
+    Drop every dataset with its loader and references, e.g. to start a benchmark cold.
+
+    Returns:
+        int: Number of loaded datasets dropped
+    """
+    with _lock:
+        count = len(_entries)
+        _entries.clear()
+        _references.clear()
+        _loaders.clear()
+        _load_locks.clear()
+        return count
+
+
+def get_registry_stats():
+    """
+    Describe the registry contents (for debugging and benchmarks).
+
+    Returns:
+        dict: "datasets", "bytes", "budget" and per-dataset "entries"
+    """
+    with _lock:
+        _expire_sessions()
+        return {
+            "datasets": len(_entries),
+            "bytes": sum(entry["bytes"] for entry in _entries.values()),
+            "budget": get_memory_budget(),
+            "entries": {
+                key: {"bytes": entry["bytes"], "references": len(_references.get(key, {}))}
+                for key, entry in _entries.items()
+            }
+        }
+
+
+def _load(key):
+    """Return the shared frame of a dataset, loading it if needed."""
+    session_id = _get_session_id()
+
+    with _lock:
+        frame = _touch(key, session_id)
+        if frame is not None:
+            return frame
+        if key not in _loaders:
+            raise KeyError(f"Unknown dataset: {key}")
+        loader, ttl = _loaders[key]
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+
+    # Load outside the registry lock; concurrent sessions wait for one load
+    with load_lock:
+        with _lock:
+            frame = _touch(key, session_id)
+            if frame is not None:
+                return frame
+
+        frame = loader()
+
+        with _lock:
+            _entries[key] = {
+                "frame": frame,
+                "bytes": int(frame.memory_usage(deep=True).sum()),
+                "loaded_at": time.time(),
+                "ttl": ttl
+            }
+            if session_id:
+                _references.setdefault(key, {})[session_id] = time.time()
+            _evict(keep=key)
+            return frame
+
+
+def _touch(key, session_id):
+    """Mark a loaded dataset as used (caller holds the lock); None if not loaded or expired."""
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+
+    if entry["ttl"] is not None and time.time() - entry["loaded_at"] > entry["ttl"]:
+        del _entries[key]
+        return None
+
+    _entries.move_to_end(key)
+    if session_id:
+        _references.setdefault(key, {})[session_id] = time.time()
+    return entry["frame"]
+
+
+def _evict(keep=None):
+    """Evict least recently used datasets until within budget (caller holds the lock)."""
+    _expire_sessions()
+    budget = get_memory_budget()
+    total = sum(entry["bytes"] for entry in _entries.values())
+
+    # Unreferenced datasets go first, then referenced ones (they can be reloaded)
+    for referenced in (False, True):
+        for key in list(_entries):
+            if total <= budget:
+                return
+            if key == keep or bool(_references.get(key)) != referenced:
+                continue
+            total -= _entries.pop(key)["bytes"]
+            _forget(key)
+
+
+def _expire_sessions():
+    """Drop references of idle sessions, forgetting datasets left unreferenced (caller holds the lock)."""
+    cutoff = time.time() - DATASET_CONFIG.get("session_timeout", 1800)
+    for key, sessions in list(_references.items()):
+        expired = [session_id for session_id, last_seen in sessions.items() if last_seen < cutoff]
+        for session_id in expired:
+            del sessions[session_id]
+        if expired and not sessions:
+            _forget(key)
+
+
+def _forget(key):
+    """Drop the loader, load lock and references of a dataset (caller holds the lock)."""
+    load_lock = _load_locks.get(key)
+    # A load in progress still needs its lock; the dataset is forgotten on a later eviction or release
+    if load_lock is not None and load_lock.locked():
+        return
+    _references.pop(key, None)
+    _loaders.pop(key, None)
+    _load_locks.pop(key, None)
+
+
+def _get_session_id():
+    """Get the ID of the current Streamlit session (None outside a session)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx else None
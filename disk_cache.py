@@ -0,0 +1,374 @@
+"""
+Disk Cache Module
+-----------------
+This module caches query results on local disk, shared by all app processes
+on a machine: with several Streamlit workers behind a load balancer, a
+result fetched by one worker is reused by the others instead of every
+process warming its own in-memory caches.
+
+Caching is opt-in per call site (run_query(..., cache=True)): only the
+dashboard and rollup queries that many sessions repeat use it, not
+row-level or ad hoc queries.
+
+- Results are stored as Arrow IPC files and read memory-mapped, so a hit
+  costs no parsing and no copy; callers that consume the Arrow table
+  directly (data_connection.run_query_arrow) never copy it at all.
+- Keys are content addressed: the SHA-256 of the data source and the query
+  text (which names the table), so equal queries share an entry.
+- A process missing a query holds an exclusive fcntl lock of that key while
+  it fetches, so another process missing the same query waits for that
+  result instead of running the query again; misses of other keys are not
+  held up. The key's lock file is removed once the result is stored.
+- Entries are written to a temporary file and renamed into place under the
+  lock of their shard, so readers never see partial files; the shard lock
+  is only held for the rename, not while fetching.
+- Entries older than the TTL (from their write time, kept in the file's
+  schema metadata) are misses.
+- The total size is kept in a counter file updated on every write, so the
+  cache is only scanned when the total crosses the budget. The least
+  recently used entries (by modification time, refreshed on every hit) are
+  then evicted under a cache-wide lock until the cache is back to
+  EVICT_TO of its budget, leaving room for the next writes.
+
+Layout under the cache folder (see DISK_CACHE_CONFIG in config.py):
+
+    {key[:2]}/{key}.arrow    one result per query
+    {key[:2]}/{key}.lock     lock of a query while it is fetched
+    {key[:2]}/.lock          lock of the shard's entries
+    .lock                    lock of the size counter, held while evicting
+    .size                    total size of the entries in bytes
+
+fcntl is POSIX-only; on other systems the cache is disabled.
+"""
+
+import hashlib
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from config import DATA_SOURCE, DISK_CACHE_CONFIG
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Schema metadata key holding the time an entry was written
+CREATED_KEY = b"disk_cache_created"
+
+# Fraction of the budget eviction frees the cache down to
+EVICT_TO = 0.9
+
+# Counters of this process
+_stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+
+
+def get_cache_dir():
+    """
+    Returns the folder the cache writes to.
+
+    Returns:
+        str: Cache folder (DISK_CACHE_PATH environment variable or config.py)
+    """
+    return os.getenv("DISK_CACHE_PATH") or DISK_CACHE_CONFIG.get("path", "data/query_cache")
+
+
+def get_size_budget():
+    """
+    Returns the size budget of the cache.
+
+    Returns:
+        int: Budget in bytes (DISK_CACHE_MAX_SIZE_MB environment variable or config.py)
+    """
+    budget_mb = os.getenv("DISK_CACHE_MAX_SIZE_MB") or DISK_CACHE_CONFIG.get("max_size_mb", 2048)
+    return int(float(budget_mb) * 1024 * 1024)
+
+
+def is_enabled(data_source=DATA_SOURCE):
+    """
+    Check whether query results of a data source are cached on disk.
+
+    Args:
+        data_source (str): Backend name (default: DATA_SOURCE)
+
+    Returns:
+        bool: True if enabled in config.py for the backend and supported here
+    """
+    return (
+        fcntl is not None
+        and DISK_CACHE_CONFIG.get("enabled", True)
+        and data_source.lower() in DISK_CACHE_CONFIG.get("backends", [])
+    )
+
+
+def make_key(query, data_source=DATA_SOURCE):
+    """
+    Content address of a query result.
+
+    Args:
+        query (str): SQL query
+        data_source (str): Backend the query runs on
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    return hashlib.sha256(f"{data_source.lower()}\n{query.strip()}".encode()).hexdigest()
+
+
+def is_cacheable(query):
+    """Only read-only queries (SELECT / WITH) are cached."""
+    words = query.split(None, 1)
+    return bool(words) and words[0].upper() in ("SELECT", "WITH")
+
+
+def cached_query(query, fetch, ttl=None):
+    """
+    Get a query result from the disk cache, fetching and storing it on a miss.
+
+    Args:
+        query (str): SQL query
+        fetch (callable): Runs the query, returning a pyarrow Table (or None,
+            which is returned without caching)
+        ttl (float): Seconds a result stays valid (default: config.py)
+
+    Returns:
+        pyarrow.Table: Query result (memory-mapped on a hit)
+    """
+    if not is_enabled() or not is_cacheable(query):
+        return fetch()
+
+    ttl = DISK_CACHE_CONFIG.get("ttl", 600) if ttl is None else ttl
+    key = make_key(query)
+    path = _entry_path(key)
+
+    table = read_entry(path, ttl)
+    if table is not None:
+        _count("hits")
+        return table
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _locked(os.path.join(os.path.dirname(path), f"{key}.lock"), remove=True):
+        # Another process may have fetched it while we waited for the lock
+        table = read_entry(path, ttl)
+        if table is not None:
+            _count("hits")
+            return table
+
+        _count("misses")
+        table = fetch()
+        if table is None:
+            return None
+        added = write_entry(path, table)
+
+    if _add_size(added) > get_size_budget():
+        evict()
+    return table
+
+
+def read_entry(path, ttl):
+    """
+    Read a cached result memory-mapped.
+
+    Args:
+        path (str): Entry file
+        ttl (float): Maximum age in seconds
+
+    Returns:
+        pyarrow.Table: The result, or None if missing, expired or unreadable
+    """
+    import pyarrow as pa
+
+    try:
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        created = float((table.schema.metadata or {}).get(CREATED_KEY, 0))
+        if time.time() - created > ttl:
+            return None
+        # Refresh the modification time: eviction removes least recently used entries
+        os.utime(path)
+        return table
+    except FileNotFoundError:
+        return None
+    except (OSError, pa.ArrowInvalid):
+        _remove(path)
+        return None
+
+
+def write_entry(path, table):
+    """
+    Write a result as an Arrow IPC file atomically.
+
+    Returns:
+        int: Change of the cache size in bytes (an expired entry is replaced)
+    """
+    import pyarrow as pa
+
+    metadata = dict(table.schema.metadata or {})
+    metadata[CREATED_KEY] = str(time.time()).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    size = os.path.getsize(tmp_path)
+
+    with _locked(os.path.join(os.path.dirname(path), ".lock")):
+        try:
+            size -= os.path.getsize(path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    _count("writes")
+    return size
+
+
+def evict(budget=None):
+    """
+    Remove least recently used entries until the cache is within EVICT_TO of its budget.
+
+    Also recounts the cache size from the files.
+
+    Args:
+        budget (int): Size budget in bytes (default: get_size_budget())
+
+    Returns:
+        int: Number of entries removed
+    """
+    budget = get_size_budget() if budget is None else budget
+    root = get_cache_dir()
+    if not os.path.isdir(root):
+        return 0
+
+    with _locked(os.path.join(root, ".lock")):
+        entries = _list_entries(root)
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= budget * EVICT_TO:
+                break
+            _remove(path)
+            total -= size
+            removed += 1
+        _write_size(root, total)
+
+    _count("evictions", removed)
+    return removed
+
+
+def clear():
+    """
+    Remove every cached result (for all processes), e.g. when the data changed.
+
+    Returns:
+        int: Number of entries removed
+    """
+    return evict(budget=0)
+
+
+def get_cache_stats():
+    """
+    Describe the cache (for debugging and benchmarks).
+
+    Returns:
+        dict: enabled, entries, bytes, budget and this process's hits,
+            misses, writes and evictions
+    """
+    root = get_cache_dir()
+    entries = _list_entries(root) if os.path.isdir(root) else []
+    with _stats_lock:
+        stats = dict(_stats)
+    return dict(
+        stats,
+        enabled=is_enabled(),
+        entries=len(entries),
+        bytes=sum(size for _, size, _ in entries),
+        budget=get_size_budget()
+    )
+
+
+def _entry_path(key):
+    """Returns the file of an entry (sharded by the first two hex digits)."""
+    return os.path.join(get_cache_dir(), key[:2], f"{key}.arrow")
+
+
+def _add_size(delta):
+    """
+    Add to the size counter of the cache (counted from the files if missing).
+
+    Args:
+        delta (int): Bytes added (negative if removed)
+
+    Returns:
+        int: New total size in bytes
+    """
+    root = get_cache_dir()
+    with _locked(os.path.join(root, ".lock")):
+        try:
+            with open(os.path.join(root, ".size")) as f:
+                total = int(f.read()) + delta
+        except (FileNotFoundError, ValueError):
+            # The counter includes the entry just written
+            total = sum(size for _, size, _ in _list_entries(root))
+        _write_size(root, total)
+    return total
+
+
+def _write_size(root, total):
+    """Store the size counter of the cache (caller holds the cache-wide lock)."""
+    with open(os.path.join(root, ".size"), "w") as f:
+        f.write(str(max(int(total), 0)))
+
+
+def _list_entries(root):
+    """List (path, size, modification time) of all entries."""
+    entries = []
+    for shard in os.scandir(root):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            if entry.name.endswith(".arrow"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+    return entries
+
+
+def _remove(path):
+    """Remove a file that may already be gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _count(name, amount=1):
+    """Add to one of this process's counters."""
+    with _stats_lock:
+        _stats[name] += amount
+
+
+@contextmanager
+def _locked(path, remove=False):
+    """
+    Hold an exclusive fcntl lock on a lock file (blocks until acquired).
+
+    Args:
+        path (str): Lock file (created if missing)
+        remove (bool): Remove the lock file before releasing it. Processes
+            already waiting on it still get the lock in turn; later ones
+            lock a new file.
+    """
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if remove:
+                _remove(path)
+            fcntl.flock(f, fcntl.LOCK_UN)
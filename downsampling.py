@@ -0,0 +1,135 @@
+"""
+Downsampling Module
+-------------------
+This module reduces long time series to a fixed number of points before
+they are sent to the browser, while keeping their visual shape.
+
+Two methods are available:
+
+- "lttb": Largest-Triangle-Three-Buckets, keeps the points that contribute
+  most to the visible shape of the line.
+- "minmax": keeps the minimum and maximum of each bucket, so every peak and
+  trough survives.
+
+Both return the indices of the points to keep, so several series sharing
+the same x axis can be reduced together.
+"""
+
+import numpy as np
+
+
+def lttb_indices(y, threshold):
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    Args:
+        y (array-like): Series values (x is taken as the position)
+        threshold (int): Number of points to keep
+
+    Returns:
+        ndarray: Sorted indices of the points to keep
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Missing values count as zero for selection only
+    y = np.nan_to_num(y)
+    x = np.arange(n, dtype=float)
+
+    # First and last points are always kept; the rest is split into buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+
+        # Average of the next bucket (or the last point)
+        next_start, next_end = end, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Pick the point forming the largest triangle with the previous
+        # selected point and the next bucket's average
+        bucket_x = x[start:end]
+        bucket_y = y[start:end]
+        areas = np.abs(
+            (x[previous] - avg_x) * (bucket_y - y[previous])
+            - (x[previous] - bucket_x) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+
+    return selected
+
+
+def minmax_indices(y, threshold):
+    """
+    Keep the minimum and maximum point of each bucket.
+
+    Args:
+        y (array-like): Series values
+        threshold (int): Maximum number of points to keep
+
+    Returns:
+        ndarray: Sorted indices of the points to keep
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 2:
+        return np.arange(n)
+
+    buckets = max(threshold // 2, 1)
+    edges = np.linspace(0, n, buckets + 1).astype(int)
+
+    # Pad the series so each bucket becomes a row of equal length
+    width = int(np.max(np.diff(edges)))
+    padded = np.full((buckets, width), np.nan)
+    positions = np.arange(n) - np.repeat(edges[:-1], np.diff(edges))
+    padded[np.repeat(np.arange(buckets), np.diff(edges)), positions] = y
+
+    with np.errstate(invalid="ignore"):
+        filled = np.where(np.isnan(padded), np.inf, padded)
+        mins = np.argmin(filled, axis=1)
+        filled = np.where(np.isnan(padded), -np.inf, padded)
+        maxs = np.argmax(filled, axis=1)
+
+    indices = np.concatenate([edges[:-1] + mins, edges[:-1] + maxs, [0, n - 1]])
+    return np.unique(np.clip(indices, 0, n - 1))
+
+
+def downsample_frame(df, value_columns, max_points, method="lttb"):
+    """
+    Reduce a frame to at most max_points rows, preserving each column's shape.
+
+    The point budget is shared between the value columns; the union of the
+    points each column needs is kept, in the original order.
+
+    Args:
+        df (DataFrame): Series ordered by x
+        value_columns (list): Columns whose shape must be preserved
+        max_points (int): Maximum number of rows to return
+        method (str): "lttb" or "minmax"
+
+    Returns:
+        tuple: (reduced DataFrame, reduction ratio = kept rows / input rows)
+    """
+    n = len(df)
+    if n <= max_points or n == 0:
+        return df, 1.0
+
+    select = {"lttb": lttb_indices, "minmax": minmax_indices}.get(method)
+    if select is None:
+        raise ValueError(f"Invalid downsampling method: {method}. Must be 'lttb' or 'minmax'")
+
+    per_column = max(max_points // max(len(value_columns), 1), 3)
+    keep = np.unique(np.concatenate([
+        select(df[col].to_numpy(dtype=float, na_value=np.nan), per_column)
+        for col in value_columns
+    ]))
+
+    return df.iloc[keep], len(keep) / n
@@ -170,7 +170,7 @@ def render_help():
     if st.button("▶️ Execute Query", type="primary"):
         if custom_query:
             with st.spinner("Executing query..."):
-                result_df = run_query(custom_query)
+                result_df = run_query(custom_query, workload="adhoc")
                 if not result_df.empty:
                     st.success(f"✅ Query returned {len(result_df)} rows")
                     st.dataframe(result_df, use_container_width=True)
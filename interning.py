@@ -0,0 +1,194 @@
+"""
+Interning Module
+----------------
+This module assigns stable integer IDs to keywords, campaigns and retailers.
+
+Each dimension has one process-wide dictionary shared by all sessions. IDs
+are handed out in order of first appearance and never change or get reused
+while the process runs, so cached frames can hold compact int32 ID columns
+instead of repeating the same Python strings in every row. Strings are only
+decoded at the render boundary (tables, charts, component payloads).
+
+Row-level query results are encoded straight from Arrow (encode_table): each
+name column is dictionary-encoded, so only its distinct values ever become
+Python strings. The performance table (performance_data.py) and the top
+movers totals (top_movers.py) keep IDs until they render. A single
+row-level frame would be a little smaller as categoricals (see
+benchmarks/bench_interning.py), but categorical codes differ from frame to
+frame; IDs are the same everywhere, so frames of different weeks, cached
+aggregates and precomputed flags are joined on them without decoding.
+
+Encoding is vectorized: a column is factorized first, so the dictionary is
+only consulted once per distinct value, not once per row.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Dimensions with their own ID space
+DIMENSIONS = ("keyword", "campaign", "retailer")
+
+# ID of missing values
+MISSING_ID = -1
+
+_dictionaries = {dimension: {"ids": {}, "values": []} for dimension in DIMENSIONS}
+_lock = threading.Lock()
+
+
+def intern_values(dimension, values):
+    """
+    Get the IDs of values, assigning new IDs to unseen values.
+
+    Args:
+        dimension (str): One of DIMENSIONS
+        values (array-like): Strings to encode (None/NaN -> MISSING_ID)
+
+    Returns:
+        ndarray: int32 IDs in the same order
+    """
+    dictionary = _get_dictionary(dimension)
+
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    unique_ids = np.empty(len(uniques), dtype=np.int32)
+
+    ids = dictionary["ids"]
+    with _lock:
+        for i, value in enumerate(uniques):
+            value = str(value)
+            value_id = ids.get(value)
+            if value_id is None:
+                value_id = len(dictionary["values"])
+                ids[value] = value_id
+                dictionary["values"].append(value)
+            unique_ids[i] = value_id
+
+    encoded = np.full(len(codes), MISSING_ID, dtype=np.int32)
+    present = codes >= 0
+    encoded[present] = unique_ids[codes[present]]
+    return encoded
+
+
+def intern_arrow(dimension, array):
+    """
+    Get the IDs of an Arrow string column without converting every row to Python.
+
+    Args:
+        dimension (str): One of DIMENSIONS
+        array (pyarrow.Array or ChunkedArray): Strings to encode (nulls -> MISSING_ID)
+
+    Returns:
+        ndarray: int32 IDs in the same order
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    encoded = pc.dictionary_encode(array)
+
+    # Only the distinct values are interned
+    unique_ids = np.append(intern_values(dimension, encoded.dictionary.to_pylist()), MISSING_ID).astype(np.int32)
+    indices = pc.fill_null(encoded.indices, -1).to_numpy(zero_copy_only=False)
+    return unique_ids[indices]
+
+
+def lookup_ids(dimension, values):
+    """
+    Get the IDs of values without assigning new ones.
+
+    Args:
+        dimension (str): One of DIMENSIONS
+        values (iterable): Strings to look up
+
+    Returns:
+        ndarray: int32 IDs (MISSING_ID for unknown values)
+    """
+    ids = _get_dictionary(dimension)["ids"]
+    return np.array([ids.get(str(value), MISSING_ID) for value in values], dtype=np.int32)
+
+
+def decode_ids(dimension, ids):
+    """
+    Convert IDs back to strings.
+
+    Args:
+        dimension (str): One of DIMENSIONS
+        ids (array-like): IDs from intern_values
+
+    Returns:
+        ndarray: Object array of strings (None for MISSING_ID)
+    """
+    values = _get_dictionary(dimension)["values"]
+    ids = np.asarray(ids, dtype=np.int64)
+
+    # Snapshot of the dictionary, plus a trailing None for MISSING_ID
+    with _lock:
+        lookup = np.empty(len(values) + 1, dtype=object)
+        lookup[:-1] = values
+    lookup[-1] = None
+    return lookup[np.where(ids >= 0, ids, len(lookup) - 1)]
+
+
+def encode_frame(df, columns):
+    """
+    Replace string columns with int32 ID columns.
+
+    Args:
+        df (DataFrame): Frame to encode
+        columns (dict): Column name -> dimension
+
+    Returns:
+        DataFrame: Copy of df with the columns holding int32 IDs
+    """
+    encoded = df.copy()
+    for column, dimension in columns.items():
+        if column in encoded.columns:
+            encoded[column] = intern_values(dimension, encoded[column])
+    return encoded
+
+
+def encode_table(table, columns):
+    """
+    Convert an Arrow query result to a DataFrame with int32 ID columns.
+
+    Args:
+        table (pyarrow.Table): Query result
+        columns (dict): Column name -> dimension
+
+    Returns:
+        DataFrame: The result with the name columns holding int32 IDs
+    """
+    names = [column for column in table.column_names if column in columns]
+    df = table.select([column for column in table.column_names if column not in columns]).to_pandas()
+    for column in names:
+        df.insert(table.column_names.index(column), column, intern_arrow(columns[column], table.column(column)))
+    return df
+
+
+def decode_frame(df, columns, categorical=False):
+    """
+    Replace int32 ID columns with their strings (render boundary).
+
+    Args:
+        df (DataFrame): Frame from encode_frame
+        columns (dict): Column name -> dimension
+        categorical (bool): Return categorical columns instead of strings
+
+    Returns:
+        DataFrame: Copy of df with decoded columns
+    """
+    decoded = df.copy()
+    for column, dimension in columns.items():
+        if column in decoded.columns:
+            values = decode_ids(dimension, decoded[column])
+            decoded[column] = pd.Categorical(values) if categorical else values
+    return decoded
+
+
+def _get_dictionary(dimension):
+    """Get the dictionary of a dimension."""
+    if dimension not in _dictionaries:
+        raise ValueError(f"Invalid dimension: {dimension}. Must be one of {list(DIMENSIONS)}")
+    return _dictionaries[dimension]
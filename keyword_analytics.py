@@ -0,0 +1,175 @@
+"""
+Keyword Analytics Module
+------------------------
+This module precomputes anomaly and trend flags for keyword performance.
+
+For every keyword the weekly CTR, CPA and ROAS are compared with a rolling
+baseline of the preceding weeks (rolling z-score). A week is flagged as
+anomalous when any metric deviates from its baseline by more than
+Z_THRESHOLD standard deviations. Trends compare the recent rolling mean with
+the one before it.
+
+The flags are computed in a batch step (refresh_keyword_flags, or
+"python keyword_analytics.py --retailer Tesco") and stored as Parquet next
+to the retailer's run store, so the Performance Data page only looks them
+up instead of computing anything at render time.
+"""
+
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from run_store import get_store_root, retailer_slug
+
+# Metrics that are checked for anomalies
+ANOMALY_METRICS = ["ctr", "cpa", "roas"]
+
+# Number of preceding weeks forming the baseline of each week
+BASELINE_WEEKS = 8
+
+# Minimum number of baseline weeks before a week can be flagged
+MIN_BASELINE_WEEKS = 4
+
+# Absolute z-score above which a week is anomalous
+Z_THRESHOLD = 2.5
+
+# Relative change of the recent mean that counts as a trend (10%)
+TREND_THRESHOLD = 0.10
+
+# Weeks in the recent window of the trend comparison
+TREND_WEEKS = 4
+
+
+def get_flags_path(retailer):
+    """
+    Returns the path of a retailer's keyword flags file.
+
+    Args:
+        retailer (str): Retailer name
+
+    Returns:
+        str: Path of keyword_flags.parquet
+    """
+    return os.path.join(get_store_root(), retailer_slug(retailer), "analytics", "keyword_flags.parquet")
+
+
+def compute_keyword_flags(history):
+    """
+    Compute anomaly and trend flags for every keyword and week.
+
+    Args:
+        history (DataFrame): Weekly totals per keyword with columns keyword,
+            week, impressions, clicks, spend, sales_count, sales_value
+
+    Returns:
+        DataFrame: One row per keyword and week with the metrics, their
+            z-scores ("<metric>_z"), anomaly flags ("<metric>_anomaly"),
+            trends ("<metric>_trend": 1 up, -1 down, 0 flat), "anomalous"
+            and "anomaly_score" (largest absolute z-score)
+    """
+    if history.empty:
+        return pd.DataFrame(columns=["keyword", "week", "anomalous", "anomaly_score"])
+
+    df = history.copy()
+    df["week"] = pd.to_datetime(df["week"], errors="coerce").dt.strftime("%Y-%m-%d")
+    df = df.dropna(subset=["week"]).sort_values(["keyword", "week"], ignore_index=True)
+
+    # Ratios are derived from weekly totals, so they stay correct when a
+    # keyword appears in several campaigns
+    impressions = df["impressions"].astype(float)
+    clicks = df["clicks"].astype(float)
+    spend = df["spend"].astype(float)
+    df["ctr"] = (clicks / impressions.replace(0, np.nan)) * 100
+    df["cpa"] = spend / df["sales_count"].astype(float).replace(0, np.nan)
+    df["roas"] = df["sales_value"].astype(float) / spend.replace(0, np.nan)
+
+    grouped = df.groupby("keyword", sort=False)
+    for metric in ANOMALY_METRICS:
+        # Baseline = preceding weeks only, so this week never hides itself
+        previous = grouped[metric].shift(1)
+        rolling = previous.groupby(df["keyword"], sort=False).rolling(
+            BASELINE_WEEKS, min_periods=MIN_BASELINE_WEEKS
+        )
+        mean = rolling.mean().reset_index(level=0, drop=True)
+        std = rolling.std().reset_index(level=0, drop=True)
+
+        z = (df[metric] - mean) / std.replace(0, np.nan)
+        df[f"{metric}_z"] = z.round(3)
+        df[f"{metric}_anomaly"] = z.abs() >= Z_THRESHOLD
+
+        recent = grouped[metric].transform(lambda s: s.rolling(TREND_WEEKS, min_periods=1).mean())
+        earlier = recent.groupby(df["keyword"], sort=False).shift(TREND_WEEKS)
+        change = (recent - earlier) / earlier.abs().replace(0, np.nan)
+        df[f"{metric}_trend"] = np.select(
+            [change >= TREND_THRESHOLD, change <= -TREND_THRESHOLD], [1, -1], default=0
+        ).astype("int8")
+
+    z_columns = [f"{metric}_z" for metric in ANOMALY_METRICS]
+    df["anomaly_score"] = df[z_columns].abs().max(axis=1).fillna(0.0)
+    df["anomalous"] = df[[f"{metric}_anomaly" for metric in ANOMALY_METRICS]].any(axis=1)
+
+    return df
+
+
+def refresh_keyword_flags(retailer):
+    """
+    Recompute and store the keyword flags of a retailer (batch step).
+
+    Args:
+        retailer (str): Retailer name
+
+    Returns:
+        DataFrame: The stored flags
+    """
+    from data_queries import get_keyword_history
+
+    flags = compute_keyword_flags(get_keyword_history(retailer))
+
+    path = get_flags_path(retailer)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    flags.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+    return flags
+
+
+def get_week_flags(retailer, week):
+    """
+    Get the stored flags of one week as a keyword lookup.
+
+    Args:
+        retailer (str): Retailer name
+        week (str): Week commencing date ("YYYY-MM-DD")
+
+    Returns:
+        dict: keyword -> flag record (empty if no flags were computed yet)
+    """
+    path = get_flags_path(retailer)
+    if not os.path.exists(path):
+        return {}
+
+    # The file's modification time is part of the cache key, so a refresh
+    # is picked up immediately
+    return _load_week_flags(path, os.path.getmtime(path), week)
+
+
+@st.cache_data(show_spinner=False)
+def _load_week_flags(path, mtime, week):
+    """Read one week of a flags file into a keyword lookup (cached)."""
+    flags = pd.read_parquet(path, filters=[("week", "==", week)])
+    return flags.set_index("keyword").to_dict("index")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Precompute keyword anomaly and trend flags.")
+    parser.add_argument("--retailer", required=True, help="Retailer name")
+    args = parser.parse_args()
+
+    result = refresh_keyword_flags(args.retailer)
+    print(f"Stored {len(result):,} keyword weeks ({int(result['anomalous'].sum()):,} anomalous) "
+          f"at {get_flags_path(args.retailer)}")
@@ -0,0 +1,220 @@
+"""
+Keyword Search Module
+---------------------
+This module provides an in-process search index over all keywords.
+
+Keywords are normalized (lower case, single spaces), sorted and numbered;
+a keyword's ID is its position in the index. Two lookups are combined:
+
+- Prefix matching: keywords sharing a prefix form a contiguous range of the
+  sorted list, found with two binary searches.
+- Trigram matching: every word is padded and split into 3-character grams.
+  Keywords containing enough of the query's grams match, ranked by the
+  Jaccard similarity of the two gram sets. This tolerates typos ("pringel"
+  finds "Pringles Original").
+
+The index is built once per process (st.cache_resource) and shared by all
+sessions; a search returns matching IDs in milliseconds.
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+import streamlit as st
+
+# Selectbox option that filters on every keyword matching the search
+ALL_MATCHES_LABEL = "All matching keywords"
+
+# Minimum share of the query's trigrams a fuzzy match must contain (0-1)
+MIN_SIMILARITY = 0.5
+
+# Maximum number of matches returned by default
+SEARCH_LIMIT = 200
+
+# How long the index is kept before keywords are reloaded (seconds)
+INDEX_TTL = 3600
+
+
+def normalize_keyword(text):
+    """
+    Normalize a keyword or query for matching.
+
+    Args:
+        text (str): Keyword or query
+
+    Returns:
+        str: Lower-case text with single spaces
+    """
+    return " ".join(str(text).lower().split())
+
+
+def get_trigrams(text):
+    """
+    Split normalized text into padded word trigrams.
+
+    Args:
+        text (str): Normalized text
+
+    Returns:
+        set: Trigrams, e.g. "  p", " pr", "pri", ... for "pringle"
+    """
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def build_keyword_index(keywords):
+    """
+    Build a search index over keywords.
+
+    Args:
+        keywords (iterable): Keyword strings (duplicates are dropped)
+
+    Returns:
+        dict: Index with "keywords" (display values by ID), "normalized"
+            (sorted normalized values), "postings" (trigram -> ID array)
+            and "gram_counts" (number of trigrams per ID)
+    """
+    unique = {}
+    for keyword in keywords:
+        if keyword is None:
+            continue
+        unique.setdefault(normalize_keyword(keyword), str(keyword))
+
+    normalized = sorted(unique)
+    postings = {}
+    gram_counts = np.zeros(len(normalized), dtype=np.int32)
+
+    for keyword_id, text in enumerate(normalized):
+        grams = get_trigrams(text)
+        gram_counts[keyword_id] = len(grams)
+        for gram in grams:
+            postings.setdefault(gram, []).append(keyword_id)
+
+    return {
+        "keywords": [unique[text] for text in normalized],
+        "normalized": normalized,
+        "postings": {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()},
+        "gram_counts": gram_counts
+    }
+
+
+def search_keywords(index, query, limit=SEARCH_LIMIT, min_similarity=MIN_SIMILARITY):
+    """
+    Find the IDs of keywords matching a query.
+
+    Prefix matches come first (alphabetically), followed by fuzzy matches
+    ordered by trigram similarity.
+
+    Args:
+        index (dict): Output of build_keyword_index
+        query (str): Search text
+        limit (int): Maximum number of IDs to return
+        min_similarity (float): Minimum share of the query's trigrams in a fuzzy match
+
+    Returns:
+        ndarray: Matching keyword IDs, best first
+    """
+    normalized = index["normalized"]
+    text = normalize_keyword(query)
+    if not text:
+        return np.arange(min(limit, len(normalized)))
+
+    # Prefix matches are a contiguous range of the sorted keywords
+    start = bisect_left(normalized, text)
+    end = bisect_left(normalized, text + "\uffff")
+    prefix_ids = np.arange(start, min(end, start + limit))
+
+    # Fuzzy matches: count shared trigrams per keyword in one pass
+    grams = get_trigrams(text)
+    postings = [index["postings"][gram] for gram in grams if gram in index["postings"]]
+    if not postings or len(prefix_ids) >= limit:
+        return prefix_ids
+
+    shared = np.bincount(np.concatenate(postings), minlength=len(normalized))
+    candidates = np.flatnonzero(shared)
+    overlap = shared[candidates]
+
+    keep = (overlap / len(grams) >= min_similarity) & ((candidates < start) | (candidates >= end))
+    candidates, overlap = candidates[keep], overlap[keep]
+    similarity = overlap / (len(grams) + index["gram_counts"][candidates] - overlap)
+    fuzzy_ids = candidates[np.argsort(-similarity, kind="stable")]
+
+    return np.concatenate([prefix_ids, fuzzy_ids])[:limit].astype(np.int32)
+
+
+def get_keywords_by_id(index, keyword_ids):
+    """
+    Convert keyword IDs to keyword strings.
+
+    Args:
+        index (dict): Output of build_keyword_index
+        keyword_ids (array-like): Keyword IDs
+
+    Returns:
+        list: Keywords in the same order
+    """
+    keywords = index["keywords"]
+    return [keywords[keyword_id] for keyword_id in keyword_ids]
+
+
+@st.cache_resource(ttl=INDEX_TTL, show_spinner=False)
+def get_keyword_index():
+    """
+    Get the search index over all keywords (built once per process).
+
+    Returns:
+        dict: Output of build_keyword_index
+
+    Raises:
+        ValueError: If no keywords could be loaded (failures are not cached)
+    """
+    from data_queries import get_available_keywords
+
+    keywords = [k for k in get_available_keywords() if k != "All Keywords"]
+    if not keywords:
+        raise ValueError("No keywords available")
+    return build_keyword_index(keywords)
+
+
+def get_keyword_options(query="", fallback=None):
+    """
+    Build the options of a keywords selectbox for a search.
+
+    Args:
+        query (str): Search text ("" lists keywords alphabetically)
+        fallback (list): Options used when the index cannot be loaded
+
+    Returns:
+        list: "All Keywords", ALL_MATCHES_LABEL (when searching) and the matches
+    """
+    try:
+        index = get_keyword_index()
+    except ValueError:
+        return fallback or ["All Keywords"]
+
+    matches = get_keywords_by_id(index, search_keywords(index, query))
+    if normalize_keyword(query) and matches:
+        return ["All Keywords", ALL_MATCHES_LABEL] + matches
+    return ["All Keywords"] + matches
+
+
+def resolve_keyword_filter(selection, query=""):
+    """
+    Convert a keywords selectbox value to a filter for the data queries.
+
+    Args:
+        selection (str): Selected option
+        query (str): Current search text
+
+    Returns:
+        str or list: The selected keyword, or every match of the search for
+            ALL_MATCHES_LABEL (used as an IN-list filter)
+    """
+    if selection != ALL_MATCHES_LABEL:
+        return selection
+
+    index = get_keyword_index()
+    return get_keywords_by_id(index, search_keywords(index, query))
@@ -2,40 +2,114 @@
 KPI Tiles Component
 -------------------
 React component for rendering KPI grid tiles.
+
+Any number of grids are rendered in one iframe. The first render of the
+component sends every grid in full; after that only the values that changed
+since the previous run are sent, tagged with the revision they apply to.
+If the frontend doesn't hold that revision (e.g. the iframe was reloaded),
+it asks for a resync and the next run sends the grids in full again.
 """
 
 import os
-import streamlit.components.v1 as components
+from functools import lru_cache
 
 # Use production build
 parent_dir = os.path.dirname(os.path.abspath(__file__))
 build_dir = os.path.join(parent_dir, "frontend", "build")
 
-_component_func = components.declare_component("kpi_tiles", path=build_dir)
+# Initial frame height of one grid and the gap between grids (px);
+# the frontend sets the exact height once rendered
+GRID_HEIGHT = 160
+GRID_GAP = 8
+
+
+@lru_cache(maxsize=None)
+def _get_component_func():
+    """Declare the component on first render (once per process)."""
+    import streamlit.components.v1 as components
+    
+    return components.declare_component("kpi_tiles", path=build_dir)
+
+
+def get_layout(grids):
+    """Labels and primary flags of the grids (everything but the values)."""
+    return [[(item["label"], item["is_primary"]) for item in grid] for grid in grids]
 
 
-def kpi_tiles(grid_data, key=None):
+def get_values(grids):
+    """Values of the grids as "grid:item" -> value."""
+    return {
+        f"{g}:{i}": item["value"]
+        for g, grid in enumerate(grids)
+        for i, item in enumerate(grid)
+    }
+
+
+def build_payload(grids, sent, full):
+    """
+    Build the component arguments for this run.
+    
+    Args:
+        grids (list): Grids of KPI items
+        sent (dict): What the previous run sent (revision, layout, values), or None
+        full (bool): Send every grid in full regardless of what was sent
+    
+    Returns:
+        tuple: (component arguments, new sent state)
+    """
+    layout = get_layout(grids)
+    values = get_values(grids)
+    
+    if full or not sent or sent["layout"] != layout:
+        revision = (sent["revision"] + 1) if sent else 1
+        args = {"revision": revision, "grids": grids}
+    else:
+        updates = {cell: value for cell, value in values.items() if sent["values"].get(cell) != value}
+        # Unchanged values keep the revision, so the arguments stay identical
+        revision = sent["revision"] + 1 if updates else sent["revision"]
+        args = {"revision": revision, "base": sent["revision"], "updates": updates}
+    
+    return args, {"revision": revision, "layout": layout, "values": values}
+
+
+def kpi_tiles(grids, key=None):
     """
     Render KPI tiles component.
     
     Args:
-        grid_data (list): List of KPI items [{"label": str, "value": str, "is_primary": bool}, ...]
-        key (str): Unique key for the component
+        grids (list): List of grids, each a list of KPI items
+            [{"label": str, "value": str, "is_primary": bool}, ...]
+        key (str): Unique key for the component (required to send only changed values)
     
     Returns:
         None
     """
-    if _component_func is None:
-        return None
+    import streamlit as st
     
     try:
-        return _component_func(
-            grid_data=grid_data,
+        sent_key = f"{key}_sent"
+        requested = st.session_state.get(key) if key else None
+        
+        # Send in full when the component wasn't rendered in the previous run
+        # (new iframe) or the frontend asked for a resync
+        full = (
+            key is None
+            or key not in st.session_state
+            or bool(requested and requested.get("resync") != st.session_state.get(f"{key}_resync"))
+        )
+        if requested:
+            st.session_state[f"{key}_resync"] = requested.get("resync")
+        
+        args, sent = build_payload(grids, None if key is None else st.session_state.get(sent_key), full)
+        if key is not None:
+            st.session_state[sent_key] = sent
+        
+        return _get_component_func()(
+            **args,
             key=key,
             default=None,
-            height=160
+            height=len(grids) * GRID_HEIGHT + max(len(grids) - 1, 0) * GRID_GAP
         )
     except Exception as e:
         print(f"[KPI Tiles] Error: {e}")
         return None
-
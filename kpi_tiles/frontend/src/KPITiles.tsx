@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from "react"
+import React, { useEffect, useRef, useState } from "react"
 import { Streamlit } from "streamlit-component-lib"
 import "./KPITiles.css"
 
@@ -8,57 +8,96 @@ interface KPIItem {
   is_primary: boolean
 }
 
+// Either every grid in full, or the values changed since revision `base`
+// ("grid:item" -> value)
 interface ComponentProps {
-  grid_data: KPIItem[]
+  revision: number
+  grids?: KPIItem[][]
+  base?: number
+  updates?: { [cell: string]: string }
 }
 
+const renderCell = (item: KPIItem | undefined) =>
+  item?.label && item?.value
+    ? <><div className="kpi-label">{item.label}</div><div className="kpi-value">{item.value}</div></>
+    : <span>&nbsp;</span>
+
 const KPITiles: React.FC = () => {
-  const [componentProps, setComponentProps] = useState<ComponentProps | null>(null)
+  const [grids, setGrids] = useState<KPIItem[][] | null>(null)
+  const revision = useRef<number | null>(null)
 
   useEffect(() => {
     Streamlit.setComponentReady()
-    // Set exact height to avoid extra margins
-    Streamlit.setFrameHeight(160)
-    
+
     Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, onRender)
-    
+
     return () => {
       Streamlit.events.removeEventListener(Streamlit.RENDER_EVENT, onRender)
     }
   }, [])
 
+  // Fit the frame to the rendered grids
+  useEffect(() => {
+    Streamlit.setFrameHeight()
+  }, [grids])
+
   const onRender = (event: any): void => {
-    const data = event.detail
-    const props = data.args as ComponentProps
-    setComponentProps(props)
+    const props = event.detail.args as ComponentProps
+
+    if (props.grids) {
+      revision.current = props.revision
+      setGrids(props.grids)
+    } else if (props.base === revision.current) {
+      revision.current = props.revision
+      const updates = Object.entries(props.updates || {})
+      if (updates.length > 0) {
+        setGrids(current => {
+          const next = (current || []).map(grid => grid.map(item => ({ ...item })))
+          updates.forEach(([cell, value]) => {
+            const [g, i] = cell.split(":").map(Number)
+            if (next[g] && next[g][i]) {
+              next[g][i].value = value
+            }
+          })
+          return next
+        })
+      }
+    } else if (props.revision !== revision.current) {
+      // Changes against a revision we don't hold: ask for every grid in full
+      Streamlit.setComponentValue({ resync: Date.now() })
+    }
   }
 
-  if (!componentProps || !componentProps.grid_data) {
+  if (!grids) {
     return null
   }
 
-  // Always render as 3x2 grid
-  const grid = componentProps.grid_data.slice(0, 6)
-  
+  // Each grid renders as 3x2
   return (
-    <div className="kpi-tiles-wrapper">
-      <table className="kpi-grid">
-        <tbody>
-          <tr>
-            <td>{grid[0]?.label && grid[0]?.value ? <><div className="kpi-label">{grid[0].label}</div><div className="kpi-value">{grid[0].value}</div></> : <span>&nbsp;</span>}</td>
-            <td>{grid[1]?.label && grid[1]?.value ? <><div className="kpi-label">{grid[1].label}</div><div className="kpi-value">{grid[1].value}</div></> : <span>&nbsp;</span>}</td>
-            <td className="last-col">{grid[2]?.label && grid[2]?.value ? <><div className="kpi-label">{grid[2].label}</div><div className="kpi-value">{grid[2].value}</div></> : <span>&nbsp;</span>}</td>
-          </tr>
-          <tr className="last-row">
-            <td>{grid[3]?.label && grid[3]?.value ? <><div className="kpi-label">{grid[3].label}</div><div className="kpi-value">{grid[3].value}</div></> : <span>&nbsp;</span>}</td>
-            <td>{grid[4]?.label && grid[4]?.value ? <><div className="kpi-label">{grid[4].label}</div><div className="kpi-value">{grid[4].value}</div></> : <span>&nbsp;</span>}</td>
-            <td className="last-col">{grid[5]?.label && grid[5]?.value ? <><div className="kpi-label">{grid[5].label}</div><div className="kpi-value">{grid[5].value}</div></> : <span>&nbsp;</span>}</td>
-          </tr>
-        </tbody>
-      </table>
+    <div className="kpi-tiles">
+      {grids.map((items, g) => {
+        const grid = items.slice(0, 6)
+        return (
+          <div className="kpi-tiles-wrapper" key={g}>
+            <table className="kpi-grid">
+              <tbody>
+                <tr>
+                  <td>{renderCell(grid[0])}</td>
+                  <td>{renderCell(grid[1])}</td>
+                  <td className="last-col">{renderCell(grid[2])}</td>
+                </tr>
+                <tr className="last-row">
+                  <td>{renderCell(grid[3])}</td>
+                  <td>{renderCell(grid[4])}</td>
+                  <td className="last-col">{renderCell(grid[5])}</td>
+                </tr>
+              </tbody>
+            </table>
+          </div>
+        )
+      })}
     </div>
   )
 }
 
 export default KPITiles
-
@@ -0,0 +1,139 @@
+"""
+Live Refresh Module
+-------------------
+This module implements the dashboard's opt-in live refresh mode.
+
+While it is on, a small fragment reruns every LIVE_REFRESH_CONFIG
+["interval_seconds"] and polls a cheap watermark of the performance table
+(see get_data_watermark). The watermark is shared by all sessions of the
+process, so however many dashboards are open it is queried about once per
+interval. Nothing else reruns on a tick.
+
+Only when the watermark changes are the data caches cleared (REFRESHED_CACHES,
+the week totals of the dataset registry and the disk cache). Each session
+then reruns once to render the new data; sessions that have not seen the new
+watermark yet follow on their next tick.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from importlib import import_module
+
+import streamlit as st
+from config import LIVE_REFRESH_CONFIG
+
+# Cached functions holding data of the performance table: (module, function)
+REFRESHED_CACHES = [
+    ("charts", "get_latest_week"),
+    ("charts", "load_chart_series"),
+    ("charts", "get_chart_figure"),
+    ("charts", "load_comparison_series"),
+    ("charts", "get_comparison_figure"),
+    ("dashboard", "load_kpi_metrics"),
+    ("performance_data", "get_keyword_metrics"),
+    ("top_movers", "get_top_movers"),
+    ("keyword_search", "get_keyword_index")
+]
+
+# Dataset registry keys reloaded on change (prefixes)
+REFRESHED_DATASETS = ["week_totals:"]
+
+# Last watermark seen by this process and when it was queried
+_watermark = {"value": None, "checked_at": 0.0}
+_lock = threading.Lock()
+
+
+def get_refresh_interval():
+    """
+    Returns the polling interval of live refresh.
+
+    Returns:
+        float: Seconds (LIVE_REFRESH_INTERVAL environment variable or config.py)
+    """
+    return float(os.getenv("LIVE_REFRESH_INTERVAL") or LIVE_REFRESH_CONFIG.get("interval_seconds", 60))
+
+
+def check_watermark(max_age=None):
+    """
+    Get the current data watermark, clearing the data caches if it changed.
+
+    The watermark is only queried if the last check of this process is older
+    than max_age; concurrent callers wait for one query.
+
+    Args:
+        max_age (float): Seconds a checked watermark is reused (default: the interval)
+
+    Returns:
+        tuple: Watermark (see get_data_watermark), or None if never available
+    """
+    from data_queries import get_data_watermark
+
+    max_age = get_refresh_interval() if max_age is None else max_age
+
+    with _lock:
+        if time.time() - _watermark["checked_at"] < max_age:
+            return _watermark["value"]
+
+        watermark = get_data_watermark()
+        _watermark["checked_at"] = time.time()
+
+        # Keep the last known watermark if the query failed
+        if watermark is None:
+            return _watermark["value"]
+
+        previous = _watermark["value"]
+        _watermark["value"] = watermark
+
+    if previous is not None and watermark != previous:
+        invalidate_caches()
+    return watermark
+
+
+def invalidate_caches():
+    """Clear the cached data of the performance table (all sessions and processes)."""
+    import disk_cache
+    from dataset_registry import invalidate_datasets
+
+    if disk_cache.is_enabled():
+        disk_cache.clear()
+
+    for module, function in REFRESHED_CACHES:
+        getattr(import_module(module), function).clear()
+
+    for prefix in REFRESHED_DATASETS:
+        invalidate_datasets(prefix)
+
+
+def render_live_refresh(key="live_refresh"):
+    """
+    Render the live refresh toggle and, while it is on, the watermark poller.
+
+    Args:
+        key (str): Key of the toggle; the session's last seen watermark is
+            kept under f"{key}_watermark"
+    """
+    if not st.toggle("Live refresh", value=False, key=key,
+                     help="Check for new data periodically and update the dashboard when it changes"):
+        st.session_state.pop(f"{key}_watermark", None)
+        return
+
+    interval = get_refresh_interval()
+    st.fragment(run_every=interval)(_poll_watermark)(key, interval)
+
+
+def _poll_watermark(key, interval):
+    """Fragment body: rerun the app once when the data watermark changed."""
+    # A little under the interval, so ticks arriving early still query
+    watermark = check_watermark(interval * 0.9)
+    seen_key = f"{key}_watermark"
+
+    if watermark is not None:
+        seen = st.session_state.get(seen_key)
+        st.session_state[seen_key] = watermark
+        if seen is not None and seen != watermark:
+            st.rerun()
+
+    latest = f"data to week of {watermark[0]}" if watermark and watermark[0] else "no data"
+    st.caption(f"Live: {latest}, checked {datetime.now().strftime('%H:%M:%S')}")
@@ -5,55 +5,12 @@ This module contains the Model Run Results page component.
 """
 
 import streamlit as st
-import pandas as pd
 
 
 def render_model_run_results():
     """
     Render the Model Run Results page content.
     """
-    # Add page background and styling to match Dashboard
-    st.markdown("""
-        <style>
-        /* Light grey background for entire page */
-        [data-testid="stAppViewContainer"] {
-            background-color: #FCFCFC !important;
-        }
-        
-        /* White container for main content with border shadow */
-        section[data-testid="stMain"] > div:first-child {
-            background-color: white;
-            border-radius: 12px;
-            padding: 32px;
-            margin: 24px;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            border: 1px solid #E5E7EB;
-            max-width: 100%;
-            overflow-x: hidden;
-        }
-        
-        /* Prevent horizontal scroll */
-        [data-testid="stAppViewContainer"] {
-            overflow-x: hidden !important;
-        }
-        section[data-testid="stMain"] {
-            overflow-x: hidden !important;
-        }
-        
-        /* Custom background color for sidebar */
-        section[data-testid="stSidebar"] {
-            background-color: #FCFCFC !important;
-            border-right: 1px solid #E5E7EB;
-        }
-        
-        /* Ensure columns fit within viewport */
-        [data-testid="column"] {
-            max-width: 100% !important;
-            overflow-x: hidden !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Header Section
     render_model_run_header()
     
@@ -84,16 +41,6 @@ def render_model_run_header():
 def render_model_run_filters():
     """Render the filter dropdowns section."""
     st.markdown("""
-        <style>
-        /* Reduce width of filter dropdowns */
-        .stSelectbox {
-            max-width: 200px !important;
-        }
-        /* Reduce spacing between sections */
-        div[data-testid="stVerticalBlock"] > div {
-            margin-bottom: 0px !important;
-        }
-        </style>
         <div style="margin-bottom: 24px; margin-top: 0px;">
     """, unsafe_allow_html=True)
     
@@ -101,17 +48,21 @@ def render_model_run_filters():
     col1, col2, col3 = st.columns([1, 1, 6])
     
     with col1:
-        st.selectbox(
+        retailer = st.selectbox(
             "Retailer",
             ["Tesco", "Sainsbury's", "Asda", "Morrisons"],
             index=0,
             key="retailer_filter_model"
         )
     
+    # Dates that have saved runs for the selected retailer
+    runs = get_saved_runs(retailer)
+    dates = sorted(runs["created_at"].str[:10].unique().tolist(), reverse=True) if not runs.empty else []
+    
     with col2:
         st.selectbox(
             "Date",
-            ["2024-09-23", "2024-09-22", "2024-09-21", "2024-09-20"],
+            ["All Dates"] + dates,
             index=0,
             key="date_filter_model"
         )
@@ -119,96 +70,138 @@ def render_model_run_filters():
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+def get_saved_runs(retailer):
+    """
+    Get the saved model runs of a retailer, newest first.
+    
+    Args:
+        retailer (str): Retailer name
+    
+    Returns:
+        DataFrame: Run metadata (empty if none or the store is unreadable)
+    """
+    import pandas as pd
+    from run_store import list_runs
+    
+    try:
+        return list_runs(retailer)
+    except Exception as e:
+        st.error(f"Failed to load model runs: {str(e)}")
+        return pd.DataFrame(columns=["run_id", "retailer", "created_at", "rows", "status"])
+
+
 def render_model_run_table():
     """Render the model run results table using custom component."""
     from performance_table import performance_table
     
-    # Create sample data with button objects
+    retailer = st.session_state.get("retailer_filter_model", "Tesco")
+    date = st.session_state.get("date_filter_model", "All Dates")
+    
+    runs = get_saved_runs(retailer)
+    if date != "All Dates":
+        runs = runs[runs["created_at"].str[:10] == date]
+    
+    if runs.empty:
+        st.info(f"No model runs saved for {retailer} yet. Run the model from the Upload Keyword page.")
+        return
+    
+    # One row per saved run, with button objects
     table_data = [
         {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
-        },
-        {
-            "Retailer": "Tesco",
-            "Timestamp": "2024-09-23 14:30:00",
-            "View Results": {"type": "button", "label": "View Results", "variant": "primary"},
-            "Rows Processed": "250",
-            "Status": "Completed",
-            "Download": {"type": "button", "label": "Download", "variant": "secondary"}
+            "Retailer": run["retailer"],
+            "Timestamp": run["created_at"].replace("T", " "),
+            "View Results": {"type": "button", "label": "View Results", "variant": "primary", "action": "view", "row_id": run["run_id"]},
+            "Rows Processed": str(run["rows"]),
+            "Status": run["status"],
+            "Download": {"type": "button", "label": "Download", "variant": "secondary", "action": "download", "row_id": run["run_id"]}
         }
+        for run in runs.to_dict("records")
     ]
     
     # Render the custom performance table component with buttons
-    performance_table(data=table_data, key="model_run_results_table")
+    clicked = performance_table(data=table_data, key="model_run_results_table")
+    
+    # A clicked row button selects that run for viewing / downloading
+    if clicked and clicked.get("row_id") in runs["run_id"].values:
+        if st.session_state.get("model_run_last_click") != clicked:
+            st.session_state["model_run_last_click"] = clicked
+            st.session_state["selected_model_run"] = clicked["row_id"]
+            st.session_state["show_model_run_results"] = clicked.get("action") == "view"
+    
+    render_run_download(retailer, runs)
+    
+    render_run_comparison(retailer, runs)
+
+
+def render_run_download(retailer, runs):
+    """Render the download controls for the selected run."""
+    from run_downloads import DOWNLOAD_FORMATS, prepare_run_download, get_download_file_name
+    from run_store import load_run
+    
+    run_ids = runs["run_id"].tolist()
+    if st.session_state.get("selected_model_run") not in run_ids:
+        st.session_state["selected_model_run"] = run_ids[0]
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        run_id = st.selectbox("Run", run_ids, key="selected_model_run")
+    
+    with col2:
+        file_format = st.selectbox(
+            "Format",
+            list(DOWNLOAD_FORMATS),
+            format_func=str.upper,
+            key="model_run_download_format"
+        )
+    
+    with col3:
+        st.markdown("<div style='height: 28px;'></div>", unsafe_allow_html=True)
+        
+        def read_download():
+            # Deferred: prepared (once per run and format) and read only when clicked
+            with open(prepare_run_download(retailer, run_id, file_format), "rb") as f:
+                return f.read()
+        
+        st.download_button(
+            "📥 Download",
+            data=read_download,
+            file_name=get_download_file_name(retailer, run_id, file_format),
+            mime=DOWNLOAD_FORMATS[file_format][1],
+            key="model_run_download"
+        )
+    
+    if st.session_state.get("show_model_run_results"):
+        results = load_run(retailer, run_id)
+        if results is not None:
+            st.dataframe(results, use_container_width=True, hide_index=True)
+
+
+def render_run_comparison(retailer, runs):
+    """Render a comparison of the bids of two saved runs."""
+    from run_store import diff_runs
+    
+    if len(runs) < 2:
+        return
+    
+    with st.expander("Compare runs"):
+        run_ids = runs["run_id"].tolist()
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            run_a = st.selectbox("Earlier run", run_ids, index=1, key="compare_run_a")
+        
+        with col2:
+            run_b = st.selectbox("Later run", run_ids, index=0, key="compare_run_b")
+        
+        try:
+            diff = diff_runs(retailer, run_a, run_b)
+        except Exception as e:
+            st.error(f"Failed to compare runs: {str(e)}")
+            return
+        
+        st.caption(f"{len(diff)} keys with a different bid")
+        st.dataframe(diff, use_container_width=True, hide_index=True)
 
 
 def render_model_run_pagination():
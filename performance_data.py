@@ -5,55 +5,34 @@ This module contains the Performance Data page component.
 """
 
 import streamlit as st
-import pandas as pd
+
+# Seconds the keyword metrics of a filter selection are cached
+TABLE_CACHE_TTL = 300
+
+# Keywords per table page
+PAGE_SIZE = 25
+
+# Table columns: (column, result column, aggregation, format)
+# Counts and amounts are summed per keyword, rates and ratios averaged
+TABLE_COLUMNS = [
+    ("Impressions", "impressions", "sum", "number"),
+    ("*CPA", "cpa", "mean", "decimal"),
+    ("Avg. Rank", "avg_rank", "mean", "decimal"),
+    ("CTR", "ctr", "mean", "percent"),
+    ("Conversion Rate", "conversion_rate", "mean", "percent"),
+    ("Click", "clicks", "sum", "number"),
+    ("ROAS", "roas", "mean", "decimal"),
+    ("*CPC", "cpc", "mean", "decimal"),
+    ("Sales (Con)", "sales_count", "sum", "number"),
+    ("*Sales (Rev)", "sales_value", "sum", "number"),
+    ("*Spend", "spend", "sum", "number")
+]
 
 
 def render_performance_data():
     """
     Render the Performance Data page content.
     """
-    # Add page background and styling to match Dashboard
-    st.markdown("""
-        <style>
-        /* Light grey background for entire page */
-        [data-testid="stAppViewContainer"] {
-            background-color: #FCFCFC !important;
-        }
-        
-        /* White container for main content with border shadow */
-        section[data-testid="stMain"] > div:first-child {
-            background-color: white;
-            border-radius: 12px;
-            padding: 32px;
-            margin: 24px;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            border: 1px solid #E5E7EB;
-            max-width: 100%;
-            overflow-x: hidden;
-        }
-        
-        /* Prevent horizontal scroll */
-        [data-testid="stAppViewContainer"] {
-            overflow-x: hidden !important;
-        }
-        section[data-testid="stMain"] {
-            overflow-x: hidden !important;
-        }
-        
-        /* Custom background color for sidebar */
-        section[data-testid="stSidebar"] {
-            background-color: #FCFCFC !important;
-            border-right: 1px solid #E5E7EB;
-        }
-        
-        /* Ensure columns fit within viewport */
-        [data-testid="column"] {
-            max-width: 100% !important;
-            overflow-x: hidden !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Header Section
     render_performance_data_header()
     
@@ -88,43 +67,42 @@ def render_performance_data_header():
         """, unsafe_allow_html=True)
     
     with col2:
-        # Export Report Data Button
-        st.markdown("""
-            <div style="display: flex; justify-content: flex-end; align-items: flex-start; margin-top: 8px;">
-                <button style="
-                    background-color: #9333EA;
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 10px 16px;
-                    font-family: 'Gilroy', sans-serif;
-                    font-weight: 500;
-                    font-size: 14px;
-                    cursor: pointer;
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                ">
-                    <span>📥</span>
-                    <span>Export Report Data</span>
-                </button>
-            </div>
-        """, unsafe_allow_html=True)
+        # Export Report Data - exports the currently filtered data
+        from data_queries import build_performance_query
+        from report_export import render_export_controls
+        
+        query = build_performance_query(
+            retailer=st.session_state.get("retailer_filter_perf"),
+            campaign=st.session_state.get("campaign_filter_perf"),
+            keyword=get_keyword_filter(),
+            week=st.session_state.get("week_filter_perf")
+        )
+        render_export_controls(
+            query,
+            key="performance_export",
+            label="Export Report Data",
+            name="performance_report"
+        )
+
+
+def get_keyword_filter():
+    """
+    Get the keyword filter of the current selection.
+    
+    Returns:
+        str or list: Selected keyword, or all matches of the keyword search
+    """
+    from keyword_search import resolve_keyword_filter
+    
+    return resolve_keyword_filter(
+        st.session_state.get("keywords_filter_perf"),
+        st.session_state.get("keyword_search_perf", "")
+    )
 
 
 def render_performance_filters():
     """Render the filter dropdowns section."""
     st.markdown("""
-        <style>
-        /* Reduce width of filter dropdowns in performance data page */
-        .stSelectbox {
-            max-width: 200px !important;
-        }
-        /* Reduce spacing between header and filters */
-        div[data-testid="stVerticalBlock"] > div:has(+ div div[data-testid="column"]) {
-            margin-bottom: 0px !important;
-        }
-        </style>
         <div style="margin-bottom: 24px; margin-top: -16px;">
             <div style="display: flex; gap: 16px; flex-wrap: wrap;">
     """, unsafe_allow_html=True)
@@ -149,9 +127,15 @@ def render_performance_filters():
         )
     
     with col3:
+        # Options come from the keyword search index, narrowed by the search box
+        from keyword_search import get_keyword_options
+        
         keyword = st.selectbox(
             "Keywords",
-            ["All Keywords", "Keyword 1", "Keyword 2", "Keyword 3"],
+            get_keyword_options(
+                st.session_state.get("keyword_search_perf", ""),
+                fallback=["All Keywords", "Keyword 1", "Keyword 2", "Keyword 3"]
+            ),
             index=0,
             key="keywords_filter_perf"
         )
@@ -164,6 +148,21 @@ def render_performance_filters():
             key="week_filter_perf"
         )
     
+    with col5:
+        st.text_input(
+            "Search Keywords",
+            key="keyword_search_perf",
+            placeholder="Type to search, typos are fine",
+            help="Prefix and fuzzy search over all keywords"
+        )
+        
+        # Precomputed by keyword_analytics.py - only looked up here
+        st.checkbox(
+            "Anomalous this week only",
+            key="anomalous_filter_perf",
+            help="Keywords whose CTR, CPA or ROAS deviates strongly from their recent weeks"
+        )
+    
     st.markdown("</div></div>", unsafe_allow_html=True)
     
     # Store filter values in session state for use in table rendering
@@ -174,218 +173,247 @@ def render_performance_filters():
 
 
 def render_performance_table():
-    """Render the performance data table using custom component."""
+    """Render one page of the performance data table using custom component."""
     from performance_table import performance_table
     
-    # Get filter values from session state (for future data filtering)
+    # Get filter values from session state
     retailer = st.session_state.get('perf_retailer', 'Tesco')
     campaign = st.session_state.get('perf_campaign', 'All Campaign')
-    keyword = st.session_state.get('perf_keyword', 'All Keywords')
     week = st.session_state.get('perf_week', 'Week of Feb 24 2025')
+    keyword = get_keyword_filter()
+    keyword = tuple(keyword) if isinstance(keyword, (list, tuple, set)) else keyword
+    anomalous_only = bool(st.session_state.get("anomalous_filter_perf"))
+    
+    # Back to the first page whenever the filters change
+    filters = (retailer, campaign, keyword, week, anomalous_only)
+    if st.session_state.get("perf_page_filters") != filters:
+        st.session_state["perf_page_filters"] = filters
+        st.session_state["perf_page"] = 0
+    
+    table_data, page, page_count = get_table_rows(
+        retailer, campaign, keyword, week,
+        page=st.session_state.get("perf_page", 0),
+        anomalous_only=anomalous_only
+    )
+    st.session_state["perf_page"] = page
+    st.session_state["perf_page_count"] = page_count
     
-    # Create sample data with delta indicators
-    # Each cell is an object with 'value' and 'deltaPercent' properties
-    # In a real application, this data would be filtered based on the selected filters
-    table_data = [
-        {
-            "Keywords": "Pringle",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Party",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Picnic",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Breakfast",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Crip",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Buffet",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Cereal",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Snacking",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Lunchbox",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        },
-        {
-            "Keywords": "Cocoa",
-            "Impressions": {"value": "2.0M", "deltaPercent": 10},
-            "*CPA": {"value": "0.33", "deltaPercent": 10},
-            "Avg. Rank": {"value": "3.25", "deltaPercent": 10},
-            "CTR": {"value": "1.15%", "deltaPercent": 10},
-            "Conversion Rate": {"value": "2.33%", "deltaPercent": 10},
-            "Click": {"value": "23.0K", "deltaPercent": 10},
-            "ROAS": {"value": "2.58", "deltaPercent": 10},
-            "*CPC": {"value": "0.15", "deltaPercent": 10},
-            "Sales (Con)": {"value": "24.0K", "deltaPercent": 10},
-            "*Sales (Rev)": {"value": "25.8K", "deltaPercent": 10},
-            "*Spend": {"value": "10.0K", "deltaPercent": 10}
-        }
-    ]
+    if not table_data:
+        st.info("No performance data for the selected filters.")
     
     # Render the custom performance table component
     performance_table(data=table_data, key="performance_data_table")
 
 
+def get_table_rows(retailer, campaign, keyword, week, page=0, anomalous_only=False):
+    """
+    Get one page of the performance table rows of a filter selection.
+    
+    The keyword metrics are cached per filter selection (see
+    get_keyword_metrics); only the rows of the requested page are built.
+    
+    Args:
+        retailer (str): Retailer filter
+        campaign (str): Campaign filter
+        keyword (str or tuple): Keyword filter, or the matches of a keyword search
+        week (str): Week filter label
+        page (int): Page index (clamped to the available pages)
+        anomalous_only (bool): Only keywords flagged as anomalous this week,
+            most anomalous first
+    
+    Returns:
+        tuple: (rows of the page, page index, number of pages)
+    """
+    metrics = get_keyword_metrics(retailer, campaign, keyword, week)
+    
+    if anomalous_only and not metrics.empty:
+        metrics = filter_anomalous_keywords(metrics, retailer, week)
+    
+    page_count = max((len(metrics) + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+    page = min(max(int(page), 0), page_count - 1)
+    rows = build_table_rows(metrics.iloc[page * PAGE_SIZE:(page + 1) * PAGE_SIZE])
+    return rows, page, page_count
+
+
+@st.cache_data(ttl=TABLE_CACHE_TTL, show_spinner=False)
+def get_keyword_metrics(retailer, campaign, keyword, week):
+    """
+    Get the table metrics of a filter selection per keyword (cached).
+    
+    Args:
+        retailer (str): Retailer filter
+        campaign (str): Campaign filter
+        keyword (str or tuple): Keyword filter, or the matches of a keyword search
+        week (str): Week filter label
+    
+    Returns:
+        DataFrame: Metrics of the week and the week before ("prev_" columns),
+            indexed by keyword ID, highest spend first
+    """
+    from datetime import datetime, timedelta
+    
+    from data_queries import get_performance_data, parse_week_filter
+    
+    keyword = list(keyword) if isinstance(keyword, tuple) else keyword
+    current = aggregate_keywords(get_performance_data(retailer, campaign, keyword, week))
+    if current.empty:
+        return current
+    
+    try:
+        week_start = datetime.strptime(parse_week_filter(week), "%Y-%m-%d")
+        previous_week = (week_start - timedelta(weeks=1)).strftime("%Y-%m-%d")
+        previous = aggregate_keywords(get_performance_data(retailer, campaign, keyword, previous_week))
+    except (TypeError, ValueError):
+        previous = current.iloc[0:0]
+    
+    metrics = current.join(previous.add_prefix("prev_"), how="left")
+    return metrics.sort_values("spend", ascending=False)
+
+
+def aggregate_keywords(df):
+    """
+    Aggregate performance rows (one per keyword and campaign) to one row per keyword.
+    
+    Args:
+        df (DataFrame): Rows from get_performance_data
+    
+    Returns:
+        DataFrame: Table metrics indexed by keyword ID (empty if no rows)
+    """
+    import pandas as pd
+    
+    columns = {column: aggregation for _, column, aggregation, _ in TABLE_COLUMNS}
+    if df.empty or "keyword" not in df.columns:
+        return pd.DataFrame(columns=list(columns))
+    
+    metrics = df[["keyword"] + list(columns)].copy()
+    metrics[list(columns)] = metrics[list(columns)].apply(pd.to_numeric, errors="coerce")
+    return metrics.groupby("keyword").agg(columns)
+
+
+def build_table_rows(metrics):
+    """
+    Format keyword metrics as table rows.
+    
+    Keyword IDs are decoded here, at the render boundary.
+    
+    Args:
+        metrics (DataFrame): Metrics of the keywords to show (see get_keyword_metrics)
+    
+    Returns:
+        list: Table rows in the order of metrics
+    """
+    import pandas as pd
+    from data_queries import format_number
+    from interning import decode_ids
+    
+    formats = {
+        "number": format_number,
+        "decimal": lambda value: f"{value:.2f}",
+        "percent": lambda value: f"{value:.2f}%"
+    }
+    
+    rows = []
+    for keyword_id, keyword in zip(metrics.index, decode_ids("keyword", metrics.index)):
+        row = {"Keywords": keyword}
+        for label, column, _, value_format in TABLE_COLUMNS:
+            value = metrics.at[keyword_id, column]
+            before = metrics.at[keyword_id, f"prev_{column}"]
+            value = 0 if pd.isna(value) else value
+            # No change shown for keywords without (or with zero) data the week before
+            delta = 0 if pd.isna(before) or before == 0 else round((value - before) / before * 100)
+            row[label] = {"value": formats[value_format](value), "deltaPercent": int(delta)}
+        rows.append(row)
+    return rows
+
+
+def filter_anomalous_keywords(metrics, retailer, week):
+    """
+    Filter keyword metrics to the keywords flagged as anomalous in a week.
+    
+    Args:
+        metrics (DataFrame): Metrics indexed by keyword ID
+        retailer (str): Retailer filter
+        week (str): Week filter label
+    
+    Returns:
+        DataFrame: Anomalous keywords, sorted by anomaly score (highest first)
+    """
+    import pandas as pd
+    from data_queries import parse_week_filter
+    from interning import MISSING_ID, lookup_ids
+    from keyword_analytics import get_week_flags
+    
+    flags = get_week_flags(retailer, parse_week_filter(week))
+    if not flags:
+        st.info(
+            f"No anomaly flags computed for {retailer} yet. "
+            f"Run: python keyword_analytics.py --retailer \"{retailer}\""
+        )
+        return metrics
+    
+    # Anomaly scores by keyword ID (flags of keywords never loaded have no ID)
+    anomalous = [keyword for keyword, flag in flags.items() if flag.get("anomalous")]
+    scores = pd.Series(
+        [flags[keyword]["anomaly_score"] for keyword in anomalous],
+        index=lookup_ids("keyword", anomalous)
+    )
+    scores = scores[scores.index != MISSING_ID]
+    
+    ids = metrics.index[metrics.index.isin(scores.index)]
+    return metrics.loc[scores.loc[ids].sort_values(ascending=False).index]
+
+
+def set_page(page):
+    """Go to a page of the performance table (pagination button callback)."""
+    st.session_state["perf_page"] = page
+
+
+def get_page_links(page, page_count):
+    """
+    Pages linked from the pagination: first, last and the neighbours of the current page.
+    
+    Args:
+        page (int): Current page index
+        page_count (int): Number of pages
+    
+    Returns:
+        list: Page indexes, with None where pages are skipped
+    """
+    pages = sorted({0, page_count - 1} | {p for p in (page - 1, page, page + 1) if 0 <= p < page_count})
+    links = []
+    for p in pages:
+        if links and p - links[-1] > 1:
+            links.append(None)
+        links.append(p)
+    return links
+
+
 def render_pagination():
-    """Render the pagination controls."""
-    st.markdown("""
-        <div style="display: flex; justify-content: flex-end; align-items: center; margin-top: 24px; gap: 8px;">
-            <button style="
-                background-color: transparent;
-                border: 1px solid #D1D5DB;
-                border-radius: 6px;
-                padding: 8px 12px;
-                cursor: pointer;
-                color: #6B7280;
-            ">‹</button>
-            <button style="
-                background-color: #9333EA;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 12px;
-                cursor: pointer;
-                color: white;
-                font-weight: 500;
-            ">1</button>
-            <button style="
-                background-color: transparent;
-                border: 1px solid #D1D5DB;
-                border-radius: 6px;
-                padding: 8px 12px;
-                cursor: pointer;
-                color: #6B7280;
-            ">2</button>
-            <button style="
-                background-color: transparent;
-                border: 1px solid #D1D5DB;
-                border-radius: 6px;
-                padding: 8px 12px;
-                cursor: pointer;
-                color: #6B7280;
-            ">3</button>
-            <span style="color: #6B7280; padding: 0 8px;">...</span>
-            <button style="
-                background-color: transparent;
-                border: 1px solid #D1D5DB;
-                border-radius: 6px;
-                padding: 8px 12px;
-                cursor: pointer;
-                color: #6B7280;
-            ">12</button>
-            <button style="
-                background-color: transparent;
-                border: 1px solid #D1D5DB;
-                border-radius: 6px;
-                padding: 8px 12px;
-                cursor: pointer;
-                color: #6B7280;
-            ">›</button>
-        </div>
-    """, unsafe_allow_html=True)
+    """Render the pagination controls of the performance table."""
+    page = st.session_state.get("perf_page", 0)
+    page_count = st.session_state.get("perf_page_count", 1)
+    if page_count <= 1:
+        return
+    
+    links = get_page_links(page, page_count)
+    columns = st.columns([12] + [1] * (len(links) + 2))
+    
+    with columns[1]:
+        st.button("‹", key="perf_page_prev", disabled=page == 0, on_click=set_page, args=(page - 1,))
+    
+    for column, link in zip(columns[2:], links):
+        with column:
+            if link is None:
+                st.markdown("<div style='color: #6B7280; padding-top: 8px; text-align: center;'>...</div>", unsafe_allow_html=True)
+            else:
+                st.button(
+                    str(link + 1),
+                    key=f"perf_page_{link}",
+                    type="primary" if link == page else "secondary",
+                    on_click=set_page,
+                    args=(link,)
+                )
+    
+    with columns[-1]:
+        st.button("›", key="perf_page_next", disabled=page >= page_count - 1, on_click=set_page, args=(page + 1,))
@@ -1,18 +1,23 @@
-import streamlit.components.v1 as components
 import os
+from functools import lru_cache
 
 # Create a _RELEASE constant
 _RELEASE = True
 
-if not _RELEASE:
-    _component_func = components.declare_component(
-        "performance_table",
-        url="http://localhost:3000",
-    )
-else:
+
+@lru_cache(maxsize=None)
+def _get_component_func():
+    """Declare the component on first render (once per process)."""
+    import streamlit.components.v1 as components
+    
+    if not _RELEASE:
+        return components.declare_component(
+            "performance_table",
+            url="http://localhost:3000",
+        )
     parent_dir = os.path.dirname(os.path.abspath(__file__))
     build_dir = os.path.join(parent_dir, "frontend/build")
-    _component_func = components.declare_component("performance_table", path=build_dir)
+    return components.declare_component("performance_table", path=build_dir)
 
 
 def performance_table(data, key=None):
@@ -25,7 +30,13 @@ def performance_table(data, key=None):
         Table data where each dict represents a row with columns as keys
     key : str
         Unique key for the component
+    
+    Returns:
+    --------
+    dict or None
+        The last clicked button cell as {"action", "row_id", "clicked_at"},
+        taken from the button object's "action" and "row_id" fields
     """
-    component_value = _component_func(data=data, key=key, default=None)
+    component_value = _get_component_func()(data=data, key=key, default=None)
     return component_value
 
@@ -91,7 +91,11 @@ const PerformanceTable: React.FC<ComponentProps> = (props) => {
       return (
         <button 
           className={`table-button ${value.variant || 'primary'}`}
-          onClick={() => value.onClick && value.onClick()}
+          onClick={() => Streamlit.setComponentValue({
+            action: value.action || columnKey,
+            row_id: value.row_id,
+            clicked_at: Date.now()
+          })}
         >
           {value.label}
         </button>
@@ -0,0 +1,218 @@
+"""
+Report Export Module
+--------------------
+This module builds the files behind the "Export Report" buttons on the
+Dashboard and Performance Data pages.
+
+The currently filtered query is fetched in batches (see
+data_connection.iter_query_batches) and each batch is written straight to
+the export file, so the full result set is never materialized in the
+Streamlit process. XLSX exports also get a "KPI Summary" sheet with the
+values shown in the KPI tiles.
+"""
+
+import hashlib
+import os
+import uuid
+
+import streamlit as st
+from config import STORAGE_CONFIG
+from data_connection import iter_query_batches
+
+# Supported formats: format -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "xlsx": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+# Excel cannot hold more rows than this on one sheet (header included)
+XLSX_MAX_ROWS = 1_048_576
+
+
+def get_export_dir():
+    """
+    Returns the folder export files are written to.
+
+    Returns:
+        str: Export folder (EXPORT_PATH environment variable or config.py)
+    """
+    return os.getenv("EXPORT_PATH") or STORAGE_CONFIG.get("export_dir", "data/exports")
+
+
+def export_report(query, file_format="csv", kpi_summary=None, name="report"):
+    """
+    Export the results of a query to a file, batch by batch.
+
+    Args:
+        query (str): SQL query to export
+        file_format (str): "csv", "parquet" or "xlsx"
+        kpi_summary (dict): KPI label -> value, written to a "KPI Summary"
+            sheet in XLSX exports
+        name (str): Prefix of the export file name
+
+    Returns:
+        tuple: (path of the export file, number of data rows written)
+
+    Raises:
+        ValueError: If the format is unsupported or the query cannot run
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Invalid export format: {file_format}. "
+            f"Must be one of {list(EXPORT_FORMATS)}"
+        )
+
+    export_dir = get_export_dir()
+    os.makedirs(export_dir, exist_ok=True)
+
+    # Same query and format -> same file, so repeated exports don't pile up
+    query_hash = hashlib.sha1(query.encode()).hexdigest()[:12]
+    extension, _ = EXPORT_FORMATS[file_format]
+    path = os.path.join(export_dir, f"{name}_{query_hash}{extension}")
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+    batches = iter_query_batches(query)
+    try:
+        if file_format == "csv":
+            rows = _write_csv(batches, tmp_path)
+        elif file_format == "parquet":
+            rows = _write_parquet(batches, tmp_path)
+        else:
+            rows = _write_xlsx(batches, tmp_path, kpi_summary)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return path, rows
+
+
+def render_export_controls(query, key, label="Export Report", kpi_summary=None, name="report"):
+    """
+    Render the export format picker, export button and download button.
+    
+    The export is only generated when the export button is clicked; the
+    download button then serves the prepared file until the query changes.
+    
+    Args:
+        query (str): SQL query of the currently filtered data
+        key (str): Unique widget key prefix
+        label (str): Export button label
+        kpi_summary (dict): KPI label -> value for the XLSX summary sheet
+        name (str): Prefix of the export file name
+    """
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        file_format = st.selectbox(
+            "Format",
+            list(EXPORT_FORMATS),
+            format_func=str.upper,
+            key=f"{key}_format",
+            label_visibility="collapsed"
+        )
+    
+    with col2:
+        if st.button(f"📥 {label}", key=f"{key}_button"):
+            with st.spinner("Preparing export..."):
+                try:
+                    path, rows = export_report(query, file_format, kpi_summary, name)
+                except Exception as e:
+                    st.error(f"Export failed: {str(e)}")
+                    return
+            st.session_state[f"{key}_file"] = {
+                "path": path, "format": file_format, "rows": rows, "query": query
+            }
+    
+    # Only offer a prepared file that matches the current filters and format
+    prepared = st.session_state.get(f"{key}_file")
+    if prepared and prepared["query"] == query and prepared["format"] == file_format:
+        if os.path.exists(prepared["path"]):
+            with open(prepared["path"], "rb") as f:
+                st.download_button(
+                    f"Download ({prepared['rows']:,} rows)",
+                    data=f,
+                    file_name=os.path.basename(prepared["path"]),
+                    mime=EXPORT_FORMATS[file_format][1],
+                    key=f"{key}_download"
+                )
+
+
+def _write_csv(batches, path):
+    """Write Arrow batches to a CSV file incrementally."""
+    import pyarrow.csv as pa_csv
+
+    rows = 0
+    writer = None
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pa_csv.CSVWriter(path, batch.schema)
+            writer.write_table(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        # No rows - still produce a valid (empty) file
+        open(path, "w").close()
+    return rows
+
+
+def _write_parquet(batches, path):
+    """Write Arrow batches to a Parquet file incrementally."""
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema)
+            writer.write_table(batch.cast(writer.schema))
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        import pyarrow as pa
+        pq.write_table(pa.table({}), path)
+    return rows
+
+
+def _write_xlsx(batches, path, kpi_summary=None):
+    """Write a KPI summary sheet and Arrow batches to an XLSX workbook."""
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ValueError("openpyxl not installed. Please run: pip install openpyxl")
+
+    # Write-only workbooks flush rows to disk instead of keeping them in memory
+    workbook = Workbook(write_only=True)
+
+    if kpi_summary:
+        summary_sheet = workbook.create_sheet(title="KPI Summary")
+        summary_sheet.append(["KPI", "Value"])
+        for label, value in kpi_summary.items():
+            summary_sheet.append([label, value])
+
+    data_sheet = workbook.create_sheet(title="Data")
+    rows = 0
+    for batch in batches:
+        if rows == 0:
+            data_sheet.append(batch.column_names)
+        if rows + batch.num_rows >= XLSX_MAX_ROWS:
+            raise ValueError(
+                f"Too many rows for an XLSX export (limit {XLSX_MAX_ROWS - 1:,}). "
+                "Please export as CSV or Parquet instead."
+            )
+        columns = batch.to_pydict()
+        for row in zip(*columns.values()):
+            data_sheet.append(list(row))
+        rows += batch.num_rows
+
+    workbook.save(path)
+    return rows
@@ -0,0 +1,130 @@
+"""
+Run Downloads Module
+--------------------
+This module prepares downloadable files of model run results.
+
+Files are generated straight from a run's stored Parquet output (see
+run_store.py) one record batch at a time, so the full result set is never
+held in memory. Each prepared file is kept next to the run as a cached
+artifact, so repeated downloads of the same run and format are instant.
+"""
+
+import os
+import uuid
+
+from run_store import get_run_path
+
+# Supported formats: format -> (file extension, MIME type)
+DOWNLOAD_FORMATS = {
+    "csv": (".csv", "text/csv"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "xlsx": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+
+# Rows read from the stored Parquet per batch
+BATCH_SIZE = 65_536
+
+
+def prepare_run_download(retailer, run_id, file_format="csv"):
+    """
+    Get the path of a run's results in the requested format.
+
+    The file is generated on first request and reused afterwards, until
+    the run's stored output changes.
+
+    Args:
+        retailer (str): Retailer name
+        run_id (str): Run ID
+        file_format (str): "csv", "parquet" or "xlsx"
+
+    Returns:
+        str: Path of the prepared file
+
+    Raises:
+        ValueError: If the format is unsupported or the run does not exist
+    """
+    if file_format not in DOWNLOAD_FORMATS:
+        raise ValueError(
+            f"Invalid download format: {file_format}. "
+            f"Must be one of {list(DOWNLOAD_FORMATS)}"
+        )
+
+    run_path = get_run_path(retailer, run_id)
+    source = os.path.join(run_path, "results.parquet")
+    if not os.path.exists(source):
+        raise ValueError(f"Run not found for {retailer}: {run_id}")
+
+    # The stored output already is Parquet - serve it as-is
+    if file_format == "parquet":
+        return source
+
+    extension, _ = DOWNLOAD_FORMATS[file_format]
+    target = os.path.join(run_path, "exports", f"results{extension}")
+    if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+        return target
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_path = f"{target}.{uuid.uuid4().hex}.tmp"
+    try:
+        if file_format == "csv":
+            _write_csv(source, tmp_path)
+        else:
+            _write_xlsx(source, tmp_path)
+        os.replace(tmp_path, target)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return target
+
+
+def get_download_file_name(retailer, run_id, file_format):
+    """
+    Build the file name offered to the user for a run download.
+
+    Args:
+        retailer (str): Retailer name
+        run_id (str): Run ID
+        file_format (str): Download format
+
+    Returns:
+        str: File name, e.g. "model_run_tesco_20240923T143000.csv"
+    """
+    from run_store import retailer_slug
+
+    extension, _ = DOWNLOAD_FORMATS[file_format]
+    return f"model_run_{retailer_slug(retailer)}_{run_id}{extension}"
+
+
+def _write_csv(source, target):
+    """Stream a Parquet file to CSV batch by batch."""
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(source)
+    with pa_csv.CSVWriter(target, parquet_file.schema_arrow) as writer:
+        for batch in parquet_file.iter_batches(batch_size=BATCH_SIZE):
+            writer.write_batch(batch)
+
+
+def _write_xlsx(source, target):
+    """Stream a Parquet file to a single-sheet XLSX workbook batch by batch."""
+    import pyarrow.parquet as pq
+
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ValueError("openpyxl not installed. Please run: pip install openpyxl")
+
+    # Write-only workbooks flush rows to disk instead of keeping them in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title="Model Run Results")
+
+    parquet_file = pq.ParquetFile(source)
+    sheet.append(parquet_file.schema_arrow.names)
+    for batch in parquet_file.iter_batches(batch_size=BATCH_SIZE):
+        columns = batch.to_pydict()
+        for row in zip(*columns.values()):
+            sheet.append(list(row))
+
+    workbook.save(target)
@@ -0,0 +1,288 @@
+"""
+Run Store Module
+----------------
+This module persists bid constraints and model run outputs as Parquet files,
+keyed by retailer and run ID, so they survive page refreshes.
+
+Layout under the store root (see STORAGE_CONFIG in config.py):
+
+    {retailer}/constraints/v000001.parquet   one file per saved constraint set
+    {retailer}/runs/{run_id}/results.parquet model output of a run
+    {retailer}/runs/{run_id}/run.json        run metadata
+
+Constraint sets are never overwritten; every save adds a new version, so the
+full history stays available. Runs are stored with their outputs, so past
+runs can be compared without re-running the model.
+"""
+
+import json
+import os
+import re
+import uuid
+from datetime import datetime
+
+import pandas as pd
+from config import STORAGE_CONFIG
+
+
+def get_store_root():
+    """
+    Returns the folder the run store writes to.
+
+    Returns:
+        str: Store root (RUN_STORE_PATH environment variable or config.py)
+    """
+    return os.getenv("RUN_STORE_PATH") or STORAGE_CONFIG.get("root", "data/run_store")
+
+
+def retailer_slug(retailer):
+    """
+    Convert a retailer name to a folder name (e.g. "Sainsbury's" -> "sainsbury_s").
+
+    Args:
+        retailer (str): Retailer name
+
+    Returns:
+        str: Folder-safe retailer name
+    """
+    slug = re.sub(r"[^a-z0-9]+", "_", str(retailer).lower()).strip("_")
+    if not slug:
+        raise ValueError(f"Invalid retailer name: {retailer!r}")
+    return slug
+
+
+def save_constraints(retailer, constraints):
+    """
+    Save a constraint set as the retailer's next version.
+
+    The file is written under a temporary name and then hard-linked to the
+    version's name, which fails if that name exists. Sessions saving at the
+    same time therefore each get their own version instead of overwriting
+    one another, and readers never see partial files.
+
+    Args:
+        retailer (str): Retailer name
+        constraints (DataFrame): Constraint table (see bid_model)
+
+    Returns:
+        int: Version number of the saved set
+    """
+    folder = _retailer_path(retailer, "constraints")
+    os.makedirs(folder, exist_ok=True)
+
+    tmp_path = os.path.join(folder, f".{uuid.uuid4().hex}.tmp")
+    constraints.to_parquet(tmp_path, index=False)
+    try:
+        versions = list_constraint_versions(retailer)
+        version = (versions[-1] if versions else 0) + 1
+        while True:
+            try:
+                os.link(tmp_path, os.path.join(folder, f"v{version:06d}.parquet"))
+                return version
+            except FileExistsError:
+                # Taken by a concurrent save - try the next one
+                version += 1
+    finally:
+        os.remove(tmp_path)
+
+
+def list_constraint_versions(retailer):
+    """
+    List the saved constraint versions of a retailer, oldest first.
+
+    Args:
+        retailer (str): Retailer name
+
+    Returns:
+        list: Version numbers
+    """
+    folder = _retailer_path(retailer, "constraints")
+    if not os.path.isdir(folder):
+        return []
+
+    return sorted(
+        int(name[1:-len(".parquet")])
+        for name in os.listdir(folder)
+        if re.fullmatch(r"v\d+\.parquet", name)
+    )
+
+
+def load_constraints(retailer, version=None):
+    """
+    Load a saved constraint set in one read.
+
+    Args:
+        retailer (str): Retailer name
+        version (int): Version to load (default: latest)
+
+    Returns:
+        DataFrame: Constraint table (or None if nothing was saved)
+    """
+    if version is None:
+        versions = list_constraint_versions(retailer)
+        if not versions:
+            return None
+        version = versions[-1]
+
+    path = os.path.join(_retailer_path(retailer, "constraints"), f"v{version:06d}.parquet")
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def save_run(retailer, results, summary=None, constraints_version=None):
+    """
+    Save the output of a model run.
+
+    Args:
+        retailer (str): Retailer name
+        results (DataFrame): Model output (see bid_model.run_model)
+        summary (dict): Run summary counts
+        constraints_version (int): Constraint version the run used
+
+    Returns:
+        str: ID of the saved run
+    """
+    created_at = datetime.now()
+    run_id = f"{created_at:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:6]}"
+
+    folder = get_run_path(retailer, run_id)
+    os.makedirs(folder, exist_ok=True)
+
+    _write_parquet(results, os.path.join(folder, "results.parquet"))
+
+    metadata = {
+        "run_id": run_id,
+        "retailer": retailer,
+        "created_at": created_at.isoformat(timespec="seconds"),
+        "rows": int(len(results)),
+        "status": "Completed",
+        "constraints_version": constraints_version,
+        "summary": summary or {},
+    }
+    with open(os.path.join(folder, "run.json"), "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    return run_id
+
+
+def get_run_path(retailer, run_id):
+    """
+    Returns the folder holding a run's files.
+
+    Args:
+        retailer (str): Retailer name
+        run_id (str): Run ID
+
+    Returns:
+        str: Run folder path
+    """
+    if not re.fullmatch(r"[0-9A-Za-z_-]+", str(run_id)):
+        raise ValueError(f"Invalid run ID: {run_id!r}")
+    return os.path.join(_retailer_path(retailer, "runs"), run_id)
+
+
+def list_runs(retailer=None):
+    """
+    List saved runs, newest first.
+
+    Args:
+        retailer (str): Only list this retailer's runs (default: all retailers)
+
+    Returns:
+        DataFrame: One row of run metadata per run
+    """
+    root = get_store_root()
+    if retailer is not None:
+        slugs = [retailer_slug(retailer)]
+    elif os.path.isdir(root):
+        slugs = sorted(os.listdir(root))
+    else:
+        slugs = []
+
+    runs = []
+    for slug in slugs:
+        runs_dir = os.path.join(root, slug, "runs")
+        if not os.path.isdir(runs_dir):
+            continue
+        for run_id in os.listdir(runs_dir):
+            meta_path = os.path.join(runs_dir, run_id, "run.json")
+            if os.path.exists(meta_path):
+                with open(meta_path) as f:
+                    runs.append(json.load(f))
+
+    columns = ["run_id", "retailer", "created_at", "rows", "status", "constraints_version", "summary"]
+    if not runs:
+        return pd.DataFrame(columns=columns)
+
+    return pd.DataFrame(runs, columns=columns).sort_values("run_id", ascending=False, ignore_index=True)
+
+
+def load_run(retailer, run_id, columns=None):
+    """
+    Load the output of a saved run.
+
+    Args:
+        retailer (str): Retailer name
+        run_id (str): Run ID
+        columns (list): Only read these columns (default: all)
+
+    Returns:
+        DataFrame: Model output (or None if the run does not exist)
+    """
+    path = os.path.join(get_run_path(retailer, run_id), "results.parquet")
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path, columns=columns)
+
+
+def load_latest_run(retailer):
+    """
+    Load the output of the retailer's most recent run.
+
+    Args:
+        retailer (str): Retailer name
+
+    Returns:
+        DataFrame: Model output (or None if the retailer has no runs)
+    """
+    runs = list_runs(retailer)
+    if runs.empty:
+        return None
+    return load_run(retailer, runs.iloc[0]["run_id"])
+
+
+def diff_runs(retailer, run_a, run_b):
+    """
+    Compare the bids of two saved runs.
+
+    Args:
+        retailer (str): Retailer name
+        run_a (str): ID of the earlier run
+        run_b (str): ID of the later run
+
+    Returns:
+        DataFrame: One row per key whose bid differs (or that is only in one run)
+    """
+    columns = ["key", "new_bid"]
+    a = load_run(retailer, run_a, columns=columns)
+    b = load_run(retailer, run_b, columns=columns)
+    if a is None or b is None:
+        missing = run_a if a is None else run_b
+        raise ValueError(f"Run not found for {retailer}: {missing}")
+
+    diff = a.merge(b, on="key", how="outer", suffixes=("_a", "_b"))
+    diff["change"] = diff["new_bid_b"] - diff["new_bid_a"]
+    return diff[diff["change"].fillna(1) != 0].reset_index(drop=True)
+
+
+def _retailer_path(retailer, *parts):
+    """Returns a path inside the retailer's store folder."""
+    return os.path.join(get_store_root(), retailer_slug(retailer), *parts)
+
+
+def _write_parquet(df, path):
+    """Write a DataFrame to Parquet atomically (readers never see partial files)."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
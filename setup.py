@@ -12,10 +12,11 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=[
-        "streamlit>=1.28.0",
+        "streamlit>=1.66.0",
         "plotly>=5.17.0",
         "pandas>=2.0.0",
         "databricks-sql-connector>=2.9.0",
+        "pyarrow>=12.0.0",
     ],
     python_requires=">=3.8",
     entry_points={
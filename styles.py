@@ -3,167 +3,383 @@ Styles Module
 -------------
 This module contains all styling functions for the Streamlit app.
 It handles custom fonts, themes, and CSS styling.
+
+All CSS of the app (fonts, the page shell and page-specific rules) is built
+into one minified stylesheet per theme, once per process. Every run emits
+it as the same single element: Streamlit caches large messages in the
+browser by content hash, so after the first run of a session only a short
+reference is sent instead of the CSS. Page-specific rules are scoped with a
+page marker (see mark_page), so the stylesheet is identical on every page.
 """
 
-import streamlit as st
 import base64
+import hashlib
+import re
+from functools import lru_cache
+from string import Template
+
+import streamlit as st
+
+DEFAULT_THEME = "light"
+
+# Theme colors, substituted into the CSS templates below ($name)
+THEMES = {
+    "light": {
+        "app_background": "#FFFFFF",
+        "page_background": "#FCFCFC",
+        "sidebar_background": "#FCFCFC",
+        "card_background": "white",
+        "border": "#E5E7EB",
+        "accent": "#8400FF",
+        "accent_hover": "#6B00CC"
+    }
+}
+
+# Font files and their CSS font-weight values
+FONT_FILES = {
+    'fonts/Gilroy-Light.ttf': '300',
+    'fonts/Gilroy-Regular.ttf': '400',
+    'fonts/Gilroy-Medium.ttf': '500',
+    'fonts/Gilroy-Bold.ttf': '700',
+    'fonts/Gilroy-Heavy.ttf': '900'
+}
+
+# Fonts, theme background and sidebar
+SHELL_CSS = """
+/* Apply Gilroy font to all elements in the app */
+html, body, [class*="css"], p, span, div, h1, h2, h3, h4, h5, h6, label, input, button, textarea, select {
+    font-family: 'Gilroy', sans-serif !important;
+}
+
+/* Force light theme background */
+.stApp {
+    background-color: $app_background;
+}
+
+/* Custom background color for sidebar */
+section[data-testid="stSidebar"] {
+    background-color: $sidebar_background !important;
+    border-right: 1px solid $border !important;
+}
+section[data-testid="stSidebar"] > div,
+section[data-testid="stSidebar"] > div > div,
+section[data-testid="stSidebar"] > div > div > div {
+    background-color: $sidebar_background !important;
+}
+
+/* Remove ALL backgrounds from ALL sidebar child elements */
+section[data-testid="stSidebar"] *:not(iframe),
+[data-testid="stSidebar"] [data-testid="stVerticalBlock"],
+[data-testid="stSidebar"] .element-container,
+[data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div,
+[data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div > div {
+    background-color: transparent !important;
+}
+
+/* Ensure iframe has correct background */
+section[data-testid="stSidebar"] iframe {
+    background-color: $sidebar_background !important;
+}
+
+/* Remove grey box that appears below sidebar navigation */
+section[data-testid="stSidebar"] [data-testid="stVerticalBlock"]:not(:first-child) {
+    display: none !important;
+}
+
+/* Make sidebar full height */
+section[data-testid="stSidebar"],
+section[data-testid="stSidebar"] > div:first-child {
+    min-height: 100vh !important;
+}
+
+/* Aggressively hide Streamlit's default sidebar collapse button */
+section[data-testid="stSidebar"] > div > div > button {
+    display: none !important;
+    visibility: hidden !important;
+    opacity: 0 !important;
+    width: 0 !important;
+    height: 0 !important;
+}
 
+button[kind="header"],
+[data-testid="collapsedControl"],
+[data-testid="stSidebarCollapse"],
+[data-testid="stSidebarCollapseButton"] {
+    display: none !important;
+}
 
-def load_custom_fonts():
+/* Hide by class names */
+.css-1544g2n, .css-163ttbj, .st-emotion-cache-1cypcdb {
+    display: none !important;
+}
+
+/* Hide any span containing keyboard */
+section[data-testid="stSidebar"] span {
+    content: "" !important;
+}
+
+section[data-testid="stSidebar"] button span:not(.collapse-icon) {
+    visibility: hidden !important;
+    font-size: 0 !important;
+}
+
+/* Force hide the header area */
+section[data-testid="stSidebar"] > div:first-child > div:first-child {
+    display: none !important;
+}
+
+/* Page markers take no space */
+.page-marker {
+    display: none;
+}
+"""
+
+# Pages shown on the grey background in a white content card (PAGE_CSS)
+CARD_PAGES = ["Dashboard", "Performance Data", "Upload Keyword", "Model Run Results"]
+
+# Page background and the white content card ($card is the marker selector of CARD_PAGES)
+PAGE_CSS = """
+/* Light grey background for entire page */
+$card [data-testid="stAppViewContainer"] {
+    background-color: $page_background !important;
+    overflow-x: hidden !important;
+}
+
+/* White container for main content with border shadow */
+$card section[data-testid="stMain"] > div:first-child {
+    background-color: $card_background;
+    border-radius: 12px;
+    padding: 32px;
+    margin: 24px;
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
+    border: 1px solid $border;
+    max-width: 100%;
+    overflow-x: hidden;
+}
+
+/* Prevent horizontal scroll */
+$card section[data-testid="stMain"] {
+    overflow-x: hidden !important;
+}
+
+/* Ensure columns fit within viewport */
+$card [data-testid="column"] {
+    max-width: 100% !important;
+    overflow-x: hidden !important;
+}
+
+/* Ensure chart container doesn't overflow */
+.js-plotly-plot {
+    max-width: 100% !important;
+}
+
+/* Remove Streamlit margins around the KPI tiles component */
+iframe[title="kpi_tiles.kpi_tiles"],
+div:has(> iframe[title="kpi_tiles.kpi_tiles"]) {
+    margin: 0 !important;
+    padding: 0 !important;
+}
+"""
+
+# Page name -> rules that only apply on that page ($page is the page's marker selector)
+PAGE_RULES = {
+    "Performance Data": """
+/* Reduce width of filter dropdowns in performance data page */
+$page .stSelectbox {
+    max-width: 200px !important;
+}
+/* Reduce spacing between header and filters */
+$page div[data-testid="stVerticalBlock"] > div:has(+ div div[data-testid="column"]) {
+    margin-bottom: 0px !important;
+}
+""",
+    "Upload Keyword": """
+/* Limit the width of the retailer selectbox */
+$page div[data-testid="stSelectbox"][data-baseweb="select"] {
+    max-width: 300px !important;
+}
+/* Reduce spacing between sections */
+$page div[data-testid="stVerticalBlock"] > div {
+    margin-bottom: 0px !important;
+}
+/* Remove all element container margins in upload section */
+$page:has([data-testid="stFileUploader"]) .element-container {
+    margin-top: 0 !important;
+    margin-bottom: 0 !important;
+}
+$page [data-testid="stFileUploader"] {
+    position: absolute;
+    opacity: 0;
+    width: 0;
+    height: 0;
+    overflow: hidden;
+    margin: 0 !important;
+}
+/* Remove default margins from the upload success message */
+$page .element-container:has(> .stAlert) {
+    margin-top: 0 !important;
+    padding-top: 0 !important;
+}
+$page div.stAlert {
+    margin-top: 0 !important;
+    margin-bottom: 8px !important;
+    padding: 10px 14px !important;
+}
+/* Style the Save button to be purple and compact */
+$page .stButton > button {
+    background-color: $accent !important;
+    color: white !important;
+    border: none !important;
+    border-radius: 6px !important;
+    padding: 8px 16px !important;
+    font-family: 'Gilroy', sans-serif !important;
+    font-weight: 500 !important;
+    font-size: 13px !important;
+    width: auto !important;
+    white-space: nowrap !important;
+}
+$page .stButton > button:hover {
+    background-color: $accent_hover !important;
+}
+""",
+    "Model Run Results": """
+/* Reduce width of filter dropdowns */
+$page .stSelectbox {
+    max-width: 200px !important;
+}
+/* Reduce spacing between sections */
+$page div[data-testid="stVerticalBlock"] > div {
+    margin-bottom: 0px !important;
+}
+"""
+}
+
+
+def get_page_class(page):
+    """CSS class of a page's marker (e.g. "Upload Keyword" -> "page-upload-keyword")."""
+    return "page-" + re.sub(r"[^a-z0-9]+", "-", page.lower()).strip("-")
+
+
+def minify_css(css):
     """
-    Load custom Gilroy fonts from the fonts folder.
-    
-    This function reads all Gilroy font files and embeds them in the app
-    using base64 encoding. The fonts are then available throughout the app.
+    Minify CSS: drop comments and whitespace that carries no meaning.
+
+    Spaces before ":" are kept, as they matter in selectors
+    (e.g. "div :first-child" vs "div:first-child").
     """
-    # Define all font files and their corresponding weights
-    font_files = {
-        'Gilroy-Light': 'fonts/Gilroy-Light.ttf',
-        'Gilroy-Regular': 'fonts/Gilroy-Regular.ttf',
-        'Gilroy-Medium': 'fonts/Gilroy-Medium.ttf',
-        'Gilroy-Bold': 'fonts/Gilroy-Bold.ttf',
-        'Gilroy-Heavy': 'fonts/Gilroy-Heavy.ttf'
-    }
-    
-    # Start building the CSS
-    font_css = "<style>"
-    
-    # Create @font-face rules for each font weight
-    for font_name, font_path in font_files.items():
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def build_font_css():
+    """
+    Build the @font-face rules of the Gilroy fonts, embedded as base64.
+
+    Returns:
+        tuple: (CSS, list of font files that were not found)
+    """
+    rules = []
+    missing = []
+    for font_path, weight in FONT_FILES.items():
         try:
-            # Read the font file and convert to base64
             with open(font_path, 'rb') as f:
                 font_data = base64.b64encode(f.read()).decode()
-            
-            # Map font names to CSS font-weight values
-            weight_map = {
-                'Gilroy-Light': '300',
-                'Gilroy-Regular': '400',
-                'Gilroy-Medium': '500',
-                'Gilroy-Bold': '700',
-                'Gilroy-Heavy': '900'
-            }
-            
-            # Add the @font-face CSS rule
-            font_css += f"""
-            @font-face {{
-                font-family: 'Gilroy';
-                src: url(data:font/ttf;base64,{font_data}) format('truetype');
-                font-weight: {weight_map[font_name]};
-                font-style: normal;
-            }}
-            """
         except FileNotFoundError:
-            st.error(f"Font file not found: {font_path}")
-    
-    # Apply Gilroy font to all elements in the app
-    font_css += """
-    html, body, [class*="css"], p, span, div, h1, h2, h3, h4, h5, h6, label, input, button, textarea, select {
-        font-family: 'Gilroy', sans-serif !important;
-    }
-    </style>
+            missing.append(font_path)
+            continue
+        rules.append(
+            "@font-face{font-family:'Gilroy';"
+            f"src:url(data:font/ttf;base64,{font_data}) format('truetype');"
+            f"font-weight:{weight};font-style:normal}}"
+        )
+    return "".join(rules), missing
+
+
+@lru_cache(maxsize=None)
+def get_stylesheet(theme=DEFAULT_THEME):
+    """
+    Build the app's stylesheet for a theme (once per process).
+
+    Args:
+        theme (str): Theme name (see THEMES)
+
+    Returns:
+        dict: html (the <style> element), hash (content hash), bytes (size),
+            font_bytes (size of the embedded fonts), missing_fonts
+
+    Raises:
+        ValueError: If the theme doesn't exist
     """
-    
-    # Inject the CSS into the app
-    st.markdown(font_css, unsafe_allow_html=True)
+    if theme not in THEMES:
+        raise ValueError(f"Invalid theme: {theme}. Must be one of {list(THEMES)}")
+
+    colors = THEMES[theme]
+    page_rules = [
+        Template(rules).substitute(colors, page=f".stApp:has(.{get_page_class(page)})")
+        for page, rules in PAGE_RULES.items()
+    ]
+    css = minify_css(
+        Template(SHELL_CSS).substitute(colors)
+        + Template(PAGE_CSS).substitute(colors, card=".stApp:has(.page-card)")
+        + "".join(page_rules)
+    )
+    font_css, missing_fonts = build_font_css()
+    css = font_css + css
+
+    content_hash = hashlib.sha256(css.encode()).hexdigest()[:12]
+    html = f"<style>/*{theme}:{content_hash}*/{css}</style>"
+    return {
+        "html": html,
+        "hash": content_hash,
+        "bytes": len(html.encode()),
+        "font_bytes": len(font_css.encode()),
+        "missing_fonts": missing_fonts
+    }
 
 
-def apply_light_theme():
+def get_stylesheet_stats():
     """
-    Apply custom light theme styling to the app.
-    
-    This ensures the app always uses a light background,
-    overriding any system dark mode preferences.
+    Get the size and hash of each theme's stylesheet.
+
+    Returns:
+        dict: theme -> hash, bytes, font_bytes
     """
-    st.markdown("""
-        <style>
-        /* Force light theme background */
-        .stApp {
-            background-color: #FFFFFF;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    return {
+        theme: {key: stylesheet[key] for key in ("hash", "bytes", "font_bytes")}
+        for theme in THEMES
+        for stylesheet in [get_stylesheet(theme)]
+    }
 
 
-def apply_custom_styles():
+def apply_theme(theme=DEFAULT_THEME):
     """
-    Apply any additional custom CSS styles to the app.
-    
-    Add your custom CSS here for specific components or layouts.
+    Apply the app's stylesheet (fonts, theme, page shell and page rules).
+
+    This must run on every rerun (Streamlit removes elements that a run
+    doesn't emit), but the browser caches the stylesheet by its hash, so
+    only the first run of a session transfers it.
+
+    Args:
+        theme (str): Theme name (see THEMES)
     """
-    # Hide Streamlit's default sidebar collapse button and text
-    st.markdown("""
-        <style>
-        /* Custom background color for sidebar - #FCFCFC */
-        section[data-testid="stSidebar"] {
-            background-color: #FCFCFC !important;
-            border-right: 1px solid #E5E7EB !important;
-        }
-        
-        section[data-testid="stSidebar"] > div {
-            background-color: #FCFCFC !important;
-        }
-        
-        /* Remove ALL backgrounds from ALL sidebar child elements */
-        section[data-testid="stSidebar"] *:not(iframe) {
-            background-color: transparent !important;
-        }
-        
-        /* Ensure iframe has correct background */
-        section[data-testid="stSidebar"] iframe {
-            background-color: #FCFCFC !important;
-        }
-        
-        /* Make sidebar full height */
-        section[data-testid="stSidebar"],
-        section[data-testid="stSidebar"] > div:first-child {
-            min-height: 100vh !important;
-        }
-        
-        /* Aggressively hide Streamlit's default sidebar collapse button */
-        section[data-testid="stSidebar"] > div > div > button {
-            display: none !important;
-            visibility: hidden !important;
-            opacity: 0 !important;
-            width: 0 !important;
-            height: 0 !important;
-        }
-        
-        button[kind="header"] {
-            display: none !important;
-        }
-        
-        [data-testid="collapsedControl"] {
-            display: none !important;
-        }
-        
-        [data-testid="stSidebarCollapse"] {
-            display: none !important;
-        }
-        
-        [data-testid="stSidebarCollapseButton"] {
-            display: none !important;
-        }
-        
-        /* Hide by class names */
-        .css-1544g2n, .css-163ttbj, .st-emotion-cache-1cypcdb {
-            display: none !important;
-        }
-        
-        /* Hide any span containing keyboard */
-        section[data-testid="stSidebar"] span {
-            content: "" !important;
-        }
-        
-        section[data-testid="stSidebar"] button span:not(.collapse-icon) {
-            visibility: hidden !important;
-            font-size: 0 !important;
-        }
-        
-        /* Force hide the header area */
-        section[data-testid="stSidebar"] > div:first-child > div:first-child {
-            display: none !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    stylesheet = get_stylesheet(theme)
+    st.markdown(stylesheet["html"], unsafe_allow_html=True)
+
+    for font_path in stylesheet["missing_fonts"]:
+        st.error(f"Font file not found: {font_path}")
+
 
+def mark_page(page):
+    """
+    Emit the marker that activates a page's rules in the stylesheet.
+
+    Args:
+        page (str): Page name (e.g. "Upload Keyword")
+    """
+    classes = f"page-marker {get_page_class(page)}"
+    if page in CARD_PAGES:
+        classes += " page-card"
+    st.markdown(f'<span class="{classes}"></span>', unsafe_allow_html=True)
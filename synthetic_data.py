@@ -0,0 +1,301 @@
+"""
+Synthetic Data Module
+---------------------
+This module generates a synthetic retail-media performance dataset with the
+same columns as the performance table (see data_queries.get_performance_data),
+so the app can be load- and scale-tested offline on the DuckDB backend.
+
+The dataset covers retailers x campaigns x keywords x weeks:
+
+- Every retailer runs the same number of campaigns, and every campaign
+  bids on the same number of keywords. Keyword texts repeat across
+  campaigns and retailers, as real search terms do.
+- Each keyword has a heavy-tailed impression volume (log-normal), plus a
+  CTR, conversion rate and CPC drawn around realistic retail-media values.
+  Weekly values add seasonality (with a Q4 uplift) and noise. Clicks and
+  sales are binomial draws, so the ratios stay consistent with the counts.
+
+Generation is deterministic for a given seed and scale. The keyword space
+is split into chunks, each with its own random stream, so chunks can be
+generated in parallel and written to separate Parquet files:
+
+    python synthetic_data.py --rows 100000000 --output data/synthetic --workers 8
+
+The DuckDB backend reads such a folder via DUCKDB_CONFIG["data_path"]
+(e.g. "data/synthetic/*.parquet").
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+RETAILERS = ["Tesco", "Sainsbury's", "Asda", "Morrisons", "Waitrose", "Ocado", "Co-op", "Lidl"]
+
+CATEGORIES = ["Crisps", "Snacks", "Breakfast", "Drinks", "Confectionery", "Bakery"]
+
+# Word pools of the generated keywords
+KEYWORD_WORDS = [
+    "pringles", "crisps", "party", "picnic", "breakfast", "cereal", "buffet",
+    "snacking", "lunchbox", "cocoa", "chocolate", "biscuits", "sour cream",
+    "salted", "multipack", "sharing", "healthy", "family", "original", "bbq"
+]
+
+# Rows per generated chunk (one Parquet file per chunk)
+CHUNK_ROWS = 2_000_000
+
+# Campaigns per retailer at the default scale
+DEFAULT_CAMPAIGNS_PER_RETAILER = 25
+
+
+def get_scale(rows=100_000, weeks=52, retailers=4, campaigns_per_retailer=None):
+    """
+    Work out the dataset dimensions for a target number of rows.
+
+    Args:
+        rows (int): Target number of rows
+        weeks (int): Weeks of history
+        retailers (int): Number of retailers (up to len(RETAILERS))
+        campaigns_per_retailer (int): Campaigns per retailer (default: 25,
+            fewer for small datasets)
+
+    Returns:
+        dict: retailers, campaigns_per_retailer, keywords_per_campaign, weeks,
+            keywords (total keyword slots) and rows (actual row count)
+    """
+    retailers = max(1, min(retailers, len(RETAILERS)))
+    slots = max(rows // weeks, 1)
+    campaigns_per_retailer = campaigns_per_retailer or max(1, min(DEFAULT_CAMPAIGNS_PER_RETAILER, slots // (retailers * 20)))
+    keywords_per_campaign = max(1, slots // (retailers * campaigns_per_retailer))
+    keywords = retailers * campaigns_per_retailer * keywords_per_campaign
+
+    return {
+        "retailers": retailers,
+        "campaigns_per_retailer": campaigns_per_retailer,
+        "keywords_per_campaign": keywords_per_campaign,
+        "weeks": weeks,
+        "keywords": keywords,
+        "rows": keywords * weeks
+    }
+
+
+def get_chunk_count(scale, chunk_rows=CHUNK_ROWS):
+    """
+    Returns the number of chunks a dataset is generated in.
+
+    Args:
+        scale (dict): Output of get_scale
+        chunk_rows (int): Target rows per chunk
+
+    Returns:
+        int: Number of chunks
+    """
+    keywords_per_chunk = max(chunk_rows // scale["weeks"], 1)
+    return -(-scale["keywords"] // keywords_per_chunk)
+
+
+def generate_chunk(scale, chunk_index, seed=0, chunk_rows=CHUNK_ROWS, end_week="2025-02-24"):
+    """
+    Generate one chunk of the dataset as an Arrow table.
+
+    Text columns are dictionary-encoded, so chunks stay small in memory and
+    on disk.
+
+    Args:
+        scale (dict): Output of get_scale
+        chunk_index (int): Chunk to generate (0 to get_chunk_count - 1)
+        seed (int): Random seed of the dataset
+        chunk_rows (int): Target rows per chunk (must match get_chunk_count)
+        end_week (str): Last week commencing date ("YYYY-MM-DD", a Monday)
+
+    Returns:
+        pyarrow.Table: Rows of the chunk's keywords for every week
+    """
+    import pyarrow as pa
+
+    weeks = scale["weeks"]
+    keywords_per_chunk = max(chunk_rows // weeks, 1)
+    start = chunk_index * keywords_per_chunk
+    end = min(start + keywords_per_chunk, scale["keywords"])
+    count = end - start
+
+    # Independent random stream per chunk -> same output regardless of workers
+    rng = np.random.default_rng(np.random.SeedSequence([seed, chunk_index]))
+
+    # Keyword slot -> campaign -> retailer
+    slot = np.arange(start, end)
+    campaign = slot // scale["keywords_per_campaign"]
+    retailer = campaign % scale["retailers"]
+    # Keyword texts are unique within a campaign and shared across campaigns
+    position = slot % scale["keywords_per_campaign"]
+    vocabulary = max(scale["keywords"] // 3, scale["keywords_per_campaign"])
+    keyword_text = (position + campaign * 7919) % vocabulary
+
+    # Keyword-level behaviour
+    base_impressions = rng.lognormal(7.5, 1.3, count)
+    base_ctr = rng.beta(2, 120, count)
+    base_conversion = rng.beta(2, 15, count)
+    base_cpc = rng.lognormal(np.log(0.3), 0.4, count)
+    order_value = rng.lognormal(np.log(4.0), 0.3, count)
+    current_bid = np.round(base_cpc * rng.uniform(1.0, 1.5, count), 2)
+    category = rng.integers(0, len(CATEGORIES), count)
+
+    # Rows: all weeks of the first keyword, then the next keyword, ...
+    row_keyword = np.repeat(np.arange(count), weeks)
+    row_week = np.tile(np.arange(weeks), count)
+    total = count * weeks
+
+    week_dates = pd.date_range(end=end_week, periods=weeks, freq="W-MON")
+    week_of_year = week_dates.isocalendar().week.to_numpy()
+    seasonality = 1 + 0.15 * np.sin(2 * np.pi * week_of_year / 52) + 0.3 * (week_of_year >= 45)
+
+    impressions = np.round(
+        base_impressions[row_keyword] * seasonality[row_week] * rng.lognormal(0, 0.25, total)
+    ).astype(np.int64)
+    clicks = rng.binomial(impressions, base_ctr[row_keyword])
+    sales = rng.binomial(clicks, base_conversion[row_keyword])
+    cpc = base_cpc[row_keyword] * rng.uniform(0.9, 1.1, total)
+    cost = clicks * cpc
+    sales_value = sales * order_value[row_keyword] * rng.uniform(0.8, 1.2, total)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ctr = np.where(impressions > 0, clicks / impressions * 100, 0.0)
+        conversion_rate = np.where(clicks > 0, sales / clicks * 100, 0.0)
+        cpa = np.where(sales > 0, cost / sales, 0.0)
+        roas = np.where(cost > 0, sales_value / cost, 0.0)
+
+    # Text columns: dictionary of the chunk's distinct values + int32 indices
+    texts, text_index = np.unique(keyword_text, return_inverse=True)
+    keyword_names = [
+        f"{KEYWORD_WORDS[t % 20]} {KEYWORD_WORDS[(t // 20) % 20]} {t}" for t in texts.tolist()
+    ]
+    campaigns, campaign_index = np.unique(campaign, return_inverse=True)
+    campaign_names = [
+        f"{RETAILERS[c % scale['retailers']]} - Campaign {c}" for c in campaigns.tolist()
+    ]
+
+    def dictionary(indices, values):
+        return pa.DictionaryArray.from_arrays(
+            pa.array(np.asarray(indices, dtype=np.int32)), pa.array(values, pa.string())
+        )
+
+    return pa.table({
+        "Key": dictionary(text_index[row_keyword], keyword_names),
+        "Name": dictionary(campaign_index[row_keyword], campaign_names),
+        "Imp": impressions,
+        "Clicks": clicks,
+        "Sales": sales,
+        "Average auction ad rank": np.round(rng.uniform(1, 8, total), 2),
+        "CTR": np.round(ctr, 2),
+        "Conv. rate": np.round(conversion_rate, 2),
+        "CPC": np.round(cpc, 2),
+        "CPA": np.round(cpa, 2),
+        "Cost": np.round(cost, 2),
+        "Sales Val": np.round(sales_value, 2),
+        "ROAS": np.round(roas, 2),
+        "Week Commencing": dictionary(row_week, list(week_dates.strftime("%Y-%m-%d"))),
+        "Current Bid": current_bid[row_keyword],
+        "NewBids": current_bid[row_keyword],
+        "comments": dictionary(np.zeros(total), [""]),
+        "Category": dictionary(category[row_keyword], CATEGORIES),
+        "Retailer": dictionary(retailer[row_keyword], RETAILERS[:scale["retailers"]])
+    })
+
+
+def generate_performance_data(rows=100_000, weeks=52, retailers=4, seed=0):
+    """
+    Generate a synthetic dataset in memory.
+
+    Args:
+        rows (int): Approximate number of rows
+        weeks (int): Weeks of history
+        retailers (int): Number of retailers
+        seed (int): Random seed
+
+    Returns:
+        DataFrame: Columns of the performance table, plus "Retailer"
+    """
+    import pyarrow as pa
+
+    scale = get_scale(rows, weeks, retailers)
+    table = pa.concat_tables([
+        generate_chunk(scale, chunk, seed) for chunk in range(get_chunk_count(scale))
+    ])
+
+    # Plain string columns, as returned by the warehouse
+    df = table.to_pandas()
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(str)
+    return df
+
+
+def write_parquet_dataset(output, rows=100_000, weeks=52, retailers=4, seed=0,
+                          workers=None, chunk_rows=CHUNK_ROWS):
+    """
+    Generate a dataset in parallel and write it as Parquet files (one per chunk).
+
+    Args:
+        output (str): Output folder
+        rows (int): Approximate number of rows
+        weeks (int): Weeks of history
+        retailers (int): Number of retailers
+        seed (int): Random seed
+        workers (int): Worker processes (default: CPU count)
+        chunk_rows (int): Target rows per file
+
+    Returns:
+        dict: scale (see get_scale), files and seconds
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    scale = get_scale(rows, weeks, retailers)
+    chunks = get_chunk_count(scale, chunk_rows)
+    os.makedirs(output, exist_ok=True)
+
+    started = time.perf_counter()
+    jobs = [(output, scale, chunk, seed, chunk_rows) for chunk in range(chunks)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        files = [_write_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            files = list(executor.map(_write_chunk, *zip(*jobs)))
+
+    return {"scale": scale, "files": files, "seconds": time.perf_counter() - started}
+
+
+def _write_chunk(output, scale, chunk, seed, chunk_rows):
+    """Generate one chunk and write it to its Parquet file (worker process)."""
+    import pyarrow.parquet as pq
+
+    path = os.path.join(output, f"part-{chunk:05d}.parquet")
+    pq.write_table(generate_chunk(scale, chunk, seed, chunk_rows), path)
+    return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic retail-media performance dataset as Parquet.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Approximate number of rows")
+    parser.add_argument("--weeks", type=int, default=52, help="Weeks of history")
+    parser.add_argument("--retailers", type=int, default=4, help=f"Number of retailers (max {len(RETAILERS)})")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Rows per Parquet file")
+    parser.add_argument("--output", default="data/synthetic", help="Output folder")
+    args = parser.parse_args()
+
+    result = write_parquet_dataset(
+        args.output, args.rows, args.weeks, args.retailers, args.seed, args.workers, args.chunk_rows
+    )
+    scale = result["scale"]
+    print(
+        f"Wrote {scale['rows']:,} rows ({scale['retailers']} retailers x "
+        f"{scale['campaigns_per_retailer']} campaigns x {scale['keywords_per_campaign']:,} keywords x "
+        f"{scale['weeks']} weeks) to {len(result['files'])} files in {args.output} "
+        f"in {result['seconds']:.1f}s"
+    )
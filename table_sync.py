@@ -0,0 +1,406 @@
+"""
+Table Sync Module
+-----------------
+This module keeps a local snapshot of the performance table, and rollups of
+it, up to date incrementally.
+
+Layout under the sync root (see SYNC_CONFIG in config.py):
+
+    snapshot.parquet            all rows of the table
+    rollups/{name}.parquet      weekly totals per ROLLUPS grouping
+    state.json                  mode, last synced table version and week
+
+The first sync reads the whole table. Later syncs only read what changed:
+
+- cdf: the rows changed since the last synced table version, read from the
+  table's change data feed (Delta table_changes on Databricks, a simulated
+  feed on DuckDB - see commit_duckdb_changes in backends.py)
+- watermark: the rows from lookback_weeks weeks before the last synced week
+  onwards; those weeks are replaced as a whole, so restated and deleted rows
+  are picked up too
+
+Changed rows are merged into the snapshot by key (get_key_columns) and only
+the rollup rows of the affected weeks are rebuilt. Syncs are meant to run
+from one process at a time (e.g. a scheduled job).
+
+Usage:
+    python table_sync.py [--mode auto|cdf|watermark] [--full]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+import pandas as pd
+from config import SYNC_CONFIG
+
+WEEK_COLUMN = "Week Commencing"
+
+# Columns identifying a row, besides the retailer column (if configured)
+KEY_COLUMNS = [WEEK_COLUMN, "Name", "Key"]
+
+# Columns the change data feed adds to the table's columns
+CHANGE_COLUMNS = ["_change_type", "_commit_version", "_commit_timestamp"]
+
+# Order of change types within one commit (the last change of a key wins)
+CHANGE_ORDER = {"update_preimage": 0, "delete": 1, "insert": 2, "update_postimage": 3}
+
+# Rollup name -> grouping columns (week and retailer are always included)
+ROLLUPS = {
+    "weekly_retailer": [],
+    "weekly_campaign": ["Name"]
+}
+
+# Columns summed by the rollups
+ROLLUP_MEASURES = ["Imp", "Clicks", "Sales", "Cost", "Sales Val"]
+
+SYNC_MODES = ["auto", "cdf", "watermark"]
+
+
+def get_sync_root():
+    """
+    Returns the folder the snapshot, rollups and sync state are written to.
+
+    Returns:
+        str: Sync root (TABLE_SYNC_PATH environment variable or config.py)
+    """
+    return os.getenv("TABLE_SYNC_PATH") or SYNC_CONFIG.get("root", "data/sync")
+
+
+def get_key_columns():
+    """Columns identifying a row of the performance table."""
+    from data_queries import get_retailer_column
+
+    retailer_column = get_retailer_column()
+    return KEY_COLUMNS + ([retailer_column] if retailer_column else [])
+
+
+def get_rollup_groups(name):
+    """Grouping columns of a rollup (see ROLLUPS)."""
+    from data_queries import get_retailer_column
+
+    retailer_column = get_retailer_column()
+    return [WEEK_COLUMN] + ([retailer_column] if retailer_column else []) + ROLLUPS[name]
+
+
+def get_sync_mode(mode=None):
+    """
+    Resolve the sync mode.
+
+    Args:
+        mode (str): "auto", "cdf" or "watermark" (default: SYNC_CONFIG["mode"])
+
+    Returns:
+        str: "cdf" or "watermark" ("auto" is cdf where the backend has a change feed)
+
+    Raises:
+        ValueError: If the mode doesn't exist, or is "cdf" on a backend without a change feed
+    """
+    from backends import get_backend
+
+    mode = mode or SYNC_CONFIG.get("mode", "auto")
+    if mode not in SYNC_MODES:
+        raise ValueError(f"Invalid sync mode: {mode}. Must be one of {SYNC_MODES}")
+
+    has_feed = get_backend()["table_changes_query"] is not None
+    if mode == "auto":
+        return "cdf" if has_feed else "watermark"
+    if mode == "cdf" and not has_feed:
+        raise ValueError(f"{get_backend()['name']} has no change data feed; use the watermark mode")
+    return mode
+
+
+def load_state(root=None):
+    """
+    Load the state of the last sync.
+
+    Args:
+        root (str): Sync root (default: get_sync_root())
+
+    Returns:
+        dict: mode, version, max_week, rows, synced_at (None if never synced)
+    """
+    path = os.path.join(root or get_sync_root(), "state.json")
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_snapshot(root=None, columns=None):
+    """
+    Load the local snapshot of the performance table.
+
+    Args:
+        root (str): Sync root (default: get_sync_root())
+        columns (list): Columns to read (default: all)
+
+    Returns:
+        DataFrame: Snapshot rows (or None if never synced)
+    """
+    path = os.path.join(root or get_sync_root(), "snapshot.parquet")
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path, columns=columns)
+
+
+def load_rollup(name, root=None):
+    """
+    Load a rollup of the snapshot.
+
+    Args:
+        name (str): One of ROLLUPS
+        root (str): Sync root (default: get_sync_root())
+
+    Returns:
+        DataFrame: Grouping columns, ROLLUP_MEASURES and rows (or None if never synced)
+    """
+    if name not in ROLLUPS:
+        raise ValueError(f"Invalid rollup: {name}. Must be one of {list(ROLLUPS)}")
+
+    path = os.path.join(root or get_sync_root(), "rollups", f"{name}.parquet")
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def get_table_version():
+    """
+    Get the latest version of the performance table.
+
+    Returns:
+        int: Table version
+    """
+    from backends import get_backend
+
+    df = _fetch(get_backend()["table_version_query"]())
+    if df.empty:
+        raise ValueError("The table has no version history")
+    return int(df["version"].max())
+
+
+def resolve_changes(changes, keys):
+    """
+    Reduce change data feed rows to the final state of each changed key.
+
+    Args:
+        changes (DataFrame): Table columns plus CHANGE_COLUMNS
+        keys (list): Columns identifying a row
+
+    Returns:
+        tuple: (rows to upsert, keys to delete, set of affected weeks)
+    """
+    if changes.empty:
+        return changes.drop(columns=CHANGE_COLUMNS, errors="ignore"), changes[keys], set()
+
+    ordered = changes.assign(_order=changes["_change_type"].map(CHANGE_ORDER)).sort_values(
+        ["_commit_version", "_order"], kind="stable"
+    )
+    latest = ordered.drop_duplicates(keys, keep="last")
+    alive = latest["_change_type"].isin(["insert", "update_postimage"])
+
+    upserts = latest[alive].drop(columns=CHANGE_COLUMNS + ["_order"], errors="ignore")
+    deletes = latest.loc[~alive, keys]
+    return upserts.reset_index(drop=True), deletes.reset_index(drop=True), set(changes[WEEK_COLUMN])
+
+
+def merge_rows(snapshot, upserts, deletes, keys):
+    """
+    Merge changed rows into the snapshot by key.
+
+    Args:
+        snapshot (DataFrame): Current snapshot
+        upserts (DataFrame): Rows replacing (or adding to) the snapshot rows with their key
+        deletes (DataFrame): Keys of rows to remove
+        keys (list): Columns identifying a row
+
+    Returns:
+        DataFrame: New snapshot
+    """
+    changed = pd.concat([upserts[keys], deletes[keys]], ignore_index=True)
+    if changed.empty:
+        return snapshot
+
+    stale = pd.MultiIndex.from_frame(snapshot[keys]).isin(pd.MultiIndex.from_frame(changed))
+    return pd.concat([snapshot[~stale], upserts[snapshot.columns]], ignore_index=True)
+
+
+def build_rollup(frame, groups):
+    """Sum ROLLUP_MEASURES of frame per grouping (plus the number of rows)."""
+    measures = [column for column in ROLLUP_MEASURES if column in frame.columns]
+    return (
+        frame.groupby(groups, dropna=False)
+        .agg(**{column: (column, "sum") for column in measures}, rows=(WEEK_COLUMN, "size"))
+        .reset_index()
+    )
+
+
+def update_rollups(root, snapshot, weeks=None):
+    """
+    Rebuild the rollup rows of the affected weeks.
+
+    Args:
+        root (str): Sync root
+        snapshot (DataFrame): Snapshot after the sync
+        weeks (set): Affected weeks (None = rebuild everything)
+    """
+    folder = os.path.join(root, "rollups")
+    os.makedirs(folder, exist_ok=True)
+
+    for name in ROLLUPS:
+        groups = get_rollup_groups(name)
+        path = os.path.join(folder, f"{name}.parquet")
+
+        if weeks is None or not os.path.exists(path):
+            rollup = build_rollup(snapshot, groups)
+        else:
+            existing = pd.read_parquet(path)
+            fresh = build_rollup(snapshot[snapshot[WEEK_COLUMN].isin(weeks)], groups)
+            rollup = pd.concat([existing[~existing[WEEK_COLUMN].isin(weeks)], fresh], ignore_index=True)
+
+        _write_parquet(rollup.sort_values(groups, kind="stable"), path)
+
+
+def sync_table(mode=None, full=False, root=None):
+    """
+    Bring the local snapshot and rollups up to date with the performance table.
+
+    Args:
+        mode (str): "auto", "cdf" or "watermark" (default: SYNC_CONFIG["mode"])
+        full (bool): Re-read the whole table instead of only what changed
+        root (str): Sync root (default: get_sync_root())
+
+    Returns:
+        dict: mode, full, from_version, version, rows_changed, rows_deleted,
+            weeks_rebuilt, rows, max_week, seconds
+    """
+    from backends import get_backend
+    from data_queries import get_table_name, ident, quote_literal
+
+    started = time.perf_counter()
+    root = root or get_sync_root()
+    mode = get_sync_mode(mode)
+    state = load_state(root)
+    keys = get_key_columns()
+    snapshot = None if full else load_snapshot(root)
+
+    full = snapshot is None or state is None or state.get("mode") != mode or not state.get("max_week")
+    from_version = None if full else state.get("version")
+    deleted = 0
+
+    if full:
+        # Versions are read before the rows: changes in between are re-applied
+        # by the next sync, which is harmless as merges are by key
+        version = get_table_version() if mode == "cdf" else None
+        snapshot = _fetch(f"SELECT * FROM {get_table_name()}")
+        changed = len(snapshot)
+        weeks = None
+    elif mode == "cdf":
+        version = get_table_version()
+        if version <= from_version:
+            return _finish(root, state, mode, snapshot, from_version, version, 0, 0, set(), started, write=False)
+
+        changes = _fetch(get_backend()["table_changes_query"](from_version + 1, version))
+        upserts, deletes, weeks = resolve_changes(changes, keys)
+        snapshot = merge_rows(snapshot, upserts, deletes, keys)
+        changed, deleted = len(upserts), len(deletes)
+    else:
+        version = None
+        since = _weeks_before(state["max_week"], SYNC_CONFIG.get("lookback_weeks", 2))
+        rows = _fetch(
+            f"SELECT * FROM {get_table_name()} WHERE {ident(WEEK_COLUMN)} >= {quote_literal(since)}"
+        )
+        # Weeks that disappeared upstream are affected too
+        weeks = set(rows[WEEK_COLUMN]) | set(snapshot.loc[snapshot[WEEK_COLUMN] >= since, WEEK_COLUMN])
+        replaced = snapshot[WEEK_COLUMN].isin(weeks)
+        deleted = int((~pd.MultiIndex.from_frame(snapshot.loc[replaced, keys]).isin(
+            pd.MultiIndex.from_frame(rows[keys])
+        )).sum())
+        snapshot = pd.concat([snapshot[~replaced], rows[snapshot.columns]], ignore_index=True)
+        changed = len(rows)
+
+    return _finish(root, state, mode, snapshot, from_version, version, changed, deleted, weeks, started)
+
+
+def _finish(root, state, mode, snapshot, from_version, version, changed, deleted, weeks, started, write=True):
+    """Write the snapshot, rollups and state of a sync and summarize it."""
+    max_week = snapshot[WEEK_COLUMN].max() if len(snapshot) else None
+
+    if write:
+        os.makedirs(root, exist_ok=True)
+        _write_parquet(snapshot, os.path.join(root, "snapshot.parquet"))
+        update_rollups(root, snapshot, weeks)
+
+    state = {
+        "mode": mode,
+        "version": version if version is not None else (state or {}).get("version"),
+        "max_week": max_week,
+        "rows": len(snapshot),
+        "synced_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+    _write_json(state, os.path.join(root, "state.json"))
+
+    return {
+        "mode": mode,
+        "full": weeks is None,
+        "from_version": from_version,
+        "version": version,
+        "rows_changed": changed,
+        "rows_deleted": deleted,
+        "weeks_rebuilt": None if weeks is None else len(weeks),
+        "rows": len(snapshot),
+        "max_week": max_week,
+        "seconds": round(time.perf_counter() - started, 3)
+    }
+
+
+def _fetch(query):
+    """Run a sync query, raising on failure (unlike run_query), with weeks as "YYYY-MM-DD"."""
+    import pyarrow as pa
+    from data_connection import iter_query_batches
+
+    batches = list(iter_query_batches(query))
+    df = pa.concat_tables(batches).to_pandas() if batches else pd.DataFrame()
+    if WEEK_COLUMN in df.columns:
+        df[WEEK_COLUMN] = df[WEEK_COLUMN].astype(str).str[:10]
+    return df
+
+
+def _weeks_before(week, weeks):
+    """The date a number of weeks before a "YYYY-MM-DD" week (as "YYYY-MM-DD")."""
+    return (date.fromisoformat(week) - timedelta(weeks=int(weeks))).isoformat()
+
+
+def _write_parquet(df, path):
+    """Write a DataFrame to Parquet atomically (readers never see partial files)."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _write_json(data, path):
+    """Write JSON atomically."""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync the local snapshot and rollups of the performance table.")
+    parser.add_argument("--mode", choices=SYNC_MODES, default=None)
+    parser.add_argument("--full", action="store_true", help="Re-read the whole table")
+    parser.add_argument("--root", default=None, help="Sync folder (default: SYNC_CONFIG / TABLE_SYNC_PATH)")
+    args = parser.parse_args()
+
+    summary = sync_table(mode=args.mode, full=args.full, root=args.root)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
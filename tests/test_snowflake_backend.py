@@ -0,0 +1,174 @@
+"""
+Snowflake Backend Tests
+-----------------------
+Offline tests of the Snowflake backend (backends.py) against a fake
+connector module set with set_snowflake_connector, so no account or
+snowflake-connector-python is needed.
+"""
+
+import sys
+import os
+
+import pyarrow as pa
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backends  # noqa: E402
+
+
+class FakeCursor:
+    """Cursor returning preset Arrow results."""
+
+    def __init__(self, table=None, batches=None, description=None):
+        self.table = table
+        self.batches = batches or []
+        self.description = description
+        self.queries = []
+
+    def execute(self, query):
+        self.queries.append(query)
+        return self
+
+    def fetch_arrow_all(self):
+        return self.table
+
+    def fetch_arrow_batches(self):
+        return iter(self.batches)
+
+
+class FakeConnection:
+    """Connection handing out one preset cursor."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+class FakeConnector:
+    """Stand-in for the snowflake.connector module, recording connect kwargs."""
+
+    def __init__(self, cursor=None):
+        self.cursor = cursor or FakeCursor()
+        self.calls = []
+
+    def connect(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeConnection(self.cursor)
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    """Fake connector with a complete account configured through the environment."""
+    monkeypatch.setenv("SNOWFLAKE_ACCOUNT", "test_account")
+    monkeypatch.setenv("SNOWFLAKE_USER", "test_user")
+    monkeypatch.setenv("SNOWFLAKE_PASSWORD", "test_password")
+    monkeypatch.setenv("SNOWFLAKE_WAREHOUSE", "DEFAULT_WH")
+    monkeypatch.setenv("SNOWFLAKE_DATABASE", "TEST_DB")
+    monkeypatch.setenv("SNOWFLAKE_SCHEMA", "PUBLIC")
+
+    fake = FakeConnector()
+    backends.set_snowflake_connector(fake)
+    yield fake
+    backends.set_snowflake_connector(None)
+
+
+def test_connect_keeps_session_alive(connector):
+    backends.connect_snowflake({"snowflake_warehouse": ""})
+
+    kwargs = connector.calls[-1]
+    assert kwargs["client_session_keep_alive"] is True
+    assert kwargs["account"] == "test_account"
+    assert kwargs["user"] == "test_user"
+    assert kwargs["database"] == "TEST_DB"
+
+
+def test_connect_uses_workload_warehouse(connector):
+    backends.connect_snowflake({"snowflake_warehouse": "BATCH_WH"})
+    assert connector.calls[-1]["warehouse"] == "BATCH_WH"
+
+
+def test_connect_falls_back_to_default_warehouse(connector):
+    backends.connect_snowflake({"snowflake_warehouse": None})
+    assert connector.calls[-1]["warehouse"] == "DEFAULT_WH"
+
+
+def test_connect_skips_unset_settings(connector, monkeypatch):
+    monkeypatch.delenv("SNOWFLAKE_SCHEMA")
+    monkeypatch.setitem(backends.SNOWFLAKE_CONFIG, "schema", "")
+    monkeypatch.setitem(backends.SNOWFLAKE_CONFIG, "role", "")
+    monkeypatch.delenv("SNOWFLAKE_ROLE", raising=False)
+
+    backends.connect_snowflake({})
+
+    assert "schema" not in connector.calls[-1]
+    assert "role" not in connector.calls[-1]
+
+
+def test_connect_without_credentials_returns_none(connector, monkeypatch):
+    monkeypatch.delenv("SNOWFLAKE_PASSWORD")
+    monkeypatch.setitem(backends.SNOWFLAKE_CONFIG, "password", "")
+
+    assert backends.connect_snowflake({}) is None
+    assert connector.calls == []
+
+
+def test_fetch_arrow_returns_table():
+    table = pa.table({"WEEK": ["2024-01-01"], "SPEND": [12.5]})
+    cursor = FakeCursor(table=table)
+
+    assert backends.fetch_snowflake_arrow(cursor).equals(table)
+
+
+def test_fetch_arrow_empty_result_keeps_columns():
+    # fetch_arrow_all() returns None when the query matched no rows
+    cursor = FakeCursor(table=None, description=[("WEEK",), ("SPEND",)])
+
+    table = backends.fetch_snowflake_arrow(cursor)
+
+    assert table.num_rows == 0
+    assert table.column_names == ["WEEK", "SPEND"]
+    assert list(table.to_pandas().columns) == ["WEEK", "SPEND"]
+
+
+def test_fetch_arrow_empty_result_without_description():
+    table = backends.fetch_snowflake_arrow(FakeCursor(table=None, description=None))
+    assert table.num_rows == 0
+    assert table.num_columns == 0
+
+
+def test_fetch_batches_yields_connector_batches():
+    batches = [
+        pa.table({"ID": [1, 2]}),
+        pa.table({"ID": [3]})
+    ]
+    cursor = FakeCursor(batches=batches)
+
+    result = list(backends.fetch_snowflake_batches(cursor, batch_size=2))
+
+    assert result == batches
+    assert sum(batch.num_rows for batch in result) == 3
+
+
+def test_backend_entry_runs_query_on_cursor(connector):
+    backend = backends.get_backend("snowflake")
+    connector.cursor.table = pa.table({"ID": [1]})
+
+    connection = backend["connect"]({"snowflake_warehouse": "INTERACTIVE_WH"})
+    cursor = backend["execute"](connection, "SELECT ID FROM t")
+
+    assert cursor.queries == ["SELECT ID FROM t"]
+    assert backend["fetch_arrow"](cursor).to_pydict() == {"ID": [1]}
+
+
+def test_workload_profile_selects_warehouse(connector, monkeypatch):
+    from data_connection import get_warehouse_profile
+
+    monkeypatch.setenv("SNOWFLAKE_WAREHOUSE_BATCH", "BATCH_WH")
+
+    backends.connect_snowflake(get_warehouse_profile("batch"))
+
+    assert connector.calls[-1]["warehouse"] == "BATCH_WH"
+    assert connector.calls[-1]["client_session_keep_alive"] is True
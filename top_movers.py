@@ -0,0 +1,155 @@
+"""
+Top Movers Module
+-----------------
+This module answers the top-N panels of the Dashboard ("top keywords by
+spend growth", "biggest ROAS drops this week").
+
+Per-keyword totals of the selected week and the week before are fetched
+once per retailer and week and shared by all sessions (dataset_registry.py). Each panel then selects its N
+keywords with np.argpartition, so only the N winners are sorted rather than
+the full keyword set. Cached totals hold interned int32 keyword IDs (see
+interning.py), and only the N selected keywords are decoded.
+
+With MOVERS_ENGINE = "warehouse" the selection runs in the warehouse
+instead (QUALIFY ROW_NUMBER(), see data_queries.build_top_movers_query) and
+only N rows are transferred.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from interning import decode_ids, intern_arrow
+
+# Panels: key -> title, metric and direction of the change
+MOVER_PANELS = {
+    "spend_growth": {"title": "Top Keywords by Spend Growth", "metric": "spend", "largest": True},
+    "roas_drop": {"title": "Biggest ROAS Drops This Week", "metric": "roas", "largest": False},
+}
+
+# Where the top-N selection runs: "local" (argpartition) or "warehouse" (QUALIFY)
+MOVERS_ENGINE = "local"
+
+# How long week totals and panel results stay cached (seconds)
+MOVERS_CACHE_TTL = 600
+
+
+def top_n_indices(values, n, largest=True):
+    """
+    Get the positions of the N largest (or smallest) values, best first.
+
+    Uses partial selection: O(len(values)) to find the N winners, then only
+    those N are sorted. Missing values are never selected.
+
+    Args:
+        values (array-like): Values to rank
+        n (int): Number of positions to return
+        largest (bool): True for the largest values, False for the smallest
+
+    Returns:
+        ndarray: Positions into values
+    """
+    values = np.asarray(values, dtype=float)
+    candidates = np.flatnonzero(~np.isnan(values))
+    keys = -values[candidates] if largest else values[candidates]
+
+    if n <= 0 or len(keys) == 0:
+        return np.array([], dtype=int)
+
+    if n < len(keys):
+        winners = np.argpartition(keys, n - 1)[:n]
+    else:
+        winners = np.arange(len(keys))
+
+    winners = winners[np.argsort(keys[winners], kind="stable")]
+    return candidates[winners]
+
+
+def load_week_totals(retailer, week):
+    """
+    Get per-keyword totals of a week and the week before.
+
+    The totals are held once per process in the dataset registry (see
+    dataset_registry.py) and shared by all sessions, reloaded after
+    MOVERS_CACHE_TTL seconds.
+
+    Args:
+        retailer (str): Retailer name
+        week (str): Week commencing date (or "Week of ..." label)
+
+    Returns:
+        DataFrame: Columns keyword_id (int32, see interning.py), spend,
+            prev_spend, roas, prev_roas (empty if no data is available)
+    """
+    from dataset_registry import acquire_dataset, get_dataset
+
+    try:
+        handle = acquire_dataset(
+            f"week_totals:{retailer}:{week}",
+            lambda: _fetch_week_totals(retailer, week),
+            ttl=MOVERS_CACHE_TTL
+        )
+    except ValueError:
+        return pd.DataFrame(columns=["keyword_id", "spend", "prev_spend", "roas", "prev_roas"])
+    return get_dataset(handle)
+
+
+@st.cache_data(ttl=MOVERS_CACHE_TTL, show_spinner=False)
+def get_top_movers(retailer, week, panel, n=20):
+    """
+    Get the N keywords of a movers panel (cached per retailer, week and panel).
+
+    Args:
+        retailer (str): Retailer name
+        week (str): Week commencing date (or "Week of ..." label)
+        panel (str): One of MOVER_PANELS
+        n (int): Number of keywords
+
+    Returns:
+        DataFrame: Columns keyword, current, previous, change (best first)
+    """
+    if panel not in MOVER_PANELS:
+        raise ValueError(f"Invalid panel: {panel}. Must be one of {list(MOVER_PANELS)}")
+
+    metric = MOVER_PANELS[panel]["metric"]
+    largest = MOVER_PANELS[panel]["largest"]
+
+    if MOVERS_ENGINE == "warehouse":
+        from data_connection import run_query
+        from data_queries import build_top_movers_query
+        return run_query(build_top_movers_query(metric, n, largest, retailer, week), cache=True)
+
+    totals = load_week_totals(retailer, week)
+    current = totals[metric].to_numpy(dtype=float)
+    previous = totals[f"prev_{metric}"].to_numpy(dtype=float)
+    change = current - previous
+
+    positions = top_n_indices(change, n, largest)
+    return pd.DataFrame({
+        "keyword": decode_ids("keyword", totals["keyword_id"].to_numpy()[positions]),
+        "current": current[positions],
+        "previous": previous[positions],
+        "change": change[positions]
+    })
+
+
+def _fetch_week_totals(retailer, week):
+    """Query the week totals of load_week_totals (raises ValueError when empty, so failures are not kept)."""
+    from data_queries import get_keyword_week_totals
+
+    import pyarrow as pa
+
+    table = get_keyword_week_totals(retailer, week)
+    if table is None or table.num_rows == 0:
+        raise ValueError("No keyword totals available")
+
+    # Columns are read straight from the Arrow result (no DataFrame in between)
+    def column(name):
+        return table.column(name).cast(pa.float64()).to_numpy()
+
+    totals = pd.DataFrame({"keyword_id": intern_arrow("keyword", table.column("keyword"))})
+    for prefix in ("", "prev_"):
+        spend = column(f"{prefix}spend")
+        totals[f"{prefix}spend"] = spend
+        with np.errstate(divide="ignore", invalid="ignore"):
+            totals[f"{prefix}roas"] = np.where(spend != 0, column(f"{prefix}sales_value") / spend, np.nan)
+    return totals
@@ -12,48 +12,6 @@ def render_upload_keyword():
     """
     Render the Upload Keyword page content.
     """
-    # Add page background and styling to match Dashboard
-    st.markdown("""
-        <style>
-        /* Light grey background for entire page */
-        [data-testid="stAppViewContainer"] {
-            background-color: #FCFCFC !important;
-        }
-        
-        /* White container for main content with border shadow */
-        section[data-testid="stMain"] > div:first-child {
-            background-color: white;
-            border-radius: 12px;
-            padding: 32px;
-            margin: 24px;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            border: 1px solid #E5E7EB;
-            max-width: 100%;
-            overflow-x: hidden;
-        }
-        
-        /* Prevent horizontal scroll */
-        [data-testid="stAppViewContainer"] {
-            overflow-x: hidden !important;
-        }
-        section[data-testid="stMain"] {
-            overflow-x: hidden !important;
-        }
-        
-        /* Custom background color for sidebar */
-        section[data-testid="stSidebar"] {
-            background-color: #FCFCFC !important;
-            border-right: 1px solid #E5E7EB;
-        }
-        
-        /* Ensure columns fit within viewport */
-        [data-testid="column"] {
-            max-width: 100% !important;
-            overflow-x: hidden !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     # Header Section
     st.markdown("""
         <div style="margin-bottom: 24px;">
@@ -68,16 +26,6 @@ def render_upload_keyword():
     
     # Retailer Selection Section
     st.markdown("""
-        <style>
-        /* Limit the width of the retailer selectbox */
-        div[data-testid="stSelectbox"][data-baseweb="select"] {
-            max-width: 300px !important;
-        }
-        /* Reduce spacing between sections */
-        div[data-testid="stVerticalBlock"] > div {
-            margin-bottom: 0px !important;
-        }
-        </style>
         <div style="margin-bottom: 24px; margin-top: 0px;">
             <label style="font-family: 'Gilroy', sans-serif; font-weight: 500; font-size: 14px; color: #1F2937; display: block; margin-bottom: 8px;">
                 Retailer
@@ -135,25 +83,6 @@ def render_upload_keyword():
 
 def render_upload_section():
     """Render the CSV upload section."""
-    # Add CSS to remove all unnecessary margins
-    st.markdown("""
-        <style>
-        /* Remove all element container margins in upload section */
-        .element-container {
-            margin-top: 0 !important;
-            margin-bottom: 0 !important;
-        }
-        [data-testid="stFileUploader"] {
-            position: absolute;
-            opacity: 0;
-            width: 0;
-            height: 0;
-            overflow: hidden;
-            margin: 0 !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     st.markdown("""
         <h2 style="font-family: 'Gilroy', sans-serif; font-weight: 600; font-size: 18px; color: #1F2937; margin: 0 0 12px 0; padding: 0;">
             Upload keyword data in CSV
@@ -252,23 +181,6 @@ def render_upload_section():
     
     # Show uploaded file info and configuration form
     else:
-        import pandas as pd
-        
-        # Add CSS to remove default margins from success message
-        st.markdown("""
-            <style>
-            .element-container:has(> .stAlert) {
-                margin-top: 0 !important;
-                padding-top: 0 !important;
-            }
-            div.stAlert {
-                margin-top: 0 !important;
-                margin-bottom: 8px !important;
-                padding: 10px 14px !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-        
         # Success message
         st.success(f"✓ Your Document Uploaded Successfully !")
         
@@ -288,79 +200,191 @@ def render_upload_section():
         
         # Read CSV
         try:
-            df = pd.read_csv(uploaded_file)
-            
-            # Extract unique keys from 'Search Term' or 'Key' column
-            if 'Search Term' in df.columns:
-                unique_keys = df['Search Term'].unique().tolist()
-            elif 'Key' in df.columns:
-                unique_keys = df['Key'].unique().tolist()
-            else:
-                # Use first column as key
-                unique_keys = df.iloc[:, 0].unique().tolist()
+            stats = load_keyword_stats(uploaded_file)
             
             # Render configuration form
-            render_bid_configuration_form(unique_keys)
+            render_bid_configuration_form(stats, upload_id=f"{uploaded_file.name}:{uploaded_file.size}")
             
         except Exception as e:
             st.error(f"Error reading CSV file: {str(e)}")
 
 
-def render_bid_configuration_form(unique_keys):
-    """Render the bid configuration form with unique keys."""
-    # Clean CSS implementation for table inputs
-    st.markdown("""
-        <style>
-        /* Clean compact table styling */
-        div[data-testid="column"] {
-            padding: 2px 4px !important;
-            margin: 0 !important;
-        }
-        
-        div[data-testid="stHorizontalBlock"] {
-            gap: 8px !important;
-            margin-bottom: 4px !important;
-        }
+def load_keyword_stats(uploaded_file):
+    """
+    Get the normalized keyword stats of an uploaded CSV.
+    
+    The CSV is parsed once per file content and spilled to a Parquet file
+    (see spill_keyword_stats). The stats are shared by all sessions through
+    the dataset registry, whose loader re-reads the Parquet file, so the
+    registry never holds the uploaded bytes; the session only keeps the handle.
+    
+    Args:
+        uploaded_file (UploadedFile): Uploaded CSV file
+    
+    Returns:
+        DataFrame: Normalized keyword stats (see bid_model.prepare_keyword_stats)
+    """
+    import hashlib
+    
+    import pandas as pd
+    from dataset_registry import acquire_dataset, get_dataset
+    
+    digest = hashlib.sha1(uploaded_file.getvalue()).hexdigest()
+    path = spill_keyword_stats(uploaded_file, digest)
+    
+    handle = acquire_dataset(f"keyword_upload:{digest}", lambda: pd.read_parquet(path))
+    st.session_state["keyword_stats_handle"] = handle
+    
+    return get_dataset(handle)
+
+
+def get_upload_dir():
+    """
+    Returns the folder parsed keyword uploads are spilled to.
+    
+    Returns:
+        str: Upload folder (UPLOAD_PATH environment variable or config.py)
+    """
+    import os
+    
+    from config import STORAGE_CONFIG
+    
+    return os.getenv("UPLOAD_PATH") or STORAGE_CONFIG.get("upload_dir", "data/uploads")
+
+
+def spill_keyword_stats(uploaded_file, digest):
+    """
+    Parse an uploaded CSV into normalized keyword stats and write them to Parquet.
+    
+    Files are keyed by content, so an upload already spilled (by any
+    session or process) is not parsed again.
+    
+    Args:
+        uploaded_file (UploadedFile): Uploaded CSV file
+        digest (str): SHA-1 of the file content
+    
+    Returns:
+        str: Path of the Parquet file
+    """
+    import io
+    import os
+    import uuid
+    
+    import pandas as pd
+    from bid_model import prepare_keyword_stats
+    
+    folder = get_upload_dir()
+    path = os.path.join(folder, f"{digest}.parquet")
+    if os.path.exists(path):
+        return path
+    
+    os.makedirs(folder, exist_ok=True)
+    stats = prepare_keyword_stats(pd.read_csv(io.BytesIO(uploaded_file.getvalue())))
+    
+    # Write atomically: readers never see partial files
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    stats.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def get_constraint_frame(stats, upload_id):
+    """
+    Get the constraint table for the current upload from session state.
+    
+    A fresh table is created whenever a different file is uploaded or the
+    retailer changes. Keys in the retailer's last saved constraint set keep
+    their saved values; new keys get the defaults.
+    
+    Args:
+        stats (DataFrame): Normalized keyword stats of the upload
+        upload_id (str): Identifies the uploaded file
+    
+    Returns:
+        DataFrame: Constraint table backing the editor
+    """
+    from bid_model import constraint_frame_for_stats
+    from run_store import load_constraints
+    
+    retailer = st.session_state.get("retailer_select")
+    upload_id = f"{retailer}:{upload_id}"
+    
+    if st.session_state.get("bid_constraints_upload") != upload_id:
+        # Start from the retailer's last saved constraints (one Parquet read)
+        try:
+            saved = load_constraints(retailer)
+        except Exception as e:
+            st.warning(f"Could not load saved constraints: {str(e)}")
+            saved = None
         
-        .element-container {
-            margin: 0 !important;
-            padding: 0 !important;
-        }
+        st.session_state["bid_constraints"] = constraint_frame_for_stats(stats, saved)
+        st.session_state["bid_constraints_upload"] = upload_id
+        st.session_state.pop("bid_constraints_editor", None)
+    
+    return st.session_state["bid_constraints"]
+
+
+def apply_bulk_rule():
+    """Apply the bulk edit rule form to the constraint table (button callback)."""
+    from bid_model import apply_constraint_rule
+    
+    # Start from the table as last edited so grid edits are kept
+    constraints = st.session_state.get("bid_constraints_edited", st.session_state["bid_constraints"])
+    
+    campaign = st.session_state.get("bulk_rule_campaign")
+    updated, matched = apply_constraint_rule(
+        constraints,
+        field=st.session_state["bulk_rule_field"],
+        value=st.session_state["bulk_rule_value"],
+        campaign=None if campaign in (None, "All Campaigns") else campaign,
+        key_contains=st.session_state.get("bulk_rule_contains", "")
+    )
+    
+    st.session_state["bid_constraints"] = updated
+    st.session_state["bulk_rule_matched"] = matched
+    # Reset the editor so it shows the updated table instead of replaying old edits
+    st.session_state.pop("bid_constraints_editor", None)
+
+
+def render_bulk_rule_form(constraints):
+    """Render the controls for editing many keys' constraints at once."""
+    from bid_model import CONSTRAINT_LABELS
+    
+    with st.expander("Bulk edit by rule"):
+        col1, col2, col3, col4, col5 = st.columns([1.5, 1.5, 1.5, 1, 1])
         
-        /* Text input styling - compact and centered */
-        div[data-testid="stTextInput"] {
-            margin: 0 !important;
-        }
+        with col1:
+            if "campaign_name" in constraints.columns:
+                campaigns = sorted(constraints["campaign_name"].dropna().astype(str).unique().tolist())
+                st.selectbox("Campaign", ["All Campaigns"] + campaigns, key="bulk_rule_campaign")
+            else:
+                st.session_state.pop("bulk_rule_campaign", None)
         
-        div[data-testid="stTextInput"] > div {
-            margin: 0 !important;
-        }
+        with col2:
+            st.text_input("Keyword contains", key="bulk_rule_contains")
         
-        div[data-testid="stTextInput"] input {
-            width: 70px !important;
-            padding: 6px 8px !important;
-            font-size: 13px !important;
-            text-align: center !important;
-            font-family: 'Gilroy', sans-serif !important;
-        }
+        with col3:
+            st.selectbox(
+                "Set",
+                list(CONSTRAINT_LABELS),
+                format_func=CONSTRAINT_LABELS.get,
+                key="bulk_rule_field"
+            )
         
-        /* Selectbox styling - compact */
-        div[data-testid="stSelectbox"] {
-            margin: 0 !important;
-        }
+        with col4:
+            st.number_input("Value", min_value=0.0, value=0.80, step=0.05, key="bulk_rule_value")
         
-        div[data-testid="stSelectbox"] > div {
-            margin: 0 !important;
-        }
+        with col5:
+            st.markdown("<div style='height: 28px;'></div>", unsafe_allow_html=True)
+            st.button("Apply", key="bulk_rule_apply", on_click=apply_bulk_rule)
         
-        div[data-testid="stSelectbox"] select {
-            width: 100px !important;
-            padding: 6px 8px !important;
-            font-size: 13px !important;
-            font-family: 'Gilroy', sans-serif !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+        if "bulk_rule_matched" in st.session_state:
+            st.caption(f"Last rule updated {st.session_state['bulk_rule_matched']} keys.")
+
+
+def render_bid_configuration_form(stats, upload_id):
+    """Render the bid configuration grid for every key in the upload."""
+    from bid_model import CONSTRAINT_LABELS
     
     # Section header
     st.markdown("""
@@ -374,79 +398,32 @@ def render_bid_configuration_form(unique_keys):
         </div>
     """, unsafe_allow_html=True)
     
-    # Table header
-    st.markdown("""
-        <div style="
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 12px 16px;
-            background-color: #F9FAFB;
-            border-bottom: 1px solid #E5E7EB;
-            font-family: 'Gilroy', sans-serif;
-            font-weight: 600;
-            font-size: 13px;
-            color: #1F2937;
-            margin-bottom: 8px;
-        ">
-            <div style="flex: 2;">Campaign Name</div>
-            <div style="flex: 1; text-align: center;">*Min Bid</div>
-            <div style="flex: 1; text-align: center;">*Max Bid</div>
-            <div style="flex: 1.5; text-align: center;">Bid Adjustment Volatility</div>
-            <div style="flex: 1; text-align: center;">ROAS Target</div>
-        </div>
-    """, unsafe_allow_html=True)
+    constraints = get_constraint_frame(stats, upload_id)
     
-    # Table rows for each unique key
-    for idx, key in enumerate(unique_keys[:10]):  # Show first 10 for now
-        col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1.5, 1])
-        
-        with col1:
-            st.markdown(f"""
-                <div style="
-                    font-family: 'Gilroy', sans-serif;
-                    font-size: 13px;
-                    color: #1F2937;
-                    padding: 4px 0;
-                    margin: 0;
-                    line-height: 1.2;
-                ">
-                    {key}
-                </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.text_input(
-                "Min Bid",
-                value="0.30",
-                key=f"min_bid_{idx}",
-                label_visibility="collapsed"
-            )
-        
-        with col3:
-            st.text_input(
-                "Max Bid",
-                value="0.50",
-                key=f"max_bid_{idx}",
-                label_visibility="collapsed"
-            )
-        
-        with col4:
-            st.selectbox(
-                "Volatility",
-                ["5%", "10%", "15%", "20%"],
-                index=0,
-                key=f"volatility_{idx}",
-                label_visibility="collapsed"
-            )
-        
-        with col5:
-            st.text_input(
-                "ROAS Target",
-                value="2.50",
-                key=f"roas_{idx}",
-                label_visibility="collapsed"
-            )
+    render_bulk_rule_form(constraints)
+    
+    # One grid for all keys - the whole constraint set round-trips as one DataFrame
+    edited = st.data_editor(
+        constraints,
+        key="bid_constraints_editor",
+        hide_index=True,
+        use_container_width=True,
+        num_rows="fixed",
+        disabled=["key", "campaign_name"],
+        column_config={
+            "key": st.column_config.TextColumn("Keyword"),
+            "campaign_name": st.column_config.TextColumn("Campaign Name"),
+            "min_bid": st.column_config.NumberColumn(CONSTRAINT_LABELS["min_bid"], min_value=0.0, step=0.01, format="%.2f"),
+            "max_bid": st.column_config.NumberColumn(CONSTRAINT_LABELS["max_bid"], min_value=0.0, step=0.01, format="%.2f"),
+            "volatility": st.column_config.NumberColumn(CONSTRAINT_LABELS["volatility"], min_value=0, max_value=100, step=5, format="%d%%"),
+            "roas_target": st.column_config.NumberColumn(CONSTRAINT_LABELS["roas_target"], min_value=0.0, step=0.05, format="%.2f")
+        }
+    )
+    st.session_state["bid_constraints_edited"] = edited
+    
+    invalid = int((edited["min_bid"] > edited["max_bid"]).sum())
+    if invalid:
+        st.warning(f"{invalid} keys have a Min Bid above their Max Bid.")
     
     # Save button - purple and right-aligned
     st.markdown("<div style='margin-top: 24px;'></div>", unsafe_allow_html=True)
@@ -454,26 +431,32 @@ def render_bid_configuration_form(unique_keys):
     col1, col2, col3 = st.columns([3, 1.5, 1])
     
     with col3:
-        st.markdown("""
-            <style>
-            /* Style the Save button to be purple and compact */
-            .stButton > button {
-                background-color: #8400FF !important;
-                color: white !important;
-                border: none !important;
-                border-radius: 6px !important;
-                padding: 8px 16px !important;
-                font-family: 'Gilroy', sans-serif !important;
-                font-weight: 500 !important;
-                font-size: 13px !important;
-                width: auto !important;
-                white-space: nowrap !important;
-            }
-            .stButton > button:hover {
-                background-color: #6B00CC !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-        
-        if st.button("💾 Save Data & Run Model"):
-            st.success("Data saved and model started!")
+        if st.button("💾 Save Data & Run Model", disabled=bool(invalid)):
+            run_bid_model(stats, edited)
+
+
+def run_bid_model(stats, constraints):
+    """
+    Run the bid model on the uploaded data and save the constraints and output.
+    
+    Only keywords whose stats or constraints changed since the retailer's
+    previous run are re-optimized; the rest are carried forward.
+    """
+    from bid_model import run_model
+    from run_store import save_constraints, load_latest_run, save_run
+    
+    retailer = st.session_state.get("retailer_select")
+    
+    try:
+        version = save_constraints(retailer, constraints)
+        results, summary = run_model(stats, constraints, load_latest_run(retailer))
+        run_id = save_run(retailer, results, summary, constraints_version=version)
+    except Exception as e:
+        st.error(f"Model run failed: {str(e)}")
+        return
+    
+    st.success(
+        f"Data saved and model started! {summary['reoptimized']} of {summary['keywords']} "
+        f"keywords re-optimized, {summary['carried_forward']} carried forward from the previous run "
+        f"(run {run_id})."
+    )